@@ -5,17 +5,91 @@ This module implements various sorting algorithms, both comparison-based and non
 with detailed analysis of their performance characteristics and use cases.
 """
 
-from typing import List, TypeVar, Callable, Any
+from typing import List, TypeVar, Callable, Any, Optional
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice, repeat
 import heapq
+import operator
+import os
 import random
 import time
 
+try:
+    import numpy as np  # Optional: threaded np.sort for numeric input
+except ImportError:
+    np = None
+
 T = TypeVar("T")
 
+# Element types that the compiled built-in sort handles as plain numbers
+_NUMERIC_TYPES = (int, float)
+
+# Below this size parallel_merge_sort sorts serially (pool start-up dominates)
+PARALLEL_MIN_SIZE = 100_000
+
 
 class SortingAlgorithms:
     """Collection of sorting algorithms with performance analysis."""
 
+    @staticmethod
+    def _is_numeric(arr: List[Any]) -> bool:
+        """Check if all elements are plain ints or floats (mixing allowed)."""
+        if not arr:
+            return False
+        # Cheap probe on the first element rejects object lists immediately
+        if type(arr[0]) not in _NUMERIC_TYPES:
+            return False
+        return all(type(x) in _NUMERIC_TYPES for x in arr)
+
+    @staticmethod
+    def _numpy_buffer(arr: List[Any]) -> Optional["np.ndarray"]:
+        """
+        Copy an all-int or all-float list into an int64/float64 array.
+
+        Returns None when numpy is unavailable, the list is empty, mixes
+        element types, or holds ints outside the int64 range.
+        """
+        # Kept identical to DivideConquerSorting._numpy_buffer in chapter 13
+        if np is None or not arr or type(arr[0]) not in _NUMERIC_TYPES:
+            return None
+        first_type = type(arr[0])
+        if not all(type(x) is first_type for x in arr):
+            return None
+
+        try:
+            return np.array(arr, dtype=np.int64 if first_type is int else np.float64)
+        except OverflowError:
+            return None
+
+    @staticmethod
+    def _handle_presorted(arr: List[T]) -> bool:
+        """
+        Detect already-sorted or strictly descending input in one pass.
+
+        Ascending input is left untouched and strictly descending input is
+        reversed in place (strictness keeps the result stable).
+
+        Returns:
+            True if arr is now sorted, False otherwise
+        """
+        n = len(arr)
+        for i in range(n - 1):
+            if arr[i] > arr[i + 1]:
+                break
+        else:
+            return True
+
+        if arr[0] > arr[-1]:
+            for i in range(n - 1):
+                if not arr[i] > arr[i + 1]:
+                    return False
+            arr.reverse()
+            return True
+
+        return False
+
     @staticmethod
     def bubble_sort(arr: List[T]) -> List[T]:
         """
@@ -36,6 +110,10 @@ class SortingAlgorithms:
             >>> SortingAlgorithms.bubble_sort([3, 1, 4, 1, 5])
             [1, 1, 3, 4, 5]
         """
+        # Already sorted or strictly reversed input costs a single pass
+        if SortingAlgorithms._handle_presorted(arr):
+            return arr
+
         n = len(arr)
         for i in range(n):
             # Last i elements are already sorted
@@ -69,6 +147,10 @@ class SortingAlgorithms:
             >>> SortingAlgorithms.insertion_sort([3, 1, 4, 1, 5])
             [1, 1, 3, 4, 5]
         """
+        # Already sorted or strictly reversed input costs a single pass
+        if SortingAlgorithms._handle_presorted(arr):
+            return arr
+
         for i in range(1, len(arr)):
             key = arr[i]
             j = i - 1
@@ -84,10 +166,10 @@ class SortingAlgorithms:
         """
         Selection sort: find minimum and place in correct position.
 
-        Time: O(n²) always
+        Time: O(n²) worst/average, O(n) for sorted or reversed input
         Space: O(1)
         Stable: No
-        Adaptive: No
+        Adaptive: Only for sorted or reversed input
 
         Args:
             arr: List to sort
@@ -99,6 +181,10 @@ class SortingAlgorithms:
             >>> SortingAlgorithms.selection_sort([3, 1, 4, 1, 5])
             [1, 1, 3, 4, 5]
         """
+        # Already sorted or strictly reversed input costs a single pass
+        if SortingAlgorithms._handle_presorted(arr):
+            return arr
+
         n = len(arr)
         for i in range(n):
             # Find minimum element in unsorted portion
@@ -115,6 +201,9 @@ class SortingAlgorithms:
         """
         Quick sort: partition around pivot, recursively sort partitions.
 
+        Uses a median-of-three pivot and finishes ranges of 16 or fewer
+        elements with insertion sort. Numeric lists use the built-in sort.
+
         Time: O(n²) worst, O(n log n) average/best
         Space: O(log n) average (recursion stack)
         Stable: No
@@ -130,17 +219,44 @@ class SortingAlgorithms:
             >>> SortingAlgorithms.quick_sort([3, 1, 4, 1, 5])
             [1, 1, 3, 4, 5]
         """
+        # Numeric input: use the compiled C sort
+        if SortingAlgorithms._is_numeric(arr):
+            arr.sort()
+            return arr
+
+        INSERTION_CUTOFF = 16
 
         def _quick_sort_helper(low: int, high: int) -> None:
-            if low < high:
-                # Partition and get pivot index
-                pivot_idx = _partition(low, high)
-                # Recursively sort left and right partitions
-                _quick_sort_helper(low, pivot_idx - 1)
-                _quick_sort_helper(pivot_idx + 1, high)
+            if high - low < INSERTION_CUTOFF:
+                # Small ranges: insertion sort beats further partitioning
+                _insertion_sort_range(low, high)
+                return
+            # Partition and get pivot index
+            pivot_idx = _partition(low, high)
+            # Recursively sort left and right partitions
+            _quick_sort_helper(low, pivot_idx - 1)
+            _quick_sort_helper(pivot_idx + 1, high)
+
+        def _insertion_sort_range(low: int, high: int) -> None:
+            for i in range(low + 1, high + 1):
+                key = arr[i]
+                j = i - 1
+                while j >= low and arr[j] > key:
+                    arr[j + 1] = arr[j]
+                    j -= 1
+                arr[j + 1] = key
 
         def _partition(low: int, high: int) -> int:
-            # Choose rightmost element as pivot
+            # Median-of-three: order low/mid/high, then use the median as pivot
+            mid = (low + high) // 2
+            if arr[mid] < arr[low]:
+                arr[low], arr[mid] = arr[mid], arr[low]
+            if arr[high] < arr[low]:
+                arr[low], arr[high] = arr[high], arr[low]
+            if arr[high] < arr[mid]:
+                arr[mid], arr[high] = arr[high], arr[mid]
+            arr[mid], arr[high] = arr[high], arr[mid]
+
             pivot = arr[high]
             i = low - 1
 
@@ -178,6 +294,10 @@ class SortingAlgorithms:
         if len(arr) <= 1:
             return arr.copy()
 
+        # Numeric input: use the compiled (stable) C sort
+        if SortingAlgorithms._is_numeric(arr):
+            return sorted(arr)
+
         # Split array into two halves
         mid = len(arr) // 2
         left = SortingAlgorithms.merge_sort(arr[:mid])
@@ -185,9 +305,74 @@ class SortingAlgorithms:
 
         return SortingAlgorithms._merge(left, right)
 
+    @staticmethod
+    def parallel_merge_sort(
+        arr: List[T], workers: int = None, min_size: int = PARALLEL_MIN_SIZE
+    ) -> List[T]:
+        """
+        Parallel merge sort: sort one chunk per worker, then k-way merge.
+
+        All-int or all-float lists are copied into a NumPy array whose
+        chunks are sorted by np.sort on threads (it releases the GIL).
+        Otherwise the list is split into one contiguous chunk per worker,
+        each chunk is merge-sorted in a separate process (threads would
+        serialize on the GIL), and the sorted chunks are combined with
+        heapq.merge, which keeps ties in chunk order so the sort stays
+        stable.
+
+        Elements must be picklable. Inputs shorter than min_size fall back
+        to merge_sort, where pool start-up would cost more than it saves.
+
+        Time: O(n log n / k + n log k) for k workers
+        Space: O(n)
+        Stable: Yes
+        Adaptive: No
+
+        Args:
+            arr: List to sort
+            workers: Number of workers (default: CPU count, max 4)
+            min_size: Smallest input that is sorted in parallel
+
+        Returns:
+            Sorted list (creates new list)
+
+        Examples:
+            >>> SortingAlgorithms.parallel_merge_sort([3, 1, 4, 1, 5])
+            [1, 1, 3, 4, 5]
+        """
+        if workers is None:
+            workers = min(os.cpu_count() or 1, 4)
+        if len(arr) < max(min_size, 2) or workers < 2:
+            return SortingAlgorithms.merge_sort(arr)
+
+        buf = SortingAlgorithms._numpy_buffer(arr)
+        if buf is not None:
+            chunks = np.array_split(buf, workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                sorted_chunks = list(
+                    executor.map(partial(np.sort, kind="stable"), chunks)
+                )
+            # np.sort's stable kind is timsort for int64/float64: it finds
+            # the k presorted runs, so one C call does the k-way merge
+            return np.sort(np.concatenate(sorted_chunks), kind="stable").tolist()
+
+        chunk_size = -(-len(arr) // workers)  # Ceiling division
+        chunks = [arr[i : i + chunk_size] for i in range(0, len(arr), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            sorted_chunks = list(executor.map(SortingAlgorithms.merge_sort, chunks))
+
+        return list(heapq.merge(*sorted_chunks))
+
     @staticmethod
     def _merge(left: List[T], right: List[T]) -> List[T]:
         """Merge two sorted lists into one sorted list."""
+        # Runs that are already in order need no element-wise merge
+        if not left or not right or left[-1] <= right[0]:
+            return left + right
+        if right[-1] < left[0]:
+            return right + left
+
         result = []
         i = j = 0
 
@@ -209,10 +394,12 @@ class SortingAlgorithms:
     @staticmethod
     def heap_sort(arr: List[T]) -> List[T]:
         """
-        Heap sort: build max-heap, repeatedly extract maximum.
+        Heap sort: build min-heap, repeatedly extract minimum.
+
+        Uses the C-implemented heapq module for heapify and extraction.
 
         Time: O(n log n) always
-        Space: O(1) auxiliary
+        Space: O(n) auxiliary (extracted output)
         Stable: No
         Adaptive: No
 
@@ -226,39 +413,21 @@ class SortingAlgorithms:
             >>> SortingAlgorithms.heap_sort([3, 1, 4, 1, 5])
             [1, 1, 3, 4, 5]
         """
-        n = len(arr)
+        # Numeric input: use the compiled C sort
+        if SortingAlgorithms._is_numeric(arr):
+            arr.sort()
+            return arr
 
-        # Build max heap
-        for i in range(n // 2 - 1, -1, -1):
-            SortingAlgorithms._heapify(arr, n, i)
+        # Build min heap in O(n)
+        heapq.heapify(arr)
 
-        # Extract elements one by one
-        for i in range(n - 1, 0, -1):
-            # Swap root (maximum) with last element
-            arr[i], arr[0] = arr[0], arr[i]
-            # Heapify reduced heap
-            SortingAlgorithms._heapify(arr, i, 0)
+        # Extract elements one by one in ascending order; heappop's sift-down
+        # runs in C, so bind it once instead of resolving it per element
+        heappop = heapq.heappop
+        arr[:] = [heappop(arr) for _ in range(len(arr))]
 
         return arr
 
-    @staticmethod
-    def _heapify(arr: List[T], n: int, i: int) -> None:
-        """Heapify subtree rooted at index i."""
-        largest = i
-        left = 2 * i + 1
-        right = 2 * i + 2
-
-        # Find largest among root, left child, right child
-        if left < n and arr[left] > arr[largest]:
-            largest = left
-        if right < n and arr[right] > arr[largest]:
-            largest = right
-
-        # If largest is not root, swap and continue heapifying
-        if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
-            SortingAlgorithms._heapify(arr, n, largest)
-
     @staticmethod
     def counting_sort(arr: List[int], max_val: int = None) -> List[int]:
         """
@@ -289,16 +458,12 @@ class SortingAlgorithms:
         # Initialize count array
         count = [0] * (max_val + 1)
 
-        # Count occurrences
-        for num in arr:
-            count[num] += 1
-
-        # Reconstruct sorted array
-        result = []
-        for i in range(len(count)):
-            result.extend([i] * count[i])
+        # Count occurrences (Counter tallies in C; loop over distinct values)
+        for num, occurrences in Counter(arr).items():
+            count[num] = occurrences
 
-        return result
+        # Reconstruct sorted array by repeating each value count times
+        return list(chain.from_iterable(map(repeat, range(max_val + 1), count)))
 
     @staticmethod
     def radix_sort(arr: List[int]) -> List[int]:
@@ -335,8 +500,8 @@ class SortingAlgorithms:
             digits += 1
             temp //= 10
 
-        # Perform counting sort for each digit
-        result = arr.copy()
+        # Perform counting sort for each digit (each pass builds a new list)
+        result = arr
         for digit in range(digits):
             result = SortingAlgorithms._counting_sort_by_digit(result, digit)
 
@@ -344,27 +509,16 @@ class SortingAlgorithms:
 
     @staticmethod
     def _counting_sort_by_digit(arr: List[int], digit: int) -> List[int]:
-        """Helper for radix sort - sort by specific digit."""
-        n = len(arr)
-        output = [0] * n
-        count = [0] * 10  # 0-9 digits
+        """Helper for radix sort - stable distribution by specific digit."""
+        buckets = [[] for _ in range(10)]  # 0-9 digits
+        divisor = 10**digit
 
-        # Count occurrences of each digit
+        # Distribute in input order (appending keeps the pass stable)
         for num in arr:
-            digit_value = (num // (10**digit)) % 10
-            count[digit_value] += 1
-
-        # Compute cumulative count
-        for i in range(1, 10):
-            count[i] += count[i - 1]
+            buckets[(num // divisor) % 10].append(num)
 
-        # Build output array
-        for i in range(n - 1, -1, -1):  # Stable sort
-            digit_value = (arr[i] // (10**digit)) % 10
-            output[count[digit_value] - 1] = arr[i]
-            count[digit_value] -= 1
-
-        return output
+        # Concatenate buckets in digit order
+        return list(chain.from_iterable(buckets))
 
     @staticmethod
     def bucket_sort(arr: List[float], bucket_count: int = 10) -> List[float]:
@@ -400,14 +554,11 @@ class SortingAlgorithms:
                 bucket_idx -= 1
             buckets[bucket_idx].append(num)
 
-        # Sort individual buckets and concatenate
-        result = []
+        # Sort individual buckets with the built-in (stable) sort and concatenate
         for bucket in buckets:
-            # Use insertion sort for small buckets
-            SortingAlgorithms.insertion_sort(bucket)
-            result.extend(bucket)
+            bucket.sort()
 
-        return result
+        return list(chain.from_iterable(buckets))
 
     @staticmethod
     def timsort_like_sort(arr: List[T]) -> List[T]:
@@ -440,9 +591,17 @@ class SortingAlgorithms:
 
         def merge_sublists(start: int, mid: int, end: int) -> None:
             """Merge two sorted sublists."""
+            # Runs that are already in order need no element-wise merge
+            if arr[mid] <= arr[mid + 1]:
+                return
+
             left = arr[start : mid + 1]
             right = arr[mid + 1 : end + 1]
 
+            if right[-1] < left[0]:
+                arr[start : end + 1] = right + left
+                return
+
             i = j = 0
             k = start
 
@@ -492,35 +651,38 @@ class SortingAnalysis:
 
     @staticmethod
     def time_sorting_algorithm(
-        sort_func: Callable, arr: List[T], *args, **kwargs
+        sort_func: Callable, arr: List[T], *args, copy: bool = False, **kwargs
     ) -> tuple:
         """
         Time a sorting algorithm execution.
 
+        The array is sorted as given, so callers should pass a throwaway
+        copy (e.g. ``arr.copy()``) when the original must be preserved.
+
         Args:
             sort_func: Sorting function to time
-            arr: Array to sort
+            arr: Array to sort (may be modified in place)
             *args, **kwargs: Additional arguments for sort function
+            copy: If True, sort a copy of arr made before the timer starts
 
         Returns:
             Tuple of (sorted_array, execution_time)
         """
-        arr_copy = arr.copy()
-        start_time = time.time()
+        if copy:
+            arr = arr.copy()
+        start_time = time.perf_counter()
         if args or kwargs:
-            result = sort_func(arr_copy, *args, **kwargs)
+            result = sort_func(arr, *args, **kwargs)
         else:
-            result = sort_func(arr_copy)
-        end_time = time.time()
+            result = sort_func(arr)
+        end_time = time.perf_counter()
         return result, end_time - start_time
 
     @staticmethod
     def is_sorted(arr: List[T]) -> bool:
         """Check if array is sorted in ascending order."""
-        for i in range(1, len(arr)):
-            if arr[i] < arr[i - 1]:
-                return False
-        return True
+        # Pairwise arr[i] < arr[i - 1] check driven by C-level iterators
+        return not any(map(operator.lt, islice(arr, 1, None), arr))
 
     @staticmethod
     def is_stable_sort(
@@ -550,7 +712,7 @@ class SortingAnalysis:
             Generated array
         """
         if distribution == "random":
-            return [random.randint(0, size * 10) for _ in range(size)]
+            return random.choices(range(size * 10 + 1), k=size)
         elif distribution == "sorted":
             return list(range(size))
         elif distribution == "reverse":
@@ -75,6 +75,15 @@ class TestSortingAlgorithms(unittest.TestCase):
         self._test_sorting_algorithm(SortingAlgorithms.selection_sort, self.single_element, [42])
         self._test_sorting_algorithm(SortingAlgorithms.selection_sort, self.two_elements, self.sorted_two)
 
+    def test_presorted_inputs(self):
+        """Test adaptive pre-scan on sorted and reversed inputs."""
+        for sort_func in [SortingAlgorithms.bubble_sort, SortingAlgorithms.insertion_sort,
+                          SortingAlgorithms.selection_sort]:
+            self._test_sorting_algorithm(sort_func, [1, 2, 2, 3], [1, 2, 2, 3])
+            self._test_sorting_algorithm(sort_func, [4, 3, 2, 1], [1, 2, 3, 4])
+            # Non-strictly descending input takes the regular path
+            self._test_sorting_algorithm(sort_func, [4, 3, 3, 1], [1, 3, 3, 4])
+
     def test_quick_sort(self):
         """Test quick sort."""
         self._test_sorting_algorithm(SortingAlgorithms.quick_sort, self.small_array, self.sorted_small)
@@ -200,6 +209,42 @@ class TestSortingAlgorithms(unittest.TestCase):
         result = SortingAlgorithms.heap_sort(large_array.copy())
         self.assertEqual(result, expected)
 
+        # Non-numeric data exercises the pure-Python partitioning path
+        words = [str(x) for x in large_array]
+        self.assertEqual(SortingAlgorithms.quick_sort(words.copy()), sorted(words))
+
+    def test_numeric_fast_path(self):
+        """Test numeric fast path and pure-Python fallback agree."""
+        floats = [0.5, -1.25, 3.0, 0.5, 2.75]
+        mixed = [3, 0.5, -2, 2.25, 3]
+        strings = ["pear", "apple", "fig", "apple"]
+
+        for sort_func in [SortingAlgorithms.quick_sort, SortingAlgorithms.merge_sort,
+                          SortingAlgorithms.heap_sort]:
+            self.assertEqual(sort_func(floats.copy()), sorted(floats))
+            self.assertEqual(sort_func(mixed.copy()), sorted(mixed))
+            self.assertEqual(sort_func(strings.copy()), sorted(strings))
+
+    def test_parallel_merge_sort(self):
+        """Test parallel merge sort on both the serial and parallel paths."""
+        words = [str(x) for x in SortingAnalysis.generate_test_data(500, "random")]
+
+        # Small input: serial fallback
+        self.assertEqual(SortingAlgorithms.parallel_merge_sort(words), sorted(words))
+
+        # Force the process pool on a small input
+        result = SortingAlgorithms.parallel_merge_sort(words, workers=2, min_size=0)
+        self.assertEqual(result, sorted(words))
+        self.assertEqual(SortingAlgorithms.parallel_merge_sort([], workers=2, min_size=0), [])
+
+        # Numeric input takes the threaded np.sort path when numpy is installed
+        ints = SortingAnalysis.generate_test_data(500, "random")
+        floats = [x / 7 for x in ints]
+        for arr in (ints, floats):
+            result = SortingAlgorithms.parallel_merge_sort(arr, workers=3, min_size=0)
+            self.assertEqual(result, sorted(arr))
+            self.assertIs(type(result[0]), type(arr[0]))
+
     def test_different_distributions(self):
         """Test sorting with different data distributions."""
         size = 100
@@ -5,14 +5,268 @@ This module implements divide and conquer sorting algorithms: mergesort and quic
 demonstrating how these algorithms achieve O(n log n) performance through recursive decomposition.
 """
 
-from typing import List, TypeVar, Callable
+from typing import List, Tuple, TypeVar, Callable, Any, Optional
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice
+import heapq
+import operator
+import os
 import time
 
+try:
+    import numpy as np  # Optional: vectorised partitioning for numeric input
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # Optional: JIT-compiled partition/insertion loops
+except ImportError:
+    njit = None
+
 T = TypeVar("T")
 
+# _NUMERIC_TYPES, PARALLEL_MIN_SIZE, DivideConquerSorting._is_numeric and
+# DivideConquerSorting._numpy_buffer are copies of the chapter 12 definitions
+# in sorting_algorithms.py; change both copies together
+
+# Element types that the compiled built-in sort handles as plain numbers
+_NUMERIC_TYPES = (int, float)
+
+# Below this size parallel_mergesort sorts serially (pool start-up dominates)
+PARALLEL_MIN_SIZE = 100_000
+
+# Mergesort: ranges this small are insertion-sorted instead of split
+_MERGESORT_INSERTION_CUTOFF = 32
+
+# Timsort: runs shorter than this are extended by insertion sort
+_TIMSORT_MIN_RUN = 32
+
+# Timsort: consecutive wins by one side before a merge switches to galloping
+_MIN_GALLOP = 7
+
+# Ranges this small are finished by insertion sort in the JIT kernels
+_JIT_INSERTION_CUTOFF = 16
+
+# Numeric lists this long are sorted with np.sort rather than sorted(); below
+# it the array round trip costs more than the faster sort saves
+_NUMPY_SORT_MIN_SIZE = 4096
+
+# quicksort_numpy: ranges this small are finished by one ndarray.sort call,
+# which is cheaper than another round of mask partitioning
+_NUMPY_SORT_CUTOFF = 64
+
+if njit is not None:
+    # Kernels over a contiguous int64 buffer; loop indices stay in registers
+    # instead of being boxed Python ints
+
+    @njit(cache=True, boundscheck=False)
+    def _partition_nb(buf, low, high):
+        pivot = buf[high]
+        i = low - 1
+        for j in range(low, high):
+            if buf[j] <= pivot:
+                i += 1
+                buf[i], buf[j] = buf[j], buf[i]
+        buf[i + 1], buf[high] = buf[high], buf[i + 1]
+        return i + 1
+
+    @njit(cache=True, boundscheck=False)
+    def _insertion_nb(buf, low, high):
+        for i in range(low + 1, high + 1):
+            key = buf[i]
+            j = i - 1
+            while j >= low and buf[j] > key:
+                buf[j + 1] = buf[j]
+                j -= 1
+            buf[j + 1] = key
+
+    @njit(cache=True, boundscheck=False)
+    def _quicksort_nb(buf, low, high):
+        # Recurse into the smaller side and loop on the larger one so the
+        # native stack stays O(log n) deep
+        while high - low > _JIT_INSERTION_CUTOFF:
+            p = _partition_nb(buf, low, high)
+            if p - low < high - p:
+                _quicksort_nb(buf, low, p - 1)
+                low = p + 1
+            else:
+                _quicksort_nb(buf, p + 1, high)
+                high = p - 1
+        _insertion_nb(buf, low, high)
+
+    @njit(cache=True, boundscheck=False)
+    def _merge_nb(src, dst, lo, mid, hi):
+        i, j, k = lo, mid, lo
+        while i < mid and j < hi:
+            if src[i] <= src[j]:
+                dst[k] = src[i]
+                i += 1
+            else:
+                dst[k] = src[j]
+                j += 1
+            k += 1
+        while i < mid:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+        while j < hi:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+
+    @njit(cache=True, boundscheck=False)
+    def _mergesort_nb(buf):
+        # Bottom-up passes ping-ponging between buf and one scratch array;
+        # returns whichever array holds the sorted result
+        n = len(buf)
+        src, dst = buf, np.empty_like(buf)
+        width = 1
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                _merge_nb(src, dst, lo, mid, hi)
+            src, dst = dst, src
+            width *= 2
+        return src
+
+else:
+    _partition_nb = _insertion_nb = _quicksort_nb = None
+    _merge_nb = _mergesort_nb = None
+
+
+# Hot helpers are plain module-level functions: direct calls skip the class
+# attribute lookup, and tracing JITs such as PyPy can inline them. The
+# class re-exports them as static methods.
+
+
+def _insertion_sort_range(arr: List[T], low: int, high: int) -> None:
+    """Insertion sort for a subarray."""
+    for i in range(low + 1, high + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= low and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _merge(left: List[T], right: List[T]) -> List[T]:
+    """Merge two sorted lists into one sorted list."""
+    n, m = len(left), len(right)
+    result = [None] * (n + m)  # Preallocated: no append-driven resizes
+    i = j = k = 0
+
+    # Merge while both lists have elements
+    while i < n and j < m:
+        if left[i] <= right[j]:
+            result[k] = left[i]
+            i += 1
+        else:
+            result[k] = right[j]
+            j += 1
+        k += 1
+
+    # Copy remaining elements with a single slice assignment
+    if i < n:
+        result[k:] = left[i:]
+    else:
+        result[k:] = right[j:]
+
+    return result
+
+
+def _partition(arr: List[T], low: int, high: int) -> int:
+    """Partition array around pivot using Lomuto scheme."""
+    # Choose rightmost element as pivot
+    pivot = arr[high]
+    i = low - 1
+
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+
+def _partition_3way(arr: List[T], low: int, high: int) -> Tuple[int, int]:
+    """
+    Dutch National Flag partition around arr[low].
+
+    Returns:
+        (lt, gt) such that arr[lt:gt + 1] all equal the pivot, with
+        smaller keys before lt and larger keys after gt
+    """
+    pivot = arr[low]
+    lt, i, gt = low, low + 1, high
+
+    while i <= gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < arr[i]:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+
+    return lt, gt
+
+
+def _quicksort_helper(arr: List[T], low: int, high: int) -> None:
+    """
+    Quicksort helper: recurse on the smaller partition, loop on the larger.
+
+    Bounds the recursion depth to O(log n) even when partitions are
+    maximally unbalanced (e.g. already-sorted input). Keys equal to the
+    pivot are grouped by a 3-way partition and never revisited.
+    """
+    while low < high:
+        # Partition into < pivot, == pivot (arr[lt..gt]) and > pivot
+        lt, gt = _partition_3way(arr, low, high)
+
+        if lt - low < high - gt:
+            _quicksort_helper(arr, low, lt - 1)
+            low = gt + 1
+        else:
+            _quicksort_helper(arr, gt + 1, high)
+            high = lt - 1
+
 
 class DivideConquerSorting:
-    """Implementation of divide and conquer sorting algorithms."""
+    """
+    Implementation of divide and conquer sorting algorithms.
+
+    The copying sorts accept any sequence, including packed
+    array.array('i') buffers, and always return a new list.
+    """
+
+    @staticmethod
+    def _is_numeric(arr: List[Any]) -> bool:
+        """Check if all elements are plain ints or floats (mixing allowed)."""
+        # Kept identical to SortingAlgorithms._is_numeric in chapter 12
+        if not arr:
+            return False
+        # Cheap probe on the first element rejects object lists immediately
+        if type(arr[0]) not in _NUMERIC_TYPES:
+            return False
+        return all(type(x) in _NUMERIC_TYPES for x in arr)
+
+    @staticmethod
+    def _sort_numeric(arr: List[Any]) -> List[Any]:
+        """Sort a list that passed _is_numeric with np.sort or sorted()."""
+        if len(arr) >= _NUMPY_SORT_MIN_SIZE:
+            buf = DivideConquerSorting._numpy_buffer(arr)
+            if buf is not None:
+                buf.sort()
+                return buf.tolist()
+        # Mixed int/float lists, ints beyond int64, short lists, no numpy
+        return sorted(arr)
 
     @staticmethod
     def mergesort(arr: List[T]) -> List[T]:
@@ -34,8 +288,11 @@ class DivideConquerSorting:
             >>> DivideConquerSorting.mergesort([3, 1, 4, 1, 5])
             [1, 1, 3, 4, 5]
         """
-        if len(arr) <= 1:
-            return arr.copy()
+        # Small inputs: insertion sort beats further splitting and merging
+        if len(arr) <= _MERGESORT_INSERTION_CUTOFF:
+            result = list(arr)
+            _insertion_sort_range(result, 0, len(result) - 1)
+            return result
 
         # Divide: Split array into two halves
         mid = len(arr) // 2
@@ -43,36 +300,17 @@ class DivideConquerSorting:
         right = DivideConquerSorting.mergesort(arr[mid:])
 
         # Conquer: Merge the sorted halves
-        return DivideConquerSorting._merge(left, right)
-
-    @staticmethod
-    def _merge(left: List[T], right: List[T]) -> List[T]:
-        """Merge two sorted lists into one sorted list."""
-        result = []
-        i = j = 0
-
-        # Merge while both lists have elements
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
+        return _merge(left, right)
 
-        # Add remaining elements
-        result.extend(left[i:])
-        result.extend(right[j:])
-
-        return result
+    _merge = staticmethod(_merge)
 
     @staticmethod
     def mergesort_inplace(arr: List[T]) -> None:
         """
-        In-place mergesort using indices instead of new arrays.
+        In-place bottom-up mergesort using indices instead of new arrays.
 
         Time: O(n log n)
-        Space: O(n) - still needs temporary space for merging
+        Space: O(n) - one scratch list reused by every merge pass
         Stable: Yes
 
         Args:
@@ -84,46 +322,259 @@ class DivideConquerSorting:
             >>> arr
             [1, 1, 3, 4, 5]
         """
-
-        def _mergesort_helper(start: int, end: int) -> None:
-            if end - start <= 1:
+        # Integer input with numba available: merge native int64 buffers
+        if _mergesort_nb is not None and arr and all(type(x) is int for x in arr):
+            try:
+                buf = np.asarray(arr, dtype=np.int64)
+            except OverflowError:
+                pass  # Values outside int64 take the pure-Python path
+            else:
+                arr[:] = _mergesort_nb(buf).tolist()
                 return
 
-            mid = (start + end) // 2
-            _mergesort_helper(start, mid)
-            _mergesort_helper(mid, end)
-            _merge_inplace(start, mid, end)
-
-        def _merge_inplace(start: int, mid: int, end: int) -> None:
-            # Create temporary arrays
-            left = arr[start:mid]
-            right = arr[mid:end]
-
-            i = j = 0
-            k = start
-
-            # Merge back into original array
-            while i < len(left) and j < len(right):
-                if left[i] <= right[j]:
-                    arr[k] = left[i]
-                    i += 1
-                else:
-                    arr[k] = right[j]
-                    j += 1
-                k += 1
+        n = len(arr)
+        src, dst = arr, [None] * n
 
-            # Copy remaining elements
-            while i < len(left):
-                arr[k] = left[i]
+        # Insertion-sort blocks of the cutoff size to seed the first pass
+        width = _MERGESORT_INSERTION_CUTOFF
+        for lo in range(0, n, width):
+            _insertion_sort_range(arr, lo, min(lo + width, n) - 1)
+
+        # Bottom-up passes: merge adjacent runs of width 32, 64, ... from
+        # src into dst, then swap roles (no recursion, no per-merge slices)
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                DivideConquerSorting._merge_into(src, dst, lo, mid, hi)
+            src, dst = dst, src
+            width *= 2
+
+        # After an odd number of passes the sorted data is in the scratch list
+        if src is not arr:
+            arr[:] = src
+
+    @staticmethod
+    def _merge_into(
+        src: List[T], dst: List[T], lo: int, mid: int, hi: int
+    ) -> None:
+        """Merge sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi]."""
+        i, j, k = lo, mid, lo
+
+        while i < mid and j < hi:
+            if src[i] <= src[j]:
+                dst[k] = src[i]
                 i += 1
-                k += 1
+            else:
+                dst[k] = src[j]
+                j += 1
+            k += 1
+
+        # Copy whichever run is left over
+        if i < mid:
+            dst[k:hi] = src[i:mid]
+        else:
+            dst[k:hi] = src[j:hi]
+
+    @staticmethod
+    def parallel_mergesort(
+        arr: List[T], workers: int = None, min_size: int = PARALLEL_MIN_SIZE
+    ) -> List[T]:
+        """
+        Parallel mergesort: sort one chunk per worker, then k-way merge.
 
-            while j < len(right):
-                arr[k] = right[j]
+        All-int or all-float lists are copied into a NumPy array whose
+        chunks are sorted by np.sort on threads (it releases the GIL).
+        Other lists are mergesorted in worker processes, so their elements
+        must be picklable. Inputs shorter than min_size use mergesort.
+
+        Time: O(n log n / k + n log k) for k workers
+        Space: O(n)
+        Stable: Yes
+
+        Args:
+            arr: List to sort
+            workers: Number of workers (default: CPU count, max 4)
+            min_size: Smallest input that is sorted in parallel
+
+        Returns:
+            New sorted list (original unchanged)
+
+        Examples:
+            >>> DivideConquerSorting.parallel_mergesort([3, 1, 4, 1, 5])
+            [1, 1, 3, 4, 5]
+        """
+        if workers is None:
+            workers = min(os.cpu_count() or 1, 4)
+        if len(arr) < max(min_size, 2) or workers < 2:
+            return DivideConquerSorting.mergesort(arr)
+
+        buf = DivideConquerSorting._numpy_buffer(arr)
+        if buf is not None:
+            chunks = np.array_split(buf, workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                sorted_chunks = list(
+                    executor.map(partial(np.sort, kind="stable"), chunks)
+                )
+            # np.sort's stable kind is timsort for int64/float64: it finds
+            # the k presorted runs, so one C call does the k-way merge
+            return np.sort(np.concatenate(sorted_chunks), kind="stable").tolist()
+
+        chunk_size = -(-len(arr) // workers)  # Ceiling division
+        chunks = [arr[i : i + chunk_size] for i in range(0, len(arr), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            sorted_chunks = list(executor.map(DivideConquerSorting.mergesort, chunks))
+
+        # Single k-way merge in C; ties keep chunk order, so the sort is stable
+        return list(heapq.merge(*sorted_chunks))
+
+    @staticmethod
+    def timsort(arr: List[T]) -> List[T]:
+        """
+        Timsort: natural mergesort over the runs already present in the input.
+
+        Ascending runs are used as-is and strictly descending runs are
+        reversed; runs shorter than 32 are extended with insertion sort.
+        Run lengths live on a stack whose invariants keep merges balanced,
+        and merges gallop (binary search) once one side keeps winning.
+
+        Time: O(n log n) worst, O(n) on already-sorted or few-run input
+        Space: O(n) - a merge copies the left run into a temporary list
+        Stable: Yes
+        Adaptive: Yes - fewer runs means fewer merges
+
+        Args:
+            arr: List to sort
+
+        Returns:
+            New sorted list (original unchanged)
+
+        Examples:
+            >>> DivideConquerSorting.timsort([3, 1, 4, 1, 5])
+            [1, 1, 3, 4, 5]
+        """
+        result = list(arr)
+        n = len(result)
+        runs: List[Tuple[int, int]] = []  # (start, length) of pending runs
+
+        lo = 0
+        while lo < n:
+            run_end, descending = DivideConquerSorting._count_run(result, lo, n)
+            if descending:
+                result[lo:run_end] = result[lo:run_end][::-1]
+
+            # Extend short runs to min_run so merges stay balanced
+            if run_end - lo < _TIMSORT_MIN_RUN:
+                run_end = min(lo + _TIMSORT_MIN_RUN, n)
+                _insertion_sort_range(result, lo, run_end - 1)
+
+            runs.append((lo, run_end - lo))
+            DivideConquerSorting._merge_collapse(runs, result)
+            lo = run_end
+
+        # Merge whatever is left on the stack, smallest neighbours first
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+            DivideConquerSorting._merge_at(runs, i, result)
+
+        return result
+
+    @staticmethod
+    def _count_run(arr: List[T], lo: int, hi: int) -> Tuple[int, bool]:
+        """
+        Find the natural run starting at lo.
+
+        Returns:
+            (end of the run, exclusive; whether it is strictly descending)
+        """
+        run_end = lo + 1
+        if run_end == hi:
+            return run_end, False
+
+        # Descending runs must be strict so reversing them keeps stability
+        if arr[run_end] < arr[lo]:
+            run_end += 1
+            while run_end < hi and arr[run_end] < arr[run_end - 1]:
+                run_end += 1
+            return run_end, True
+
+        run_end += 1
+        while run_end < hi and not arr[run_end] < arr[run_end - 1]:
+            run_end += 1
+        return run_end, False
+
+    @staticmethod
+    def _merge_collapse(runs: List[Tuple[int, int]], arr: List[T]) -> None:
+        """
+        Merge runs on the stack until the Timsort invariants hold again.
+
+        For the top lengths ... X, Y, Z: X > Y + Z and Y > Z.
+        """
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or (
+                i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]
+            ):
+                # Merge Y with the smaller of its neighbours
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            DivideConquerSorting._merge_at(runs, i, arr)
+
+    @staticmethod
+    def _merge_at(runs: List[Tuple[int, int]], idx: int, arr: List[T]) -> None:
+        """Merge the adjacent runs runs[idx] and runs[idx + 1] in arr."""
+        start, len_a = runs[idx]
+        mid, len_b = runs[idx + 1]
+        end = mid + len_b
+        runs[idx] = (start, len_a + len_b)
+        del runs[idx + 1]
+
+        # Leading A elements <= B[0] and trailing B elements >= A[-1] are
+        # already in their final place
+        start = bisect_right(arr, arr[mid], start, mid)
+        if start == mid:
+            return
+        end = bisect_left(arr, arr[mid - 1], mid, end)
+
+        left = arr[start:mid]
+        n_left = mid - start
+        i, j, k = 0, mid, start
+        wins_left = wins_right = 0
+
+        while i < n_left and j < end:
+            if arr[j] < left[i]:
+                arr[k] = arr[j]
                 j += 1
                 k += 1
-
-        _mergesort_helper(0, len(arr))
+                wins_left = 0
+                wins_right += 1
+                if wins_right >= _MIN_GALLOP:
+                    # Gallop: move every B element smaller than left[i] at once
+                    stop = bisect_left(arr, left[i], j, end)
+                    arr[k : k + stop - j] = arr[j:stop]
+                    k += stop - j
+                    j = stop
+                    wins_right = 0
+            else:
+                arr[k] = left[i]
+                i += 1
+                k += 1
+                wins_right = 0
+                wins_left += 1
+                if wins_left >= _MIN_GALLOP and j < end:
+                    # Gallop: move every A element <= arr[j] at once
+                    stop = bisect_right(left, arr[j], i, n_left)
+                    arr[k : k + stop - i] = left[i:stop]
+                    k += stop - i
+                    i = stop
+                    wins_left = 0
+
+        # Remaining B elements are already in place; copy back the rest of A
+        arr[k : k + n_left - i] = left[i:]
 
     @staticmethod
     def quicksort(arr: List[T]) -> List[T]:
@@ -145,8 +596,12 @@ class DivideConquerSorting:
             >>> DivideConquerSorting.quicksort([3, 1, 4, 1, 5])
             [1, 1, 3, 4, 5]
         """
-        arr_copy = arr.copy()
-        DivideConquerSorting._quicksort_helper(arr_copy, 0, len(arr_copy) - 1)
+        # Numeric input: use a compiled sort
+        if DivideConquerSorting._is_numeric(arr):
+            return DivideConquerSorting._sort_numeric(arr)
+
+        arr_copy = list(arr)
+        _quicksort_helper(arr_copy, 0, len(arr_copy) - 1)
         return arr_copy
 
     @staticmethod
@@ -163,33 +618,142 @@ class DivideConquerSorting:
             >>> arr
             [1, 1, 3, 4, 5]
         """
-        DivideConquerSorting._quicksort_helper(arr, 0, len(arr) - 1)
+        # Integer input with numba available: sort a native int64 buffer
+        if _quicksort_nb is not None and arr and all(type(x) is int for x in arr):
+            try:
+                buf = np.asarray(arr, dtype=np.int64)
+            except OverflowError:
+                pass  # Values outside int64 take the pure-Python path
+            else:
+                _quicksort_nb(buf, 0, len(buf) - 1)
+                arr[:] = buf.tolist()
+                return
+
+        _quicksort_helper(arr, 0, len(arr) - 1)
+
+    _quicksort_helper = staticmethod(_quicksort_helper)
+
+    _partition = staticmethod(_partition)
 
     @staticmethod
-    def _quicksort_helper(arr: List[T], low: int, high: int) -> None:
-        """Recursive quicksort helper."""
-        if low < high:
-            # Partition and get pivot index
-            pivot_idx = DivideConquerSorting._partition(arr, low, high)
+    def _quicksort_helper_counted(
+        arr: List[T], low: int, high: int, depth: int, max_depth: List[int]
+    ) -> None:
+        """_quicksort_helper that records its deepest call level in max_depth[0]."""
+        if depth > max_depth[0]:
+            max_depth[0] = depth
+
+        while low < high:
+            lt, gt = _partition_3way(arr, low, high)
+
+            if lt - low < high - gt:
+                DivideConquerSorting._quicksort_helper_counted(
+                    arr, low, lt - 1, depth + 1, max_depth
+                )
+                low = gt + 1
+            else:
+                DivideConquerSorting._quicksort_helper_counted(
+                    arr, gt + 1, high, depth + 1, max_depth
+                )
+                high = lt - 1
 
-            # Recursively sort left and right partitions
-            DivideConquerSorting._quicksort_helper(arr, low, pivot_idx - 1)
-            DivideConquerSorting._quicksort_helper(arr, pivot_idx + 1, high)
+    _partition_3way = staticmethod(_partition_3way)
 
     @staticmethod
-    def _partition(arr: List[T], low: int, high: int) -> int:
-        """Partition array around pivot using Lomuto scheme."""
-        # Choose rightmost element as pivot
-        pivot = arr[high]
-        i = low - 1
+    def quicksort_numpy(arr: List[T]) -> List[T]:
+        """
+        Quicksort over a NumPy buffer with a branchless mask partition.
 
-        for j in range(low, high):
-            if arr[j] <= pivot:
-                i += 1
-                arr[i], arr[j] = arr[j], arr[i]
+        Each partition step splits the range three ways (<, ==, > pivot) in
+        vectorised operations instead of a Python loop; keys equal to the
+        pivot are never revisited, so duplicate-heavy input stays
+        O(n log n). Small ranges are finished by ndarray.sort. Lists that are
+        not all ints or all floats, or runs without numpy, fall back to
+        quicksort.
 
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        return i + 1
+        Args:
+            arr: List to sort
+
+        Returns:
+            New sorted list (original unchanged)
+
+        Examples:
+            >>> DivideConquerSorting.quicksort_numpy([3, 1, 4, 1, 5])
+            [1, 1, 3, 4, 5]
+        """
+        buf = DivideConquerSorting._numpy_buffer(arr)
+        if buf is None:
+            return DivideConquerSorting.quicksort(arr)
+
+        # Explicit stack of (low, high) ranges instead of recursion
+        stack = [(0, len(buf) - 1)]
+        while stack:
+            low, high = stack.pop()
+            if high - low < _NUMPY_SORT_CUTOFF:
+                buf[low : high + 1].sort()
+                continue
+            # Middle element as pivot so sorted input does not degrade
+            lt, gt = DivideConquerSorting._partition_3way_np(
+                buf, low, high, buf[(low + high) // 2]
+            )
+            # Keys equal to the pivot are final; push the larger side first
+            # so the smaller one is popped next and the stack stays shallow
+            if lt - low > high - gt:
+                stack.append((low, lt - 1))
+                stack.append((gt + 1, high))
+            else:
+                stack.append((gt + 1, high))
+                stack.append((low, lt - 1))
+
+        return buf.tolist()
+
+    @staticmethod
+    def _numpy_buffer(arr: List[Any]) -> Optional["np.ndarray"]:
+        """
+        Copy an all-int or all-float list into an int64/float64 array.
+
+        Returns None when numpy is unavailable, the list is empty, mixes
+        element types, or holds ints outside the int64 range.
+        """
+        # Kept identical to SortingAlgorithms._numpy_buffer in chapter 12
+        if np is None or not arr or type(arr[0]) not in _NUMERIC_TYPES:
+            return None
+        first_type = type(arr[0])
+        if not all(type(x) is first_type for x in arr):
+            return None
+
+        try:
+            return np.array(arr, dtype=np.int64 if first_type is int else np.float64)
+        except OverflowError:
+            return None
+
+    @staticmethod
+    def _partition_3way_np(
+        buf: "np.ndarray", low: int, high: int, pivot: Any
+    ) -> Tuple[int, int]:
+        """
+        Three-way partition of buf[low:high + 1] with boolean masks.
+
+        Returns:
+            (lt, gt) such that buf[lt:gt + 1] holds the keys equal to pivot
+        """
+        sub = buf[low : high + 1]
+        less_mask = sub < pivot
+        greater_mask = sub > pivot
+        # All three parts are gathered (copied) before writing back into
+        # buf, since sub is a view of the range being overwritten. The
+        # middle part always holds the pivot itself, so every call makes
+        # progress
+        less = sub[less_mask]
+        equal = sub[~(less_mask | greater_mask)]
+        greater = sub[greater_mask]
+
+        lt = low + len(less)
+        gt = lt + len(equal) - 1
+        buf[low:lt] = less
+        buf[lt : gt + 1] = equal
+        buf[gt + 1 : high + 1] = greater
+        return lt, gt
 
     @staticmethod
     def quicksort_median_pivot(arr: List[T]) -> List[T]:
@@ -206,7 +770,11 @@ class DivideConquerSorting:
             >>> DivideConquerSorting.quicksort_median_pivot([3, 1, 4, 1, 5])
             [1, 1, 3, 4, 5]
         """
-        arr_copy = arr.copy()
+        # Numeric input: use a compiled sort
+        if DivideConquerSorting._is_numeric(arr):
+            return DivideConquerSorting._sort_numeric(arr)
+
+        arr_copy = list(arr)
         DivideConquerSorting._quicksort_median_helper(arr_copy, 0, len(arr_copy) - 1)
         return arr_copy
 
@@ -220,7 +788,7 @@ class DivideConquerSorting:
             arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
 
             # Partition
-            pivot_idx = DivideConquerSorting._partition(arr, low, high)
+            pivot_idx = _partition(arr, low, high)
 
             # Recurse
             DivideConquerSorting._quicksort_median_helper(arr, low, pivot_idx - 1)
@@ -228,16 +796,78 @@ class DivideConquerSorting:
 
     @staticmethod
     def _choose_median_pivot(arr: List[T], low: int, high: int) -> int:
-        """Choose pivot using median of three elements."""
+        """
+        Choose pivot using median of three elements.
+
+        Ranges longer than 128 use Tukey's ninther instead: the median of
+        the medians of three evenly spaced triples.
+        """
         mid = (low + high) // 2
+        median3 = DivideConquerSorting._median3
+
+        if high - low > 128:
+            third = (high - low) // 3
+            m1 = median3(arr, low, low + third, low + 2 * third)
+            m2 = median3(arr, low + third, mid, high - third)
+            m3 = median3(arr, high - 2 * third, high - third, high)
+            return median3(arr, m1, m2, m3)
 
-        # Find median of arr[low], arr[mid], arr[high]
-        if arr[low] <= arr[mid] <= arr[high] or arr[high] <= arr[mid] <= arr[low]:
-            return mid
-        elif arr[mid] <= arr[low] <= arr[high] or arr[high] <= arr[low] <= arr[mid]:
-            return low
+        return median3(arr, low, mid, high)
+
+    @staticmethod
+    def _median3(arr: List[T], a: int, b: int, c: int) -> int:
+        """Return whichever of indices a, b, c holds the median value."""
+        if arr[a] <= arr[b] <= arr[c] or arr[c] <= arr[b] <= arr[a]:
+            return b
+        elif arr[b] <= arr[a] <= arr[c] or arr[c] <= arr[a] <= arr[b]:
+            return a
         else:
-            return high
+            return c
+
+    @staticmethod
+    def radix_sort(arr: List[int]) -> List[int]:
+        """
+        LSD radix sort for integers, one byte (base 256) per pass.
+
+        No element comparisons: each pass distributes keys into 256 buckets
+        by one byte, lowest byte first. Negative values are handled by
+        offsetting every key by the minimum. With numpy available, int64
+        input is sorted by np.sort in C instead.
+
+        Time: O(n * d) where d is the number of bytes in max - min
+        Space: O(n + 256)
+        Stable: Yes
+
+        Args:
+            arr: List of integers to sort
+
+        Returns:
+            New sorted list (original unchanged)
+
+        Examples:
+            >>> DivideConquerSorting.radix_sort([170, 45, 75, 90, 802, 24, 2, 66])
+            [2, 24, 45, 66, 75, 90, 170, 802]
+        """
+        if not arr:
+            return []
+
+        buf = DivideConquerSorting._numpy_buffer(arr)
+        if buf is not None and buf.dtype.kind == "i":
+            return np.sort(buf, kind="stable").tolist()
+
+        # Shift keys to be non-negative so bytes are taken from max - min
+        offset = min(arr)
+        keys = [x - offset for x in arr] if offset else list(arr)
+        passes = (max(keys).bit_length() + 7) // 8
+
+        for shift in range(0, 8 * passes, 8):
+            buckets = [[] for _ in range(256)]
+            # Distribute in input order (appending keeps the pass stable)
+            for key in keys:
+                buckets[(key >> shift) & 0xFF].append(key)
+            keys = list(chain.from_iterable(buckets))
+
+        return [key + offset for key in keys] if offset else keys
 
     @staticmethod
     def introsort_like(arr: List[T]) -> List[T]:
@@ -257,7 +887,11 @@ class DivideConquerSorting:
             >>> DivideConquerSorting.introsort_like([3, 1, 4, 1, 5])
             [1, 1, 3, 4, 5]
         """
-        arr_copy = arr.copy()
+        # Numeric input: use a compiled sort
+        if DivideConquerSorting._is_numeric(arr):
+            return DivideConquerSorting._sort_numeric(arr)
+
+        arr_copy = list(arr)
         max_depth = 2 * (len(arr_copy).bit_length() - 1)  # 2 * log2(n)
         DivideConquerSorting._introsort_helper(
             arr_copy, 0, len(arr_copy) - 1, max_depth
@@ -268,7 +902,7 @@ class DivideConquerSorting:
     def _introsort_helper(arr: List[T], low: int, high: int, max_depth: int) -> None:
         """Introsort helper with depth limit."""
         if high - low <= 16:  # Small array - use insertion sort
-            DivideConquerSorting._insertion_sort_range(arr, low, high)
+            _insertion_sort_range(arr, low, high)
             return
 
         if max_depth == 0:  # Recursion too deep - switch to heapsort
@@ -279,22 +913,13 @@ class DivideConquerSorting:
         pivot_idx = DivideConquerSorting._choose_median_pivot(arr, low, high)
         arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
 
-        pivot_idx = DivideConquerSorting._partition(arr, low, high)
+        pivot_idx = _partition(arr, low, high)
 
         # Recurse with reduced depth
         DivideConquerSorting._introsort_helper(arr, low, pivot_idx - 1, max_depth - 1)
         DivideConquerSorting._introsort_helper(arr, pivot_idx + 1, high, max_depth - 1)
 
-    @staticmethod
-    def _insertion_sort_range(arr: List[T], low: int, high: int) -> None:
-        """Insertion sort for a subarray."""
-        for i in range(low + 1, high + 1):
-            key = arr[i]
-            j = i - 1
-            while j >= low and arr[j] > key:
-                arr[j + 1] = arr[j]
-                j -= 1
-            arr[j + 1] = key
+    _insertion_sort_range = staticmethod(_insertion_sort_range)
 
     @staticmethod
     def _heapsort_range(arr: List[T], low: int, high: int) -> None:
@@ -310,19 +935,22 @@ class DivideConquerSorting:
 
     @staticmethod
     def _heapify_range(arr: List[T], n: int, i: int, low: int, high: int) -> None:
-        """Heapify a subtree in a subarray."""
-        largest = i
-        left = 2 * (i - low) + 1 + low
-        right = 2 * (i - low) + 2 + low
+        """Heapify a subtree in a subarray (iterative sift-down)."""
+        while True:
+            largest = i
+            left = 2 * (i - low) + 1 + low
+            right = left + 1
+
+            if left <= high and arr[left] > arr[largest]:
+                largest = left
+            if right <= high and arr[right] > arr[largest]:
+                largest = right
 
-        if left <= high and arr[left] > arr[largest]:
-            largest = left
-        if right <= high and arr[right] > arr[largest]:
-            largest = right
+            if largest == i:
+                break
 
-        if largest != i:
             arr[i], arr[largest] = arr[largest], arr[i]
-            DivideConquerSorting._heapify_range(arr, n, largest, low, high)
+            i = largest
 
 
 class SortingAnalysis:
@@ -330,34 +958,44 @@ class SortingAnalysis:
 
     @staticmethod
     def benchmark_sorting_algorithms(
-        arr: List[int], algorithms: List[Callable]
+        arr: List[int], algorithms: List[Callable], repeat: int = 5
     ) -> dict:
         """
         Benchmark multiple sorting algorithms on the same data.
 
+        Each algorithm is run `repeat` times on a fresh copy (made outside
+        the timed region) and the fastest run is kept, like timeit.
+
         Args:
             arr: Test array
             algorithms: List of (name, function) tuples
+            repeat: Number of timed runs per algorithm
 
         Returns:
-            Dictionary with timing results
+            Dictionary with timing results: "time_ns" (best run in
+            nanoseconds), "time" (the same in seconds) and "correct"
         """
         results = {}
 
         for name, sort_func in algorithms:
-            arr_copy = arr.copy()
-            start_time = time.time()
+            inplace = "inplace" in name.lower()
+            best_ns = None
 
-            if "inplace" in name.lower():
-                sort_func(arr_copy)
-                result = arr_copy
-            else:
+            for _ in range(repeat):
+                arr_copy = arr.copy()
+                start_ns = time.perf_counter_ns()
                 result = sort_func(arr_copy)
+                elapsed_ns = time.perf_counter_ns() - start_ns
+
+                if best_ns is None or elapsed_ns < best_ns:
+                    best_ns = elapsed_ns
 
-            end_time = time.time()
+            if inplace:
+                result = arr_copy
 
             results[name] = {
-                "time": end_time - start_time,
+                "time_ns": best_ns,
+                "time": best_ns / 1e9,
                 "correct": SortingAnalysis.is_sorted(result),
             }
 
@@ -366,10 +1004,8 @@ class SortingAnalysis:
     @staticmethod
     def is_sorted(arr: List[T]) -> bool:
         """Check if array is sorted in ascending order."""
-        for i in range(1, len(arr)):
-            if arr[i] < arr[i - 1]:
-                return False
-        return True
+        # Pairwise arr[i] < arr[i - 1] check driven by C-level iterators
+        return not any(map(operator.lt, islice(arr, 1, None), arr))
 
     @staticmethod
     def generate_test_data(size: int, distribution: str = "random") -> List[int]:
@@ -465,31 +1101,12 @@ class SortingAnalysis:
         Returns:
             Maximum recursion depth encountered
         """
-        max_depth = 0
-        current_depth = 0
-
-        def track_depth(func):
-            def wrapper(*args, **kwargs):
-                nonlocal current_depth, max_depth
-                current_depth += 1
-                max_depth = max(max_depth, current_depth)
-                try:
-                    return func(*args, **kwargs)
-                finally:
-                    current_depth -= 1
-
-            return wrapper
+        max_depth = [0]  # Single-element box written by the counted helper
 
         if algorithm == "quicksort":
-            original_helper = DivideConquerSorting._quicksort_helper
-            DivideConquerSorting._quicksort_helper = track_depth(
-                DivideConquerSorting._quicksort_helper
+            arr_copy = arr.copy()
+            DivideConquerSorting._quicksort_helper_counted(
+                arr_copy, 0, len(arr_copy) - 1, 1, max_depth
             )
 
-            try:
-                arr_copy = arr.copy()
-                DivideConquerSorting._quicksort_helper(arr_copy, 0, len(arr_copy) - 1)
-            finally:
-                DivideConquerSorting._quicksort_helper = original_helper
-
-        return max_depth
+        return max_depth[0]
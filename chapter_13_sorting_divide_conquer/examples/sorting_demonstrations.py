@@ -144,9 +144,10 @@ def demonstrate_performance_comparison():
         merge_result = DivideConquerSorting.mergesort(arr)
         merge_time = time.time() - start
 
-        # Test quicksort
+        # Test quicksort in place on one copy made outside the timed region
+        quick_result = arr.copy()
         start = time.time()
-        quick_result = DivideConquerSorting.quicksort(arr)
+        DivideConquerSorting.quicksort_inplace(quick_result)
         quick_time = time.time() - start
 
         # Test quicksort with median pivot
@@ -260,12 +261,17 @@ def demonstrate_adaptive_behavior():
     quick_median_result = DivideConquerSorting.quicksort_median_pivot(arr)
     quick_median_time = time.time() - start
 
+    start = time.time()
+    tim_result = DivideConquerSorting.timsort(arr)
+    tim_time = time.time() - start
+
     print(".6f")
     print(".6f")
     print(".6f")
+    print(f"Timsort (natural runs): {tim_time:.6f}s")
 
     print(
-        f"All results correct: {merge_result == quick_result == quick_median_result == sorted(arr)}"
+        f"All results correct: {merge_result == quick_result == quick_median_result == tim_result == sorted(arr)}"
     )
 
 
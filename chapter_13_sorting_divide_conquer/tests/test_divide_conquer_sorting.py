@@ -8,78 +8,112 @@ Comprehensive tests covering all sorting algorithms, edge cases, performance, an
 import sys
 import os
 import random
-import time
+from array import array
+
+import pytest
 
 # Add chapter code directory to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 code_dir = os.path.join(current_dir, "..", "code")
 sys.path.insert(0, code_dir)
 
-from divide_conquer_sorting import DivideConquerSorting
+from divide_conquer_sorting import DivideConquerSorting, SortingAnalysis
+
+
+class _StabilityItem:
+    """Item compared by value only; id tells equal values apart."""
+
+    __slots__ = ("value", "id")
+
+    def __init__(self, value, id):
+        self.value = value
+        self.id = id
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __le__(self, other):
+        return self.value <= other.value
+
+    def __repr__(self):
+        return f"Item({self.value}, {self.id})"
+
+
+# Shared stability fixture; sorts never mutate the items themselves
+_STABILITY_ARR = (
+    _StabilityItem(1, "a"),
+    _StabilityItem(2, "b"),
+    _StabilityItem(1, "c"),
+    _StabilityItem(3, "d"),
+    _StabilityItem(1, "e"),
+)
+
+# Edge-case fixtures built once at import
+_REVERSE_10 = (10, 9, 8, 7, 6, 5, 4, 3, 2, 1)
+_SORTED_10 = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+
+# Seeded random input generated once; tests slice prefixes as needed
+_RANDOM_100 = array("i", random.Random(0xC0FFEE).choices(range(1001), k=100))
+
+# (input, expected) pairs shared by every sorting algorithm
+SORT_CASES = [
+    ([], []),
+    ([5], [5]),
+    ([1, 2, 3, 4, 5], [1, 2, 3, 4, 5]),
+    ([5, 4, 3, 2, 1], [1, 2, 3, 4, 5]),
+    ([3, 1, 4, 1, 5, 9, 2, 6], [1, 1, 2, 3, 4, 5, 6, 9]),
+    ([3, 1, 4, 1, 5, 1], [1, 1, 1, 3, 4, 5]),
+    (["banana", "apple", "cherry", "date"], ["apple", "banana", "cherry", "date"]),
+]
+
+SORT_CASE_IDS = [
+    "empty",
+    "single",
+    "sorted",
+    "reverse",
+    "random",
+    "duplicates",
+    "strings",
+]
+
+SORT_FUNCTIONS = [
+    DivideConquerSorting.mergesort,
+    DivideConquerSorting.quicksort,
+    DivideConquerSorting.quicksort_median_pivot,
+]
+
+INPLACE_SORT_FUNCTIONS = [
+    DivideConquerSorting.mergesort_inplace,
+    DivideConquerSorting.quicksort_inplace,
+]
+
+
+class TestSortCases:
+    """Test every algorithm against the shared input cases."""
+
+    @pytest.mark.parametrize("sort_fn", SORT_FUNCTIONS)
+    @pytest.mark.parametrize("arr,expected", SORT_CASES, ids=SORT_CASE_IDS)
+    def test_sort(self, arr, expected, sort_fn):
+        """Test that a copying sort returns the sorted list, input unchanged."""
+        original = list(arr)
+        assert sort_fn(arr) == expected
+        assert arr == original
+
+    @pytest.mark.parametrize("sort_fn", INPLACE_SORT_FUNCTIONS)
+    @pytest.mark.parametrize("arr,expected", SORT_CASES, ids=SORT_CASE_IDS)
+    def test_sort_inplace(self, arr, expected, sort_fn):
+        """Test that an in-place sort leaves the list sorted."""
+        arr = list(arr)
+        sort_fn(arr)
+        assert arr == expected
 
 
 class TestMergesort:
     """Test mergesort implementations."""
 
-    def test_mergesort_empty_array(self):
-        """Test mergesort on empty array."""
-        result = DivideConquerSorting.mergesort([])
-        assert result == []
-
-    def test_mergesort_single_element(self):
-        """Test mergesort on single element."""
-        result = DivideConquerSorting.mergesort([5])
-        assert result == [5]
-
-    def test_mergesort_sorted_array(self):
-        """Test mergesort on already sorted array."""
-        arr = [1, 2, 3, 4, 5]
-        result = DivideConquerSorting.mergesort(arr)
-        assert result == [1, 2, 3, 4, 5]
-
-    def test_mergesort_reverse_sorted(self):
-        """Test mergesort on reverse sorted array."""
-        arr = [5, 4, 3, 2, 1]
-        result = DivideConquerSorting.mergesort(arr)
-        assert result == [1, 2, 3, 4, 5]
-
-    def test_mergesort_random_array(self):
-        """Test mergesort on random array."""
-        arr = [3, 1, 4, 1, 5, 9, 2, 6]
-        result = DivideConquerSorting.mergesort(arr)
-        assert result == [1, 1, 2, 3, 4, 5, 6, 9]
-
-    def test_mergesort_with_duplicates(self):
-        """Test mergesort with duplicate elements."""
-        arr = [3, 1, 4, 1, 5, 1]
-        result = DivideConquerSorting.mergesort(arr)
-        assert result == [1, 1, 1, 3, 4, 5]
-
-    def test_mergesort_strings(self):
-        """Test mergesort on strings."""
-        arr = ["banana", "apple", "cherry", "date"]
-        result = DivideConquerSorting.mergesort(arr)
-        assert result == ["apple", "banana", "cherry", "date"]
-
     def test_mergesort_stability(self):
         """Test that mergesort is stable."""
-
-        # Create items with same value but different identities
-        class Item:
-            def __init__(self, value, id):
-                self.value = value
-                self.id = id
-
-            def __lt__(self, other):
-                return self.value < other.value
-
-            def __le__(self, other):
-                return self.value <= other.value
-
-            def __repr__(self):
-                return f"Item({self.value}, {self.id})"
-
-        arr = [Item(1, "a"), Item(2, "b"), Item(1, "c"), Item(3, "d"), Item(1, "e")]
+        arr = list(_STABILITY_ARR)
         result = DivideConquerSorting.mergesort(arr)
 
         # Check that equal elements maintain relative order
@@ -87,101 +121,140 @@ class TestMergesort:
         assert result[1].id == "c"  # Second 1
         assert result[2].id == "e"  # Third 1
 
-    def test_mergesort_inplace_empty(self):
-        """Test in-place mergesort on empty array."""
-        arr = []
+    def test_mergesort_stability_past_insertion_cutoff(self):
+        """Test stability when insertion-sorted blocks are merged."""
+        arr = [_StabilityItem(random.randint(0, 4), i) for i in range(200)]
+        expected = sorted(((x.value, x.id) for x in arr), key=lambda p: p[0])
+
+        result = DivideConquerSorting.mergesort(arr)
+        assert [(x.value, x.id) for x in result] == expected
         DivideConquerSorting.mergesort_inplace(arr)
-        assert arr == []
+        assert [(x.value, x.id) for x in arr] == expected
 
-    def test_mergesort_inplace_single(self):
-        """Test in-place mergesort on single element."""
-        arr = [5]
+    def test_mergesort_inplace_all_sizes(self):
+        """Test in-place mergesort for sizes with odd and even pass counts."""
+        for size in range(1, 40):
+            arr = [random.randint(0, 10) for _ in range(size)]
+            expected = sorted(arr)
+            DivideConquerSorting.mergesort_inplace(arr)
+            assert arr == expected, f"failed for size {size}"
+
+    def test_parallel_mergesort(self):
+        """Test parallel mergesort on the serial and parallel paths."""
+        words = [str(random.randint(0, 10000)) for _ in range(500)]
+        expected = sorted(words)
+        assert DivideConquerSorting.parallel_mergesort(words) == expected
+
+        # Force the parallel path on small inputs
+        result = DivideConquerSorting.parallel_mergesort(words, workers=3, min_size=0)
+        assert result == expected
+
+        nums = [random.randint(-1000, 1000) for _ in range(500)]
+        result = DivideConquerSorting.parallel_mergesort(nums, workers=3, min_size=0)
+        assert result == sorted(nums)
+        assert DivideConquerSorting.parallel_mergesort([], workers=2, min_size=0) == []
+
+    def test_mergesort_inplace_large_ints(self):
+        """Test in-place mergesort on ints, including values beyond int64."""
+        arr = [random.randint(-1000, 1000) for _ in range(300)]
+        expected = sorted(arr)
         DivideConquerSorting.mergesort_inplace(arr)
-        assert arr == [5]
+        assert arr == expected
 
-    def test_mergesort_inplace_random(self):
-        """Test in-place mergesort on random array."""
-        arr = [3, 1, 4, 1, 5, 9, 2, 6]
+        arr = [2**70, -(2**70), 3, 0]
         DivideConquerSorting.mergesort_inplace(arr)
-        assert arr == [1, 1, 2, 3, 4, 5, 6, 9]
+        assert arr == [-(2**70), 0, 3, 2**70]
+
+    def test_timsort_structured_inputs(self):
+        """Test timsort on random, sorted, reversed and run-structured input."""
+        test_arrays = [
+            [],
+            [1],
+            [random.randint(0, 1000) for _ in range(500)],
+            list(range(300)),
+            list(range(300, 0, -1)),
+            list(range(100)) + list(range(50)) + list(range(200, 100, -1)),
+            [random.randint(0, 3) for _ in range(400)],
+        ]
+        for arr in test_arrays:
+            original = arr.copy()
+            assert DivideConquerSorting.timsort(arr) == sorted(arr)
+            assert arr == original
+
+    def test_timsort_stability(self):
+        """Test that timsort keeps equal keys in input order across merges."""
+        # Long enough to form several runs and trigger galloping merges
+        arr = [_StabilityItem(random.randint(0, 5), i) for i in range(300)]
+        result = DivideConquerSorting.timsort(arr)
+        assert [(x.value, x.id) for x in result] == sorted(
+            ((x.value, x.id) for x in arr), key=lambda p: p[0]
+        )
 
 
 class TestQuicksort:
     """Test quicksort implementations."""
 
-    def test_quicksort_empty_array(self):
-        """Test quicksort on empty array."""
-        result = DivideConquerSorting.quicksort([])
-        assert result == []
-
-    def test_quicksort_single_element(self):
-        """Test quicksort on single element."""
-        result = DivideConquerSorting.quicksort([5])
-        assert result == [5]
-
-    def test_quicksort_sorted_array(self):
-        """Test quicksort on already sorted array."""
-        arr = [1, 2, 3, 4, 5]
-        result = DivideConquerSorting.quicksort(arr)
-        assert result == [1, 2, 3, 4, 5]
-
-    def test_quicksort_reverse_sorted(self):
-        """Test quicksort on reverse sorted array."""
-        arr = [5, 4, 3, 2, 1]
-        result = DivideConquerSorting.quicksort(arr)
-        assert result == [1, 2, 3, 4, 5]
-
-    def test_quicksort_random_array(self):
-        """Test quicksort on random array."""
-        arr = [3, 1, 4, 1, 5, 9, 2, 6]
-        result = DivideConquerSorting.quicksort(arr)
-        assert result == [1, 1, 2, 3, 4, 5, 6, 9]
-
-    def test_quicksort_with_duplicates(self):
-        """Test quicksort with duplicate elements."""
-        arr = [3, 1, 4, 1, 5, 1]
-        result = DivideConquerSorting.quicksort(arr)
-        assert result == [1, 1, 1, 3, 4, 5]
-
-    def test_quicksort_strings(self):
-        """Test quicksort on strings."""
-        arr = ["banana", "apple", "cherry", "date"]
-        result = DivideConquerSorting.quicksort(arr)
-        assert result == ["apple", "banana", "cherry", "date"]
-
-    def test_quicksort_inplace_empty(self):
-        """Test in-place quicksort on empty array."""
-        arr = []
+    def test_quicksort_inplace_large_ints(self):
+        """Test in-place quicksort on ints, including values beyond int64."""
+        arr = [random.randint(-1000, 1000) for _ in range(200)]
+        expected = sorted(arr)
         DivideConquerSorting.quicksort_inplace(arr)
-        assert arr == []
+        assert arr == expected
 
-    def test_quicksort_inplace_single(self):
-        """Test in-place quicksort on single element."""
-        arr = [5]
+        arr = [2**70, -(2**70), 3, 0]
         DivideConquerSorting.quicksort_inplace(arr)
-        assert arr == [5]
+        assert arr == [-(2**70), 0, 3, 2**70]
 
-    def test_quicksort_inplace_random(self):
-        """Test in-place quicksort on random array."""
-        arr = [3, 1, 4, 1, 5, 9, 2, 6]
+    def test_quicksort_inplace_sorted_input_depth(self):
+        """Test sorted object input beyond the default recursion limit."""
+        arr = [str(i).zfill(5) for i in range(3000)]
+        expected = arr.copy()
+        arr.reverse()
         DivideConquerSorting.quicksort_inplace(arr)
-        assert arr == [1, 1, 2, 3, 4, 5, 6, 9]
+        assert arr == expected
 
-    def test_quicksort_median_pivot_empty(self):
-        """Test median pivot quicksort on empty array."""
-        result = DivideConquerSorting.quicksort_median_pivot([])
-        assert result == []
+    def test_quicksort_inplace_many_duplicates(self):
+        """Test 3-way partitioning on all-equal and few-distinct keys."""
+        arr = ["x"] * 3000
+        DivideConquerSorting.quicksort_inplace(arr)
+        assert arr == ["x"] * 3000
 
-    def test_quicksort_median_pivot_single(self):
-        """Test median pivot quicksort on single element."""
-        result = DivideConquerSorting.quicksort_median_pivot([5])
-        assert result == [5]
+        arr = [random.choice("abc") for _ in range(1000)]
+        expected = sorted(arr)
+        DivideConquerSorting.quicksort_inplace(arr)
+        assert arr == expected
 
-    def test_quicksort_median_pivot_random(self):
-        """Test median pivot quicksort on random array."""
-        arr = [3, 1, 4, 1, 5, 9, 2, 6]
-        result = DivideConquerSorting.quicksort_median_pivot(arr)
-        assert result == [1, 1, 2, 3, 4, 5, 6, 9]
+        arr = [2, 1, 2, 3, 2, 1]
+        lt, gt = DivideConquerSorting._partition_3way(arr, 0, len(arr) - 1)
+        assert arr[lt : gt + 1] == [2, 2, 2]
+        assert all(x < 2 for x in arr[:lt]) and all(x > 2 for x in arr[gt + 1 :])
+
+    def test_quicksort_numpy(self):
+        """Test numpy-partition quicksort on numeric and fallback inputs."""
+        test_arrays = [
+            [],
+            [5],
+            [random.randint(-100, 100) for _ in range(300)],
+            [random.random() for _ in range(100)],
+            [7] * 50,
+            ["banana", "apple", "cherry"],
+            [3, 1.5, 2],
+        ]
+        for arr in test_arrays:
+            expected = sorted(arr)
+            result = DivideConquerSorting.quicksort_numpy(arr)
+            assert result == expected
+            assert [type(x) for x in result] == [type(x) for x in expected]
+
+    def test_quicksort_numpy_duplicates(self):
+        """Test numpy quicksort on large duplicate-heavy inputs."""
+        test_arrays = [
+            [7] * 100_000,
+            [random.randint(0, 3) for _ in range(50_000)],
+            [1.5] * 20_000 + [0.5] * 20_000,
+        ]
+        for arr in test_arrays:
+            assert DivideConquerSorting.quicksort_numpy(arr) == sorted(arr)
 
 
 class TestSortingCorrectness:
@@ -189,7 +262,7 @@ class TestSortingCorrectness:
 
     def test_all_algorithms_same_result(self):
         """Test that all sorting algorithms produce same result."""
-        arr = [3, 1, 4, 1, 5, 9, 2, 6]
+        arr = array("i", [3, 1, 4, 1, 5, 9, 2, 6])
         expected = sorted(arr)
 
         merge_result = DivideConquerSorting.mergesort(arr)
@@ -203,7 +276,7 @@ class TestSortingCorrectness:
     def test_large_random_arrays(self):
         """Test sorting on large random arrays."""
         for size in [10, 50, 100]:
-            arr = [random.randint(0, 1000) for _ in range(size)]
+            arr = _RANDOM_100[:size]  # Each prefix is itself a random input
             expected = sorted(arr)
 
             merge_result = DivideConquerSorting.mergesort(arr)
@@ -215,14 +288,14 @@ class TestSortingCorrectness:
     def test_edge_cases(self):
         """Test various edge cases."""
         test_arrays = [
-            [],
-            [1],
-            [1, 2],
-            [2, 1],
-            [1, 1, 1],
-            [3, 1, 2, 3, 1, 2],
-            list(range(10, 0, -1)),  # Reverse sorted
-            list(range(1, 11)),  # Already sorted
+            array("i"),
+            array("i", [1]),
+            array("i", [1, 2]),
+            array("i", [2, 1]),
+            array("i", [1, 1, 1]),
+            array("i", [3, 1, 2, 3, 1, 2]),
+            array("i", _REVERSE_10),  # Reverse sorted
+            array("i", _SORTED_10),  # Already sorted
         ]
 
         for arr in test_arrays:
@@ -240,6 +313,74 @@ class TestSortingCorrectness:
         result = DivideConquerSorting.introsort_like(arr)
         assert result == sorted(arr)
 
+    def test_ninther_pivot_on_large_ranges(self):
+        """Test ninther pivot selection on organ-pipe input."""
+        arr = list(range(150)) + list(range(150, 0, -1))
+        pivot_idx = DivideConquerSorting._choose_median_pivot(arr, 0, len(arr) - 1)
+        assert 0 <= pivot_idx < len(arr)
+
+        words = [str(x).zfill(4) for x in arr]
+        expected = sorted(words)
+        assert DivideConquerSorting.quicksort_median_pivot(words) == expected
+        assert DivideConquerSorting.introsort_like(words) == expected
+
+    def test_radix_sort(self):
+        """Test radix sort on bounded, negative and multi-byte integers."""
+        test_arrays = [
+            [],
+            [0],
+            [170, 45, 75, 90, 802, 24, 2, 66],
+            [random.randint(0, 10000) for _ in range(500)],
+            [random.randint(-(2**40), 2**40) for _ in range(200)],
+            [2**70, -3, 0, 2**70, -(2**70)],
+            [5, 5, 5],
+        ]
+        for arr in test_arrays:
+            original = arr.copy()
+            assert DivideConquerSorting.radix_sort(arr) == sorted(arr)
+            assert arr == original
+
+    def test_heapsort_range(self):
+        """Test the introsort heapsort fallback on an interior subrange."""
+        arr = [99] + [random.randint(0, 50) for _ in range(40)] + [-1]
+        expected = arr[:1] + sorted(arr[1:-1]) + arr[-1:]
+        DivideConquerSorting._heapsort_range(arr, 1, len(arr) - 2)
+        assert arr == expected
+
+    def test_numeric_fast_path(self):
+        """Test mixed int/float input returns a new sorted list."""
+        arr = [3, 1.5, -2, 0.0, 7, 1.5]
+        expected = sorted(arr)
+        for sort_func in (
+            DivideConquerSorting.quicksort,
+            DivideConquerSorting.quicksort_median_pivot,
+            DivideConquerSorting.introsort_like,
+        ):
+            result = sort_func(arr)
+            assert result == expected
+            assert result is not arr
+        assert arr == [3, 1.5, -2, 0.0, 7, 1.5]
+
+    def test_numeric_fast_path_large(self):
+        """Test long numeric lists, which may go through np.sort."""
+        ints = [random.randint(-(10**12), 10**12) for _ in range(10_000)]
+        test_arrays = [
+            ints,
+            [x / 3 for x in ints],
+            ints + [2**70],  # Beyond int64: stays on sorted()
+            ints + [0.5],  # Mixed int/float: stays on sorted()
+        ]
+        for arr in test_arrays:
+            expected = sorted(arr)
+            for sort_func in (
+                DivideConquerSorting.quicksort,
+                DivideConquerSorting.quicksort_median_pivot,
+                DivideConquerSorting.introsort_like,
+            ):
+                result = sort_func(arr)
+                assert result == expected
+                assert [type(x) for x in result] == [type(x) for x in expected]
+
     def test_performance_basic(self):
         """Test basic performance measurement."""
         arr = [3, 1, 4, 1, 5, 9, 2, 6]
@@ -256,90 +397,53 @@ class TestSortingCorrectness:
         """Test that algorithms have expected properties."""
         # Test that results are sorted
         arr = [3, 1, 4, 1, 5]
+        expected = sorted(arr)  # Reference computed once with Python's sorted()
 
         merge_result = DivideConquerSorting.mergesort(arr)
         quick_result = DivideConquerSorting.quicksort(arr)
 
-        # Test that results are sorted using Python's sorted()
-        assert merge_result == sorted(arr)
-        assert quick_result == sorted(arr)
+        assert merge_result == expected
+        assert quick_result == expected
 
 
 class TestSortingUtilities:
     """Test utility functions."""
 
-    def test_introsort_like(self):
-        """Test introsort-like algorithm."""
-        arr = [3, 1, 4, 1, 5, 9, 2, 6]
-        result = DivideConquerSorting.introsort_like(arr)
-        assert result == sorted(arr)
-
-    def test_mergesort_stability(self):
-        """Test that mergesort is stable."""
-
-        # Create items with same value but different identities
-        class Item:
-            def __init__(self, value, id):
-                self.value = value
-                self.id = id
-
-            def __lt__(self, other):
-                return self.value < other.value
-
-            def __le__(self, other):
-                return self.value <= other.value
-
-            def __repr__(self):
-                return f"Item({self.value}, {self.id})"
-
-        arr = [Item(1, "a"), Item(2, "b"), Item(1, "c"), Item(3, "d"), Item(1, "e")]
-        result = DivideConquerSorting.mergesort(arr)
-
-        # Check that equal elements maintain relative order
-        assert result[0].id == "a"  # First 1
-        assert result[1].id == "c"  # Second 1
-        assert result[2].id == "e"  # Third 1
-
-
-def run_test_class(test_class):
-    """Run all test methods in a test class."""
-    test_instance = test_class()
-    test_methods = [
-        method
-        for method in dir(test_instance)
-        if method.startswith("test_") and callable(getattr(test_instance, method))
-    ]
-
-    for test_method in test_methods:
-        try:
-            getattr(test_instance, test_method)()
-        except Exception as e:
-            print(f"✗ {test_class.__name__}.{test_method}: {e}")
-            return False
-
-    return True
-
-
-def run_all_tests():
-    """Run all test classes."""
-    print("Running Chapter 13 Sorting Tests...")
-    print("=" * 50)
-
-    test_classes = [
-        TestMergesort,
-        TestQuicksort,
-        TestSortingCorrectness,
-        TestSortingUtilities,
-    ]
-
-    for test_class in test_classes:
-        if not run_test_class(test_class):
-            return False
-
-    print("=" * 50)
-    print("All tests passed! ✓")
-    return True
+    def test_is_sorted(self):
+        """Test the sortedness check on edge cases."""
+        assert SortingAnalysis.is_sorted([])
+        assert SortingAnalysis.is_sorted([1])
+        assert SortingAnalysis.is_sorted([1, 1, 2, 3])
+        assert not SortingAnalysis.is_sorted([1, 3, 2])
+        assert not SortingAnalysis.is_sorted([2, 1])
+
+    def test_analyze_recursion_depth(self):
+        """Test depth tracking leaves quicksort untouched and stays O(log n)."""
+        helper = DivideConquerSorting._quicksort_helper
+        arr = list(range(1024))
+
+        depth = SortingAnalysis.analyze_recursion_depth(arr)
+        assert 1 <= depth <= 11  # Smaller side recursion: <= log2(n) + 1
+        assert SortingAnalysis.analyze_recursion_depth([]) == 1
+        assert DivideConquerSorting._quicksort_helper is helper
+        assert arr == list(range(1024))
+
+    def test_benchmark_sorting_algorithms(self):
+        """Test benchmark results hold best-of-N nanosecond timings."""
+        arr = [random.randint(0, 100) for _ in range(50)]
+        results = SortingAnalysis.benchmark_sorting_algorithms(
+            arr,
+            [
+                ("Mergesort", DivideConquerSorting.mergesort),
+                ("Quicksort inplace", DivideConquerSorting.quicksort_inplace),
+            ],
+            repeat=3,
+        )
+        for stats in results.values():
+            assert isinstance(stats["time_ns"], int) and stats["time_ns"] >= 0
+            assert stats["time"] == stats["time_ns"] / 1e9
+            assert stats["correct"]
 
 
 if __name__ == "__main__":
-    run_all_tests()
+    pytest.main([__file__])
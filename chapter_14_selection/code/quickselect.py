@@ -8,6 +8,20 @@ element in an unordered array, achieving average O(n) time complexity.
 from typing import List, TypeVar, Optional
 import random
 
+try:
+    import numpy as np  # Optional: np.partition fast path for numeric input
+except ImportError:
+    np = None
+
+# Selection kernels shared with selection_algorithms (defined once there)
+from selection_algorithms import (
+    _fr_select,
+    _median_of_medians,
+    _numpy_buffer,
+    _partition_block_nb,
+    _partition_numpy,
+)
+
 T = TypeVar('T')
 
 
@@ -19,7 +33,7 @@ class QuickSelect:
         """
         Find the k-th smallest element using recursive quickselect.
 
-        Time: O(n) average case, O(n²) worst case
+        Time: O(n) average case, O(n) worst case (median-of-medians fallback)
         Space: O(log n) average (recursion stack)
 
         Args:
@@ -44,37 +58,50 @@ class QuickSelect:
         if k < 0 or k >= len(arr):
             raise ValueError(f"k ({k}) is out of bounds for array of size {len(arr)}")
 
-        return QuickSelect._quickselect_recursive(arr.copy(), 0, len(arr) - 1, k)
+        depth_limit = 2 * (len(arr).bit_length() - 1)  # 2 * log2(n)
+        return QuickSelect._quickselect_recursive(arr.copy(), 0, len(arr) - 1, k, depth_limit)
 
     @staticmethod
-    def _quickselect_recursive(arr: List[T], low: int, high: int, k: int) -> T:
-        """Recursive quickselect helper."""
-        if low == high:
-            return arr[low]
-
-        # Choose pivot and partition
-        pivot_idx = QuickSelect._choose_pivot_median_of_three(arr, low, high)
-        pivot_idx = QuickSelect._partition(arr, low, high, pivot_idx)
-
-        # Check which partition contains the k-th element
-        if k == pivot_idx:
-            return arr[k]
-        elif k < pivot_idx:
-            return QuickSelect._quickselect_recursive(arr, low, pivot_idx - 1, k)
-        else:
-            return QuickSelect._quickselect_recursive(arr, pivot_idx + 1, high, k)
+    def _quickselect_recursive(arr: List[T], low: int, high: int, k: int,
+                               depth_limit: int) -> T:
+        """
+        Quickselect helper with an introselect depth limit.
+
+        Shrinks the [low, high] window in a loop rather than recursing, so
+        large inputs never approach Python's recursion limit.
+        """
+        while low < high:
+            if depth_limit == 0:  # Too many poor pivots - switch to BFPRT
+                return _median_of_medians(arr, low, high, k)
+            depth_limit -= 1
+
+            # Choose pivot and partition
+            pivot_idx = QuickSelect._choose_pivot_median_of_three(arr, low, high)
+            pivot_idx = QuickSelect._partition(arr, low, high, pivot_idx)
+
+            # Check which partition contains the k-th element
+            if k == pivot_idx:
+                return arr[k]
+            elif k < pivot_idx:
+                high = pivot_idx - 1
+            else:
+                low = pivot_idx + 1
+
+        return arr[k]
 
     @staticmethod
-    def quickselect_iterative(arr: List[T], k: int) -> T:
+    def quickselect_iterative(arr: List[T], k: int, inplace: bool = False) -> T:
         """
         Find the k-th smallest element using iterative quickselect.
 
-        Time: O(n) average case, O(n²) worst case
+        Time: O(n) average case, O(n) worst case (median-of-medians fallback)
         Space: O(1) auxiliary
 
         Args:
             arr: List to search
             k: Index of desired element (0-based, k-th smallest)
+            inplace: Select within arr itself, leaving it partitioned around
+                index k, instead of working on a copy
 
         Returns:
             k-th smallest element
@@ -91,15 +118,31 @@ class QuickSelect:
         if k < 0 or k >= len(arr):
             raise ValueError(f"k ({k}) is out of bounds for array of size {len(arr)}")
 
-        arr_copy = arr.copy()
+        # Numeric input with numpy available: partition in a compiled loop
+        # when numba is installed, otherwise with vectorised masks
+        buf = None if inplace else _numpy_buffer(arr)
+        if buf is not None and _partition_block_nb is not None:
+            arr_copy, partition = buf, _partition_block_nb
+        elif buf is not None:
+            arr_copy, partition = buf, _partition_numpy
+        else:
+            arr_copy = arr if inplace else arr.copy()
+            partition = QuickSelect._partition
         left, right = 0, len(arr_copy) - 1
+        depth_limit = 2 * (len(arr_copy).bit_length() - 1)  # 2 * log2(n)
 
         while left <= right:
+            if depth_limit == 0:  # Too many poor pivots - switch to BFPRT
+                result = _median_of_medians(arr_copy, left, right, k)
+                return result if buf is None else result.item()
+            depth_limit -= 1
+
             pivot_idx = QuickSelect._choose_pivot_median_of_three(arr_copy, left, right)
-            pivot_idx = QuickSelect._partition(arr_copy, left, right, pivot_idx)
+            pivot_idx = partition(arr_copy, left, right, pivot_idx)
 
             if pivot_idx == k:
-                return arr_copy[k]
+                # Convert NumPy scalars back to the plain Python type
+                return arr_copy[k] if buf is None else buf[k].item()
             elif k < pivot_idx:
                 right = pivot_idx - 1
             else:
@@ -136,31 +179,35 @@ class QuickSelect:
 
     @staticmethod
     def _quickselect_randomized(arr: List[T], low: int, high: int, k: int) -> T:
-        """Randomized quickselect helper."""
-        if low == high:
-            return arr[low]
-
-        # Choose random pivot
-        pivot_idx = random.randint(low, high)
-        pivot_idx = QuickSelect._partition(arr, low, high, pivot_idx)
-
-        if k == pivot_idx:
-            return arr[k]
-        elif k < pivot_idx:
-            return QuickSelect._quickselect_randomized(arr, low, pivot_idx - 1, k)
-        else:
-            return QuickSelect._quickselect_randomized(arr, pivot_idx + 1, high, k)
+        """Randomized quickselect helper, looping instead of recursing."""
+        while low < high:
+            # Choose random pivot (random() avoids randint's argument checking)
+            pivot_idx = low + int(random.random() * (high - low + 1))
+            pivot_idx = QuickSelect._partition(arr, low, high, pivot_idx)
+
+            if k == pivot_idx:
+                return arr[k]
+            elif k < pivot_idx:
+                high = pivot_idx - 1
+            else:
+                low = pivot_idx + 1
+
+        return arr[k]
 
     @staticmethod
     def _choose_pivot_median_of_three(arr: List[T], low: int, high: int) -> int:
         """Choose pivot using median of three elements."""
         mid = (low + high) // 2
 
-        # Find median of arr[low], arr[mid], arr[high]
-        candidates = [(arr[low], low), (arr[mid], mid), (arr[high], high)]
-        candidates.sort(key=lambda x: x[0])
-
-        return candidates[1][1]  # Return index of median
+        # Median of arr[low], arr[mid], arr[high] by direct comparisons
+        a, b, c = arr[low], arr[mid], arr[high]
+        if a < b:
+            if b < c:
+                return mid
+            return high if a < c else low
+        if a < c:
+            return low
+        return high if b < c else mid
 
     @staticmethod
     def _partition(arr: List[T], low: int, high: int, pivot_idx: int) -> int:
@@ -171,13 +218,19 @@ class QuickSelect:
 
         i = low - 1
         for j in range(low, high):
-            if arr[j] <= pivot:
+            value = arr[j]  # Index once; reused by the swap
+            if value <= pivot:
                 i += 1
-                arr[i], arr[j] = arr[j], arr[i]
+                arr[i], arr[j] = value, arr[i]
 
         arr[i + 1], arr[high] = arr[high], arr[i + 1]
         return i + 1
 
+    _partition_numpy = staticmethod(_partition_numpy)
+    _numpy_buffer = staticmethod(_numpy_buffer)
+    _median_of_medians = staticmethod(_median_of_medians)
+    _fr_select = staticmethod(_fr_select)
+
     @staticmethod
     def find_median(arr: List[T]) -> T:
         """
@@ -199,12 +252,15 @@ class QuickSelect:
         if n == 0:
             raise ValueError("Cannot find median of empty array")
 
-        if n % 2 == 1:
-            # Odd length - return middle element
-            return QuickSelect.quickselect_iterative(arr, n // 2)
-        else:
-            # Even length - return lower median
-            return QuickSelect.quickselect_iterative(arr, n // 2 - 1)
+        # Middle element for odd length, lower median for even length
+        k = (n - 1) // 2
+
+        buf = _numpy_buffer(arr)
+        if buf is not None:
+            # NumPy's C introselect
+            return np.partition(buf, k)[k].item()
+
+        return _fr_select(arr.copy(), 0, n - 1, k)
 
     @staticmethod
     def find_kth_largest(arr: List[T], k: int) -> T:
@@ -229,7 +285,13 @@ class QuickSelect:
             raise ValueError(f"k ({k}) is out of bounds")
 
         # k-th largest is equivalent to (n-k)-th smallest
-        return QuickSelect.quickselect_iterative(arr, len(arr) - k)
+        index = len(arr) - k
+
+        buf = _numpy_buffer(arr)
+        if buf is not None:
+            return np.partition(buf, index)[index].item()
+
+        return QuickSelect.quickselect_iterative(arr, index)
 
     @staticmethod
     def find_percentile(arr: List[T], percentile: float) -> T:
@@ -260,15 +322,17 @@ class QuickSelect:
         # Calculate index: (percentile/100) * (n-1)
         index = int((percentile / 100.0) * (n - 1))
 
-        return QuickSelect.quickselect_iterative(arr, index)
+        buf = _numpy_buffer(arr)
+        if buf is not None:
+            return np.partition(buf, index)[index].item()
+
+        return _fr_select(arr.copy(), 0, n - 1, index)
 
     @staticmethod
     def select_top_k(arr: List[T], k: int) -> List[T]:
         """
         Find the k smallest elements using quickselect.
 
-        Note: This is not the most efficient way, but demonstrates the concept.
-
         Args:
             arr: List to search
             k: Number of smallest elements to find
@@ -284,13 +348,15 @@ class QuickSelect:
         if k < 1 or k > len(arr):
             raise ValueError(f"k ({k}) is out of bounds")
 
-        # Use quickselect to find k-th element as pivot
-        kth_element = QuickSelect.quickselect_iterative(arr.copy(), k - 1)
-
-        # Collect all elements <= k-th element
-        result = [x for x in arr if x <= kth_element][:k]
+        buf = _numpy_buffer(arr)
+        if buf is not None:
+            # After partitioning around index k - 1 the k smallest come first
+            return np.partition(buf, k - 1)[:k].tolist()
 
-        return result
+        # Selecting index k - 1 in place leaves the k smallest in front
+        arr_copy = arr.copy()
+        QuickSelect.quickselect_iterative(arr_copy, k - 1, inplace=True)
+        return arr_copy[:k]
 
 
 class SelectionAnalysis:
@@ -325,9 +391,8 @@ class SelectionAnalysis:
             results[k] = {}
 
             for name, impl in implementations:
-                arr_copy = arr.copy()
                 start_time = time.time()
-                result = impl(arr_copy, k)
+                result = impl(arr, k)
                 end_time = time.time()
 
                 results[k][name] = {
@@ -364,9 +429,8 @@ class SelectionAnalysis:
             times = []
 
             for _ in range(num_trials):
-                arr_copy = arr.copy()
                 start_time = time.time()
-                strategy(arr_copy, k)
+                strategy(arr, k)
                 end_time = time.time()
                 times.append(end_time - start_time)
 
@@ -400,15 +464,13 @@ class SelectionAnalysis:
                 continue
 
             # Quickselect approach
-            arr_copy = arr.copy()
             start_time = time.time()
-            quickselect_result = QuickSelect.quickselect_iterative(arr_copy, k)
+            quickselect_result = QuickSelect.quickselect_iterative(arr, k)
             quickselect_time = time.time() - start_time
 
             # Sorting approach
-            arr_copy = arr.copy()
             start_time = time.time()
-            sorted_arr = sorted(arr_copy)
+            sorted_arr = sorted(arr)
             sorting_result = sorted_arr[k]
             sorting_time = time.time() - start_time
 
@@ -6,11 +6,250 @@ in an unordered array. The main algorithm is quickselect, which provides O(n)
 average-case performance for finding order statistics.
 """
 
-from typing import List, TypeVar, Optional
+from typing import Any, List, TypeVar, Optional
+import math
 import random
 
+try:
+    import numpy as np  # Optional: vectorised partitioning for numeric input
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # Optional: JIT-compiled partition loop
+except ImportError:
+    njit = None
+
 T = TypeVar("T")
 
+# Element types that can be packed into a NumPy array without loss
+_NUMERIC_TYPES = (int, float)
+
+# Floyd-Rivest: ranges longer than this pick their pivot from a sample
+_FR_SAMPLE_THRESHOLD = 600
+
+# Block partition: comparison outcomes are buffered this many at a time
+_PARTITION_BLOCK_SIZE = 128
+
+if njit is not None:
+    # Block partition (BlockQuicksort, Edelkamp & Weiss) over a contiguous
+    # int64/float64 buffer. Each block is scanned with a branch-free counter
+    # update that records misplaced offsets, then the recorded pairs are
+    # swapped, so the data-dependent compare never steers a branch
+
+    @njit(cache=True, boundscheck=False)
+    def _partition_block_nb(buf, low, high, pivot_idx):
+        block = _PARTITION_BLOCK_SIZE
+        buf[pivot_idx], buf[high] = buf[high], buf[pivot_idx]
+        pivot = buf[high]
+        offsets_l = np.empty(block, dtype=np.int64)
+        offsets_r = np.empty(block, dtype=np.int64)
+        num_l = num_r = start_l = start_r = 0
+        left, right = low, high - 1
+
+        while right - left + 1 > 2 * block:
+            if num_l == 0:
+                start_l = 0
+                for i in range(block):
+                    offsets_l[num_l] = i
+                    num_l += buf[left + i] > pivot
+            if num_r == 0:
+                start_r = 0
+                for i in range(block):
+                    offsets_r[num_r] = i
+                    num_r += buf[right - i] <= pivot
+
+            num = min(num_l, num_r)
+            for m in range(num):
+                a = left + offsets_l[start_l + m]
+                b = right - offsets_r[start_r + m]
+                buf[a], buf[b] = buf[b], buf[a]
+            num_l -= num
+            num_r -= num
+            start_l += num
+            start_r += num
+            if num_l == 0:
+                left += block
+            if num_r == 0:
+                right -= block
+
+        # Fewer than two blocks left unclassified: finish with Lomuto
+        i = left - 1
+        for j in range(left, right + 1):
+            if buf[j] <= pivot:
+                i += 1
+                buf[i], buf[j] = buf[j], buf[i]
+        buf[i + 1], buf[high] = buf[high], buf[i + 1]
+        return i + 1
+
+else:
+    _partition_block_nb = None
+
+
+def _partition_numpy(buf: "np.ndarray", low: int, high: int, pivot_idx: int) -> int:
+    """
+    Lomuto-contract partition of a NumPy array using boolean masks.
+
+    One vectorised compare splits buf[low:high] around the pivot instead
+    of a Python loop; the halves are written back on either side of it.
+
+    Returns:
+        Final position of pivot
+    """
+    buf[pivot_idx], buf[high] = buf[high], buf[pivot_idx]
+    pivot = buf[high]
+
+    sub = buf[low:high]
+    mask = sub <= pivot
+    # Gather (copy) both halves before overwriting the range sub views
+    left_part = sub[mask]
+    right_part = sub[~mask]
+
+    split = low + len(left_part)
+    buf[low:split] = left_part
+    buf[split] = pivot
+    buf[split + 1 : high + 1] = right_part
+    return split
+
+
+def _numpy_buffer(arr: List[Any]) -> Optional["np.ndarray"]:
+    """
+    Copy an all-int or all-float list into an int64/float64 array.
+
+    Returns None when numpy is unavailable, the list is empty, mixes
+    element types, or holds ints outside the int64 range.
+    """
+    if np is None or not arr or type(arr[0]) not in _NUMERIC_TYPES:
+        return None
+    first_type = type(arr[0])
+    if not all(type(x) is first_type for x in arr):
+        return None
+
+    try:
+        return np.array(arr, dtype=np.int64 if first_type is int else np.float64)
+    except OverflowError:
+        return None
+
+
+def _median_of_medians(arr: List[T], low: int, high: int, k: int) -> T:
+    """
+    Deterministic (BFPRT) selection of the k-th smallest in arr[low..high].
+
+    Pivots on the median of the group-of-five medians, which discards a
+    constant fraction of the range each round: O(n) worst case.
+
+    Args:
+        arr: Array to select from (reordered in place)
+        low: Start index
+        high: End index
+        k: Absolute index of desired element (low <= k <= high)
+
+    Returns:
+        k-th smallest element
+    """
+    while high - low >= 5:
+        # Sort each group of five and gather its median at the front
+        num_medians = 0
+        for start in range(low, high + 1, 5):
+            end = min(start + 5, high + 1)
+            arr[start:end] = sorted(arr[start:end])
+            median = start + (end - start - 1) // 2
+            dest = low + num_medians
+            arr[dest], arr[median] = arr[median], arr[dest]
+            num_medians += 1
+
+        pivot = _median_of_medians(
+            arr, low, low + num_medians - 1, low + (num_medians - 1) // 2
+        )
+
+        # Three-way partition so runs of equal keys cannot stall progress
+        lt, i, gt = low, low, high
+        while i <= gt:
+            value = arr[i]
+            if value < pivot:
+                arr[lt], arr[i] = value, arr[lt]
+                lt += 1
+                i += 1
+            elif pivot < value:
+                arr[gt], arr[i] = value, arr[gt]
+                gt -= 1
+            else:
+                i += 1
+
+        if k < lt:
+            high = lt - 1
+        elif k > gt:
+            low = gt + 1
+        else:
+            return pivot
+
+    arr[low : high + 1] = sorted(arr[low : high + 1])
+    return arr[k]
+
+
+def _fr_select(arr: List[T], low: int, high: int, k: int) -> T:
+    """
+    Floyd-Rivest selection of the k-th smallest in arr[low..high].
+
+    On large ranges the pivot is first selected from a small window
+    around rank k, so it lands close to the target and each pass
+    discards most of the range rather than about half.
+
+    Args:
+        arr: Array to select from (reordered in place)
+        low: Start index
+        high: End index
+        k: Absolute index of desired element (low <= k <= high)
+
+    Returns:
+        k-th smallest element
+    """
+    while high > low:
+        if high - low > _FR_SAMPLE_THRESHOLD:
+            # Window sized from a sample of ~n^(2/3) elements, skewed by
+            # sign(i - n/2) towards the side of the range k lies on
+            n = high - low + 1
+            i = k - low + 1
+            z = math.log(n)
+            s = 0.5 * math.exp(2 * z / 3)
+            sd = 0.5 * math.sqrt(z * s * (n - s) / n) * ((2 * i > n) - (2 * i < n))
+            new_low = max(low, int(k - i * s / n + sd))
+            new_high = min(high, int(k + (n - i) * s / n + sd))
+            _fr_select(arr, new_low, new_high, k)
+
+        # Partition arr[low..high] around t = arr[k]. t and the end
+        # element are arranged so the first swap below leaves sentinels
+        # for the inner scans; t finishes at low only if they traded
+        t = arr[k]
+        arr[low], arr[k] = arr[k], arr[low]
+        pivot_at_low = t < arr[high]
+        if pivot_at_low:
+            arr[low], arr[high] = arr[high], arr[low]
+
+        i, j = low, high
+        while i < j:
+            arr[i], arr[j] = arr[j], arr[i]
+            i += 1
+            j -= 1
+            while arr[i] < t:
+                i += 1
+            while t < arr[j]:
+                j -= 1
+
+        if pivot_at_low:
+            arr[low], arr[j] = arr[j], arr[low]
+        else:
+            j += 1
+            arr[j], arr[high] = arr[high], arr[j]
+
+        # Keep the side holding rank k
+        if j <= k:
+            low = j + 1
+        if k <= j:
+            high = j - 1
+
+    return arr[k]
+
 
 class SelectionAlgorithms:
     """Implementation of selection algorithms for finding order statistics."""
@@ -20,7 +259,7 @@ class SelectionAlgorithms:
         """
         Find the k-th smallest element using quickselect algorithm.
 
-        Time: O(n) average case, O(n²) worst case
+        Time: O(n) average case, O(n) worst case (median-of-medians fallback)
         Space: O(1) auxiliary space
         Stable: No
 
@@ -41,35 +280,53 @@ class SelectionAlgorithms:
             raise ValueError(f"k ({k}) must be between 0 and {len(arr) - 1}")
 
         arr_copy = arr.copy()
+        depth_limit = 2 * (len(arr_copy).bit_length() - 1)  # 2 * log2(n)
         return SelectionAlgorithms._quickselect_helper(
-            arr_copy, 0, len(arr_copy) - 1, k
+            arr_copy, 0, len(arr_copy) - 1, k, depth_limit
         )
 
     @staticmethod
-    def _quickselect_helper(arr: List[T], low: int, high: int, k: int) -> T:
-        """Recursive helper for quickselect."""
-        if low == high:
-            return arr[low]
-
-        # Choose pivot using median-of-three
-        pivot_idx = SelectionAlgorithms._choose_pivot_median_of_three(arr, low, high)
-        pivot_idx = SelectionAlgorithms._partition_lomuto(arr, low, high, pivot_idx)
-
-        if pivot_idx == k:
-            return arr[pivot_idx]
-        elif pivot_idx > k:
-            return SelectionAlgorithms._quickselect_helper(arr, low, pivot_idx - 1, k)
-        else:
-            return SelectionAlgorithms._quickselect_helper(arr, pivot_idx + 1, high, k)
+    def _quickselect_helper(
+        arr: List[T], low: int, high: int, k: int, depth_limit: int
+    ) -> T:
+        """
+        Helper for quickselect with an introselect depth limit.
+
+        The tail recursion into the side holding k is written as a loop
+        that narrows [low, high], so no stack frames accumulate.
+        """
+        while low < high:
+            if depth_limit == 0:  # Too many poor pivots - switch to BFPRT
+                return _median_of_medians(arr, low, high, k)
+            depth_limit -= 1
+
+            # Choose pivot using median-of-three
+            pivot_idx = SelectionAlgorithms._choose_pivot_median_of_three(
+                arr, low, high
+            )
+            pivot_idx = SelectionAlgorithms._partition_lomuto(
+                arr, low, high, pivot_idx
+            )
+
+            if pivot_idx == k:
+                return arr[pivot_idx]
+            elif pivot_idx > k:
+                high = pivot_idx - 1
+            else:
+                low = pivot_idx + 1
+
+        return arr[k]
 
     @staticmethod
-    def quickselect_iterative(arr: List[T], k: int) -> T:
+    def quickselect_iterative(arr: List[T], k: int, inplace: bool = False) -> T:
         """
         Iterative version of quickselect.
 
         Args:
             arr: List to select from
             k: Index of desired element (0-based)
+            inplace: Select within arr itself, leaving it partitioned around
+                index k, instead of working on a copy
 
         Returns:
             k-th smallest element
@@ -77,11 +334,26 @@ class SelectionAlgorithms:
         if not 0 <= k < len(arr):
             raise ValueError(f"k ({k}) must be between 0 and {len(arr) - 1}")
 
-        arr_copy = arr.copy()
+        # Numeric input with numpy available: partition in a compiled loop
+        # when numba is installed, otherwise with vectorised masks
+        buf = None if inplace else _numpy_buffer(arr)
+        if buf is not None and _partition_block_nb is not None:
+            arr_copy, partition = buf, _partition_block_nb
+        elif buf is not None:
+            arr_copy, partition = buf, _partition_numpy
+        else:
+            arr_copy = arr if inplace else arr.copy()
+            partition = SelectionAlgorithms._partition_lomuto
         left, right = 0, len(arr_copy) - 1
+        depth_limit = 2 * (len(arr_copy).bit_length() - 1)  # 2 * log2(n)
 
         while left <= right:
-            pivot_idx = SelectionAlgorithms._partition_lomuto(
+            if depth_limit == 0:  # Too many poor pivots - switch to BFPRT
+                result = _median_of_medians(arr_copy, left, right, k)
+                return result if buf is None else result.item()
+            depth_limit -= 1
+
+            pivot_idx = partition(
                 arr_copy,
                 left,
                 right,
@@ -91,7 +363,8 @@ class SelectionAlgorithms:
             )
 
             if pivot_idx == k:
-                return arr_copy[pivot_idx]
+                # Convert NumPy scalars back to the plain Python type
+                return arr_copy[pivot_idx] if buf is None else buf[k].item()
             elif pivot_idx > k:
                 right = pivot_idx - 1
             else:
@@ -121,24 +394,20 @@ class SelectionAlgorithms:
 
     @staticmethod
     def _quickselect_random_helper(arr: List[T], low: int, high: int, k: int) -> T:
-        """Helper for random pivot quickselect."""
-        if low == high:
-            return arr[low]
-
-        # Random pivot
-        pivot_idx = random.randint(low, high)
-        pivot_idx = SelectionAlgorithms._partition_lomuto(arr, low, high, pivot_idx)
-
-        if pivot_idx == k:
-            return arr[pivot_idx]
-        elif pivot_idx > k:
-            return SelectionAlgorithms._quickselect_random_helper(
-                arr, low, pivot_idx - 1, k
-            )
-        else:
-            return SelectionAlgorithms._quickselect_random_helper(
-                arr, pivot_idx + 1, high, k
-            )
+        """Helper for random pivot quickselect, looping instead of recursing."""
+        while low < high:
+            # Random pivot (random() avoids randint's argument checking)
+            pivot_idx = low + int(random.random() * (high - low + 1))
+            pivot_idx = SelectionAlgorithms._partition_lomuto(arr, low, high, pivot_idx)
+
+            if pivot_idx == k:
+                return arr[pivot_idx]
+            elif pivot_idx > k:
+                high = pivot_idx - 1
+            else:
+                low = pivot_idx + 1
+
+        return arr[k]
 
     @staticmethod
     def _partition_lomuto(arr: List[T], low: int, high: int, pivot_idx: int) -> int:
@@ -160,13 +429,19 @@ class SelectionAlgorithms:
 
         i = low - 1
         for j in range(low, high):
-            if arr[j] <= pivot:
+            value = arr[j]  # Index once; reused by the swap
+            if value <= pivot:
                 i += 1
-                arr[i], arr[j] = arr[j], arr[i]
+                arr[i], arr[j] = value, arr[i]
 
         arr[i + 1], arr[high] = arr[high], arr[i + 1]
         return i + 1
 
+    _partition_numpy = staticmethod(_partition_numpy)
+    _numpy_buffer = staticmethod(_numpy_buffer)
+    _median_of_medians = staticmethod(_median_of_medians)
+    _fr_select = staticmethod(_fr_select)
+
     @staticmethod
     def _partition_hoare(arr: List[T], low: int, high: int) -> int:
         """
@@ -213,17 +488,20 @@ class SelectionAlgorithms:
         """
         mid = (low + high) // 2
 
-        # Get values and indices
-        candidates = [(arr[low], low), (arr[mid], mid), (arr[high], high)]
-
-        # Sort by value and return middle element's index
-        candidates.sort(key=lambda x: x[0])
-        return candidates[1][1]  # Index of median
+        # Median of arr[low], arr[mid], arr[high] by direct comparisons
+        a, b, c = arr[low], arr[mid], arr[high]
+        if a < b:
+            if b < c:
+                return mid
+            return high if a < c else low
+        if a < c:
+            return low
+        return high if b < c else mid
 
     @staticmethod
     def _choose_pivot_random(arr: List[T], low: int, high: int) -> int:
         """Choose pivot randomly."""
-        return random.randint(low, high)
+        return low + int(random.random() * (high - low + 1))
 
     @staticmethod
     def find_median(arr: List[T]) -> T:
@@ -240,15 +518,16 @@ class SelectionAlgorithms:
             raise ValueError("Cannot find median of empty array")
 
         n = len(arr)
-        if n % 2 == 1:
-            # Odd length - middle element
-            return SelectionAlgorithms.quickselect(arr, n // 2)
-        else:
-            # Even length - average of two middle elements
-            mid1 = SelectionAlgorithms.quickselect(arr, n // 2 - 1)
-            mid2 = SelectionAlgorithms.quickselect(arr, n // 2)
-            # For simplicity, return the lower median
-            return mid1
+        # Middle element for odd length; for simplicity, the lower median
+        # for even length
+        k = (n - 1) // 2
+
+        buf = _numpy_buffer(arr)
+        if buf is not None:
+            # NumPy's C introselect
+            return np.partition(buf, k)[k].item()
+
+        return _fr_select(arr.copy(), 0, n - 1, k)
 
     @staticmethod
     def find_percentile(arr: List[T], percentile: float) -> T:
@@ -270,7 +549,12 @@ class SelectionAlgorithms:
 
         n = len(arr)
         k = int((percentile / 100) * (n - 1))
-        return SelectionAlgorithms.quickselect(arr, k)
+
+        buf = _numpy_buffer(arr)
+        if buf is not None:
+            return np.partition(buf, k)[k].item()
+
+        return _fr_select(arr.copy(), 0, n - 1, k)
 
     @staticmethod
     def select_top_k(arr: List[T], k: int) -> List[T]:
@@ -289,16 +573,15 @@ class SelectionAlgorithms:
         if k >= len(arr):
             return arr.copy()
 
-        # Use quickselect to find k-th element
-        kth_element = SelectionAlgorithms.quickselect(arr, k - 1)
-
-        # Collect all elements <= k-th element
-        result = [x for x in arr if x <= kth_element]
+        buf = _numpy_buffer(arr)
+        if buf is not None:
+            # After partitioning around index k - 1 the k smallest come first
+            return np.partition(buf, k - 1)[:k].tolist()
 
-        # If we have more than k elements, we need to trim
-        # This is a simplified approach - a full implementation would
-        # use more sophisticated selection
-        return result[:k]
+        # Selecting index k - 1 in place leaves the k smallest in front
+        arr_copy = arr.copy()
+        SelectionAlgorithms.quickselect_iterative(arr_copy, k - 1, inplace=True)
+        return arr_copy[:k]
 
     @staticmethod
     def is_kth_smallest_correct(arr: List[T], k: int, candidate: T) -> bool:
@@ -350,9 +633,8 @@ class SelectionAnalysis:
         for name, func in algorithms:
             times = []
             for _ in range(num_trials):
-                arr_copy = arr.copy()
                 start = time.time()
-                result = func(arr_copy, k)
+                result = func(arr, k)
                 end = time.time()
                 times.append(end - start)
 
@@ -384,15 +666,13 @@ class SelectionAnalysis:
 
         for _ in range(num_trials):
             # Test random pivot
-            arr_copy = arr.copy()
             start = time.time()
-            SelectionAlgorithms.quickselect_random_pivot(arr_copy, k)
+            SelectionAlgorithms.quickselect_random_pivot(arr, k)
             results["random_pivot"].append(time.time() - start)
 
             # Test median of three
-            arr_copy = arr.copy()
             start = time.time()
-            SelectionAlgorithms.quickselect(arr_copy, k)
+            SelectionAlgorithms.quickselect(arr, k)
             results["median_of_three"].append(time.time() - start)
 
         # Calculate statistics
@@ -431,7 +711,7 @@ class SelectionAnalysis:
         ]
 
         for func in algorithms:
-            result = func(arr.copy(), k)
+            result = func(arr, k)
             if result != expected:
                 return False
 
@@ -9,6 +9,7 @@ import sys
 import os
 import random
 import time
+import unittest
 
 # Add chapter code directory to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,6 +17,8 @@ code_dir = os.path.join(current_dir, "..", "code")
 sys.path.insert(0, code_dir)
 
 from selection_algorithms import SelectionAlgorithms, SelectionAnalysis
+from selection_algorithms import _partition_block_nb, np
+from quickselect import QuickSelect
 
 
 class TestQuickselect:
@@ -87,6 +90,35 @@ class TestQuickselect:
             result = SelectionAlgorithms.quickselect_iterative(arr, k)
             assert result == expected_sorted[k]
 
+    def test_quickselect_iterative_numeric_types(self):
+        """Test iterative quickselect keeps element types on numeric input."""
+        for arr in (
+            [random.randint(-500, 500) for _ in range(200)],
+            [random.random() for _ in range(200)],
+            [3, 1.5, 2, 0.5],
+            [2**70, 1, -(2**70)],
+        ):
+            expected_sorted = sorted(arr)
+            for k in (0, len(arr) // 2, len(arr) - 1):
+                result = SelectionAlgorithms.quickselect_iterative(arr, k)
+                assert result == expected_sorted[k]
+                assert type(result) is type(expected_sorted[k])
+
+    def test_quickselect_iterative_inplace(self):
+        """Test inplace selection partitions the caller's list around k."""
+        arr = [random.randint(0, 100) for _ in range(200)]
+        original = arr.copy()
+        expected_sorted = sorted(arr)
+
+        assert SelectionAlgorithms.quickselect_iterative(arr, 50) == expected_sorted[50]
+        assert arr == original  # Default leaves the input untouched
+
+        result = SelectionAlgorithms.quickselect_iterative(arr, 50, inplace=True)
+        assert result == expected_sorted[50] == arr[50]
+        assert all(x <= result for x in arr[:50])
+        assert all(x >= result for x in arr[51:])
+        assert sorted(arr) == expected_sorted
+
     def test_quickselect_random_pivot(self):
         """Test quickselect with random pivot."""
         arr = [3, 1, 4, 1, 5, 9, 2, 6]
@@ -106,6 +138,23 @@ class TestQuickselect:
             result = SelectionAlgorithms.quickselect(arr, k)
             assert result == expected_sorted[k]
 
+    def test_quickselect_depth_limit_fallback(self):
+        """Test degenerate input is finished by median-of-medians."""
+        # Lomuto puts every duplicate left of the pivot, so without the
+        # depth limit this would recurse once per element
+        arr = [7] * 5000 + [3, 9]
+        assert SelectionAlgorithms.quickselect(arr, 0) == 3
+        assert SelectionAlgorithms.quickselect(arr, 2500) == 7
+        assert SelectionAlgorithms.quickselect_iterative(arr, 5001) == 9
+
+        arr = [random.randint(0, 50) for _ in range(500)]
+        expected_sorted = sorted(arr)
+        for k in (0, 123, 250, 499):
+            result = SelectionAlgorithms._median_of_medians(
+                arr.copy(), 0, len(arr) - 1, k
+            )
+            assert result == expected_sorted[k]
+
     def test_quickselect_error_handling(self):
         """Test error handling for invalid k values."""
         arr = [1, 2, 3, 4, 5]
@@ -157,6 +206,17 @@ class TestQuickselect:
         assert SelectionAlgorithms.find_percentile(arr, 50) == 50  # Median
         assert SelectionAlgorithms.find_percentile(arr, 100) == 100  # 100th percentile
 
+    def test_floyd_rivest_sampling(self):
+        """Test median/percentile on ranges large enough to be sampled."""
+        # Strings stay on the Floyd-Rivest path even when NumPy is installed
+        arr = [f"{random.randint(0, 300):03d}" for _ in range(3001)]
+        expected_sorted = sorted(arr)
+
+        assert SelectionAlgorithms.find_median(arr) == expected_sorted[1500]
+        for p in (0, 10, 75, 99, 100):
+            k = int((p / 100) * (len(arr) - 1))
+            assert SelectionAlgorithms.find_percentile(arr, p) == expected_sorted[k]
+
     def test_percentile_error_handling(self):
         """Test percentile error handling."""
         arr = [1, 2, 3]
@@ -196,6 +256,7 @@ class TestQuickselect:
             # All elements in result should be <= k-th smallest
             kth_smallest = sorted_arr[k - 1]
             assert all(x <= kth_smallest for x in result)
+            assert sorted(result) == sorted_arr[:k]
 
     def test_select_top_k_edge_cases(self):
         """Test select_top_k edge cases."""
@@ -209,6 +270,24 @@ class TestQuickselect:
         result = SelectionAlgorithms.select_top_k(arr, 10)
         assert result == arr
 
+    def test_order_statistics_numeric_types(self):
+        """Test median, percentile and top-k return plain Python values."""
+        arr = [random.randint(-500, 500) for _ in range(201)]
+        expected_sorted = sorted(arr)
+
+        median = SelectionAlgorithms.find_median(arr)
+        assert median == expected_sorted[100]
+        assert type(median) is int
+
+        p90 = SelectionAlgorithms.find_percentile(arr, 90)
+        assert p90 == expected_sorted[180]
+        assert type(p90) is int
+
+        top = SelectionAlgorithms.select_top_k(arr, 10)
+        assert isinstance(top, list)
+        assert sorted(top) == expected_sorted[:10]
+        assert all(type(x) is int for x in top)
+
     def test_floating_point_arrays(self):
         """Test selection on floating point arrays."""
         arr = [3.14, 1.41, 2.71, 1.73, 0.58, 9.97, 2.65, 6]
@@ -287,6 +366,43 @@ class TestPartitionSchemes:
         # All original elements should still be present
         assert sorted(arr) == sorted(original)
 
+    @staticmethod
+    def _check_against_lomuto(partition):
+        """Compare a NumPy-buffer partition with Lomuto on large ranges."""
+        rng = random.Random(14)
+        # Few distinct values force long runs of keys equal to the pivot
+        for n, max_value in ((1000, 3), (1500, 50), (4096, 10**6)):
+            values = [rng.randint(0, max_value) for _ in range(n)]
+            for low, high in ((0, n - 1), (5, n - 9)):
+                pivot_idx = rng.randint(low, high)
+                expected = values.copy()
+                split = SelectionAlgorithms._partition_lomuto(
+                    expected, low, high, pivot_idx
+                )
+
+                buf = np.array(values, dtype=np.int64)
+                assert partition(buf, low, high, pivot_idx) == split
+                result = buf.tolist()
+
+                # Same split, same pivot, same elements on each side
+                assert result[:low] == expected[:low]
+                assert result[high + 1 :] == expected[high + 1 :]
+                assert result[split] == expected[split]
+                assert sorted(result[low:split]) == sorted(expected[low:split])
+                assert sorted(result[split + 1 : high + 1]) == sorted(
+                    expected[split + 1 : high + 1]
+                )
+
+    @unittest.skipUnless(np is not None, "numpy is not installed")
+    def test_numpy_partition_matches_lomuto(self):
+        """Test the NumPy mask partition against Lomuto."""
+        self._check_against_lomuto(SelectionAlgorithms._partition_numpy)
+
+    @unittest.skipUnless(_partition_block_nb is not None, "numba is not installed")
+    def test_block_partition_matches_lomuto(self):
+        """Test the numba block partition against Lomuto."""
+        self._check_against_lomuto(_partition_block_nb)
+
 
 class TestPivotSelection:
     """Test pivot selection strategies."""
@@ -380,6 +496,71 @@ class TestSelectionAnalysis:
         assert isinstance(result, bool)
 
 
+class TestQuickSelectModule:
+    """Test the QuickSelect class in quickselect.py."""
+
+    def test_selection_variants(self):
+        """Test recursive, iterative and randomized selection."""
+        arr = [random.randint(0, 100) for _ in range(300)]
+        expected_sorted = sorted(arr)
+
+        for select in (
+            QuickSelect.quickselect_recursive,
+            QuickSelect.quickselect_iterative,
+            QuickSelect.quickselect_randomized,
+        ):
+            for k in (0, 1, 150, 298, 299):
+                assert select(arr, k) == expected_sorted[k]
+
+    def test_depth_limit_fallback(self):
+        """Test degenerate input is finished by median-of-medians."""
+        arr = [7] * 5000 + [3, 9]
+        assert QuickSelect.quickselect_recursive(arr, 0) == 3
+        assert QuickSelect.quickselect_recursive(arr, 2500) == 7
+        assert QuickSelect.quickselect_iterative(arr, 5001) == 9
+
+    def test_iterative_inplace(self):
+        """Test inplace selection partitions the caller's list around k."""
+        arr = [random.randint(0, 100) for _ in range(200)]
+        original = arr.copy()
+        expected_sorted = sorted(arr)
+
+        assert QuickSelect.quickselect_iterative(arr, 120) == expected_sorted[120]
+        assert arr == original
+
+        result = QuickSelect.quickselect_iterative(arr, 120, inplace=True)
+        assert result == expected_sorted[120] == arr[120]
+        assert all(x <= result for x in arr[:120])
+        assert all(x >= result for x in arr[121:])
+
+    def test_order_statistics(self):
+        """Test median, percentile, k-th largest and top-k helpers."""
+        # Strings take the Floyd-Rivest path; ints take NumPy when installed
+        for arr in (
+            [f"{random.randint(0, 300):03d}" for _ in range(3001)],
+            [random.randint(-500, 500) for _ in range(3001)],
+        ):
+            expected_sorted = sorted(arr)
+            n = len(arr)
+
+            median = QuickSelect.find_median(arr)
+            assert median == expected_sorted[(n - 1) // 2]
+            assert type(median) is type(expected_sorted[0])
+
+            for p in (0, 25, 90, 100):
+                k = int((p / 100) * (n - 1))
+                assert QuickSelect.find_percentile(arr, p) == expected_sorted[k]
+
+            assert QuickSelect.find_kth_largest(arr, 1) == expected_sorted[-1]
+            assert QuickSelect.find_kth_largest(arr, 10) == expected_sorted[-10]
+
+            top = QuickSelect.select_top_k(arr, 25)
+            assert isinstance(top, list)
+            assert sorted(top) == expected_sorted[:25]
+
+        assert QuickSelect.find_median([1, 2, 3, 4]) == 2  # Lower median
+
+
 def run_test_class(test_class):
     """Run all test methods in a test class."""
     test_instance = test_class()
@@ -392,6 +573,8 @@ def run_test_class(test_class):
     for test_method in test_methods:
         try:
             getattr(test_instance, test_method)()
+        except unittest.SkipTest as e:
+            print(f"- {test_class.__name__}.{test_method} skipped: {e}")
         except Exception as e:
             print(f"✗ {test_class.__name__}.{test_method}: {e}")
             return False
@@ -409,6 +592,7 @@ def run_all_tests():
         TestPartitionSchemes,
         TestPivotSelection,
         TestSelectionAnalysis,
+        TestQuickSelectModule,
     ]
 
     for test_class in test_classes:
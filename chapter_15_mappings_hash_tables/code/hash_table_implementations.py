@@ -5,8 +5,154 @@ This module implements hash tables with various collision resolution strategies,
 hash functions, and performance analysis tools.
 """
 
-from typing import List, Dict, Optional, Tuple, Any, Union
+from typing import (
+    List,
+    Dict,
+    Optional,
+    Tuple,
+    Any,
+    Union,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from array import array
+from collections import Counter
+from functools import partial
+from itertools import chain, compress, filterfalse, repeat
 import math
+import operator
+
+try:
+    import xxhash  # Optional: C/SIMD XXH3 string hashing
+except ImportError:
+    xxhash = None
+
+try:
+    import numpy as np  # Optional: vectorised slot tallies
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # Optional: JIT-compiled byte loops and int probing
+except ImportError:
+    njit = None
+
+_MASK64 = (1 << 64) - 1  # Emulates unsigned 64-bit overflow
+_DJB2_POWERS = tuple(33**i for i in range(1, 9))  # 33**1 .. 33**8
+_A_FIXED = 0x9E3779B97F4A7C15  # (√5 - 1) / 2 as a 64-bit fixed-point fraction
+
+# Slot markers of HashTableOpenAddressingInt (the two smallest int64 values)
+_INT_EMPTY_KEY = -(1 << 63)
+_INT_DELETED_KEY = _INT_EMPTY_KEY + 1
+
+if njit is not None:
+    # uint64 arithmetic wraps on overflow, matching the & _MASK64 of the
+    # pure-Python versions, and the constants are folded at compile time
+    _DJB2_SEED = np.uint64(5381)
+    _DJB2_MULTIPLIER = np.uint64(33)
+    _FNV_OFFSET = np.uint64(14695981039346656037)
+    _FNV_PRIME = np.uint64(0x100000001B3)
+
+    @njit(cache=True)
+    def _djb2_bytes(data):
+        hash_val = _DJB2_SEED
+        for byte in data:
+            hash_val = hash_val * _DJB2_MULTIPLIER + np.uint64(byte)
+        return hash_val
+
+    @njit(cache=True)
+    def _fnv1a_bytes(data):
+        hash_val = _FNV_OFFSET
+        for byte in data:
+            hash_val = (hash_val ^ np.uint64(byte)) * _FNV_PRIME
+        return hash_val
+
+    _A_FIXED_U64 = np.uint64(_A_FIXED)
+
+    @njit(cache=True)
+    def _int_find_slot_nb(keys, key, shift):
+        # Linear probe from the Fibonacci home slot. Returns the slot of key
+        # if present, else ~slot of the insertion slot (first tombstone
+        # before the empty slot), or ~size if the table has no free slot
+        mask = keys.size - 1
+        slot = np.int64((np.uint64(key) * _A_FIXED_U64) >> np.uint64(shift))
+        deleted_slot = -1
+        for _ in range(keys.size):
+            stored = keys[slot]
+            if stored == key:
+                return slot
+            if stored == _INT_EMPTY_KEY:
+                return ~(deleted_slot if deleted_slot != -1 else slot)
+            if stored == _INT_DELETED_KEY and deleted_slot == -1:
+                deleted_slot = slot
+            slot = (slot + 1) & mask
+        return ~(deleted_slot if deleted_slot != -1 else keys.size)
+
+    @njit(cache=True)
+    def _int_insert_nb(keys, key, shift):
+        # Store key if absent. Returns its slot, plus size if the key is new
+        # and 2 * size if it also took a tombstone; -1 if no slot is free
+        code = _int_find_slot_nb(keys, key, shift)
+        if code >= 0:
+            return code
+        slot = ~code
+        if slot == keys.size:
+            return -1
+        reused = keys[slot] == _INT_DELETED_KEY
+        keys[slot] = key
+        return slot + (2 if reused else 1) * keys.size
+
+    @njit(cache=True)
+    def _int_rehash_nb(old_keys, keys, shift):
+        # Move live keys into the empty table keys; returns the new slot of
+        # each old slot, -1 for empty and deleted ones
+        mask = keys.size - 1
+        targets = np.full(old_keys.size, -1, dtype=np.int64)
+        for old_slot in range(old_keys.size):
+            key = old_keys[old_slot]
+            if key > _INT_DELETED_KEY:
+                slot = np.int64((np.uint64(key) * _A_FIXED_U64) >> np.uint64(shift))
+                while keys[slot] != _INT_EMPTY_KEY:
+                    slot = (slot + 1) & mask
+                keys[slot] = key
+                targets[old_slot] = slot
+        return targets
+
+    @njit(cache=True)
+    def _int_put_many_nb(keys, batch, shift):
+        # Store every key of batch; returns (slots, inserted, reused) where
+        # slots[i] is the slot of batch[i] (-1 from the first key that found
+        # no free slot on), inserted counts new keys and reused the
+        # tombstones they took
+        slots = np.full(batch.size, -1, dtype=np.int64)
+        inserted = reused = 0
+        for i in range(batch.size):
+            key = batch[i]
+            code = _int_insert_nb(keys, key, shift)
+            if code == -1:
+                break
+            if code >= keys.size:
+                inserted += 1
+                if code >= 2 * keys.size:
+                    reused += 1
+                code %= keys.size
+            slots[i] = code
+        return slots, inserted, reused
+
+else:
+    _djb2_bytes = _fnv1a_bytes = None
+    _int_find_slot_nb = _int_insert_nb = _int_rehash_nb = _int_put_many_nb = None
+
+# bytes.translate table mapping an open-addressing slot state to 1 if the
+# slot is occupied (state 1) and 0 otherwise
+_OCCUPIED_MASK_TABLE = bytes(1 if state == 1 else 0 for state in range(256))
+
+
+def _next_power_of_two(n: int) -> int:
+    """Smallest power of two >= n (and >= 1)."""
+    return 1 << max(n - 1, 0).bit_length()
 
 
 class HashFunction:
@@ -15,15 +161,23 @@ class HashFunction:
     @staticmethod
     def division_hash(key: Any, table_size: int) -> int:
         """Division method: key mod table_size."""
+        mask = table_size - 1
+        if table_size > 0 and table_size & mask == 0:
+            # Power-of-two size: the modulo is just the low bits
+            return hash(key) & mask
         return hash(key) % table_size
 
     @staticmethod
     def multiplication_hash(key: Any, table_size: int) -> int:
-        """Multiplication method with golden ratio constant."""
-        A = 0.6180339887  # (√5 - 1) / 2
-        hash_val = hash(key)
-        fractional_part = (hash_val * A) % 1
-        return int(table_size * fractional_part)
+        """
+        Multiplication method with golden ratio constant.
+
+        Computes floor(m * frac(k * A)) in 64-bit fixed point: the low 64
+        bits of k * A_FIXED are the fractional part, and multiplying by m
+        and shifting right 64 bits scales it to [0, m).
+        """
+        fractional_part = ((hash(key) & _MASK64) * _A_FIXED) & _MASK64
+        return (fractional_part * table_size) >> 64
 
     @staticmethod
     def universal_hash(
@@ -37,29 +191,86 @@ class HashFunction:
         return ((a * key_hash + b) % p) % table_size
 
     @staticmethod
-    def djb2_hash(key: str) -> int:
-        """DJB2 string hash function."""
+    def djb2_hash(key: Union[str, bytes]) -> int:
+        """
+        DJB2 string hash function (64-bit).
+
+        Consumes the UTF-8 bytes eight at a time using the identity
+        h * 33**8 + b0 * 33**7 + ... + b7, which equals eight single-byte
+        steps of h = h * 33 + b. With numba installed the byte loop runs
+        as compiled code instead.
+
+        Pre-encoded ``bytes`` keys are hashed as-is, skipping the encode.
+        """
+        data = key if isinstance(key, (bytes, bytearray)) else key.encode("utf-8")
+        if _djb2_bytes is not None:
+            return int(_djb2_bytes(np.frombuffer(data, dtype=np.uint8)))
+
+        p1, p2, p3, p4, p5, p6, p7, p8 = _DJB2_POWERS
         hash_val = 5381
-        for char in key:
-            hash_val = ((hash_val << 5) + hash_val) + ord(char)  # hash * 33 + char
+
+        block_end = len(data) - len(data) % 8
+        for i in range(0, block_end, 8):
+            b0, b1, b2, b3, b4, b5, b6, b7 = data[i : i + 8]
+            hash_val = (
+                hash_val * p8
+                + b0 * p7
+                + b1 * p6
+                + b2 * p5
+                + b3 * p4
+                + b4 * p3
+                + b5 * p2
+                + b6 * p1
+                + b7
+            ) & _MASK64
+
+        for byte in data[block_end:]:
+            hash_val = (hash_val * 33 + byte) & _MASK64  # hash * 33 + byte
         return hash_val
 
     @staticmethod
-    def fnv1a_hash(key: str) -> int:
-        """FNV-1a hash function."""
+    def fnv1a_hash(key: Union[str, bytes]) -> int:
+        """FNV-1a hash function (64-bit, compiled with numba if installed).
+
+        Pre-encoded ``bytes`` keys are hashed as-is, skipping the encode.
+        """
+        data = key if isinstance(key, (bytes, bytearray)) else key.encode("utf-8")
+        if _fnv1a_bytes is not None:
+            return int(_fnv1a_bytes(np.frombuffer(data, dtype=np.uint8)))
+
         hash_val = 14695981039346656037  # FNV offset basis
         fnv_prime = 1099511628211  # FNV prime
 
-        for byte in key.encode("utf-8"):
-            hash_val ^= byte
-            hash_val *= fnv_prime
+        # Masking each step keeps the state a fixed-size int instead of a
+        # bignum that grows with every byte
+        for byte in data:
+            hash_val = ((hash_val ^ byte) * fnv_prime) & _MASK64
 
         return hash_val
 
+    @staticmethod
+    def fast_string_hash(key: str) -> int:
+        """
+        Built-in string hash (CPython's SipHash, implemented in C).
+
+        Prefer this (or xxh3_hash) over djb2_hash/fnv1a_hash for
+        benchmarks; the latter are educational Python-level loops.
+        """
+        return hash(key)
+
+    @staticmethod
+    def xxh3_hash(key: str) -> int:
+        """XXH3 64-bit hash from the optional xxhash package."""
+        if xxhash is None:
+            raise ImportError("xxh3_hash requires the 'xxhash' package")
+        return xxhash.xxh3_64_intdigest(key)
+
 
 class HashTableEntry:
     """Represents a key-value entry in the hash table."""
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key: Any, value: Any):
         self.key = key
         self.value = value
@@ -69,105 +280,241 @@ class HashTableEntry:
 
 
 class HashTableSeparateChaining:
-    """Hash table using separate chaining for collision resolution."""
+    """Hash table using separate chaining for collision resolution.
+
+    Each chain is stored as two parallel lists (structure of arrays):
+    ``table[i]`` holds the keys of bucket i and ``value_table[i]`` the
+    matching values, so no per-entry object is allocated and key lookups
+    run as C-level list scans.
+
+    With ``key_type="int"`` or ``"float"`` the key buckets are packed
+    ``array.array`` objects (8 bytes per key instead of a boxed object),
+    and only keys of that type are accepted.
+
+    The table size is always a power of two (``initial_size`` is rounded
+    up), so with the default division hash the bucket index is computed as
+    ``hash(key) & (size - 1)`` instead of a modulo.
+    """
+
+    KEY_TYPECODES = {"int": "q", "float": "d"}
+
+    __slots__ = (
+        "size",
+        "_mask",
+        "key_type",
+        "_new_bucket",
+        "table",
+        "value_table",
+        "count",
+        "load_factor_threshold",
+        "hash_function",
+        "_mask_hash",
+    )
+
+    def __init__(
+        self,
+        initial_size: int = 16,
+        load_factor_threshold: float = 0.75,
+        hash_function: Callable[[Any, int], int] = HashFunction.division_hash,
+        key_type: Optional[str] = None,
+    ):
+        if key_type is None:
+            self._new_bucket = list
+        elif key_type in self.KEY_TYPECODES:
+            self._new_bucket = partial(array, self.KEY_TYPECODES[key_type])
+        else:
+            raise ValueError(f"Unsupported key_type: {key_type!r}")
 
-    def __init__(self, initial_size: int = 16, load_factor_threshold: float = 0.75):
-        self.size = initial_size
-        self.table: List[List[HashTableEntry]] = [[] for _ in range(initial_size)]
+        self.size = _next_power_of_two(initial_size)
+        self._mask = self.size - 1
+        self.key_type = key_type
+        self.table: List[List[Any]] = [self._new_bucket() for _ in range(self.size)]
+        self.value_table: List[List[Any]] = [[] for _ in range(self.size)]
         self.count = 0
         self.load_factor_threshold = load_factor_threshold
-        self.hash_function = HashFunction.division_hash
+        self.hash_function = hash_function
+        # hash(key) % size == hash(key) & mask for power-of-two sizes
+        self._mask_hash = hash_function is HashFunction.division_hash
 
     def _hash(self, key: Any) -> int:
-        """Compute hash index for a key."""
+        """Compute hash index for a key.
+
+        Hot paths inline this to skip the extra frame.
+        """
+        if self._mask_hash:
+            return hash(key) & self._mask
         return self.hash_function(key, self.size)
 
     def _resize(self, new_size: int) -> None:
         """Resize the hash table to a new size."""
+        assert new_size & (new_size - 1) == 0, "table size must be a power of two"
         old_table = self.table
+        old_value_table = self.value_table
         self.size = new_size
-        self.table = [[] for _ in range(new_size)]
-        self.count = 0
-
-        # Rehash all entries
-        for bucket in old_table:
-            for entry in bucket:
-                self.put(entry.key, entry.value)
+        self._mask = mask = new_size - 1
+        self.table = [self._new_bucket() for _ in range(new_size)]
+        self.value_table = [[] for _ in range(new_size)]
+
+        # Rehash all entries straight into their new buckets: keys are already
+        # unique, so put()'s load check and duplicate scan are skipped and
+        # count stays the same
+        table = self.table
+        value_table = self.value_table
+        hash_function = self.hash_function
+        mask_hash = self._mask_hash
+        for bucket, values in zip(old_table, old_value_table):
+            for key, value in zip(bucket, values):
+                index = hash(key) & mask if mask_hash else hash_function(key, new_size)
+                table[index].append(key)
+                value_table[index].append(value)
 
     def put(self, key: Any, value: Any) -> None:
         """Insert or update a key-value pair."""
         if self.count / self.size > self.load_factor_threshold:
             self._resize(self.size * 2)
 
-        index = self._hash(key)
+        if self._mask_hash:
+            index = hash(key) & self._mask
+        else:
+            index = self.hash_function(key, self.size)
         bucket = self.table[index]
 
         # Check if key already exists
-        for entry in bucket:
-            if entry.key == key:
-                entry.value = value
-                return
+        if key in bucket:
+            self.value_table[index][bucket.index(key)] = value
+            return
 
         # Key not found, add new entry
-        bucket.append(HashTableEntry(key, value))
+        bucket.append(key)
+        self.value_table[index].append(value)
         self.count += 1
 
+    def _reserve(self, capacity: int) -> None:
+        """Grow once so that ``capacity`` entries fit under the load threshold."""
+        new_size = self.size
+        while capacity / new_size > self.load_factor_threshold:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
+
+    def put_many(self, keys: Sequence[Any], values: Sequence[Any]) -> None:
+        """Insert or update many key-value pairs.
+
+        The table is grown at most once up front, and every bucket index is
+        computed in one pass before the buckets are updated.
+        """
+        self._reserve(self.count + len(keys))
+
+        if self._mask_hash:
+            mask = self._mask
+            indices = [h & mask for h in map(hash, keys)]
+        else:
+            indices = list(map(self.hash_function, keys, repeat(self.size)))
+
+        table = self.table
+        value_table = self.value_table
+        for index, key, value in zip(indices, keys, values):
+            bucket = table[index]
+            if key in bucket:
+                value_table[index][bucket.index(key)] = value
+            else:
+                # Counted per entry so a batch that fails partway (e.g. a
+                # key a packed bucket rejects) leaves count consistent
+                bucket.append(key)
+                value_table[index].append(value)
+                self.count += 1
+
     def get(self, key: Any) -> Any:
         """Retrieve the value for a given key."""
-        index = self._hash(key)
-        bucket = self.table[index]
+        if self._mask_hash:
+            index = hash(key) & self._mask
+        else:
+            index = self.hash_function(key, self.size)
+        # list.index scans the chain in C and tries identity before __eq__,
+        # so non-matching entries are skipped without a Python-level compare;
+        # a single scan serves both the membership test and the position
+        try:
+            position = self.table[index].index(key)
+        except ValueError:
+            raise KeyError(f"Key '{key}' not found") from None
+        return self.value_table[index][position]
 
-        for entry in bucket:
-            if entry.key == key:
-                return entry.value
+    def _get_by_prehash(self, key: Any, key_hash: int) -> Any:
+        """get() for a caller that already holds ``hash(key)``.
 
-        raise KeyError(f"Key '{key}' not found")
+        Only the default division hash maps straight from ``hash(key)``;
+        with a custom hash function the index is computed as usual.
+        """
+        if self._mask_hash:
+            index = key_hash & self._mask
+        else:
+            index = self.hash_function(key, self.size)
+        try:
+            position = self.table[index].index(key)
+        except ValueError:
+            raise KeyError(f"Key '{key}' not found") from None
+        return self.value_table[index][position]
 
     def remove(self, key: Any) -> Any:
         """Remove and return the value for a given key."""
-        index = self._hash(key)
+        if self._mask_hash:
+            index = hash(key) & self._mask
+        else:
+            index = self.hash_function(key, self.size)
         bucket = self.table[index]
 
-        for i, entry in enumerate(bucket):
-            if entry.key == key:
-                removed_value = entry.value
-                bucket.pop(i)
-                self.count -= 1
-                return removed_value
+        try:
+            position = bucket.index(key)
+        except ValueError:
+            raise KeyError(f"Key '{key}' not found") from None
+        bucket.pop(position)
+        self.count -= 1
+        return self.value_table[index].pop(position)
+
+    def get_or(self, key: Any, default: Any = None) -> Any:
+        """Retrieve the value for a key, or ``default`` if it is absent."""
+        if self._mask_hash:
+            index = hash(key) & self._mask
+        else:
+            index = self.hash_function(key, self.size)
+        bucket = self.table[index]
 
-        raise KeyError(f"Key '{key}' not found")
+        if key in bucket:
+            return self.value_table[index][bucket.index(key)]
+        return default
 
     def contains(self, key: Any) -> bool:
         """Check if a key exists in the hash table."""
-        try:
-            self.get(key)
-            return True
-        except KeyError:
-            return False
+        # A plain membership test avoids raising KeyError for missing keys
+        if self._mask_hash:
+            return key in self.table[hash(key) & self._mask]
+        return key in self.table[self.hash_function(key, self.size)]
+
+    def iter_keys(self) -> Iterator[Any]:
+        """Iterate over all keys without building a list."""
+        return chain.from_iterable(self.table)
+
+    def iter_values(self) -> Iterator[Any]:
+        """Iterate over all values without building a list."""
+        return chain.from_iterable(self.value_table)
+
+    def iter_items(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate over all key-value pairs without building a list."""
+        # Key and value buckets are parallel, so flattening both keeps
+        # each key aligned with its value
+        return zip(self.iter_keys(), self.iter_values())
 
     def keys(self) -> List[Any]:
         """Return all keys in the hash table."""
-        result = []
-        for bucket in self.table:
-            for entry in bucket:
-                result.append(entry.key)
-        return result
+        return list(self.iter_keys())
 
     def values(self) -> List[Any]:
         """Return all values in the hash table."""
-        result = []
-        for bucket in self.table:
-            for entry in bucket:
-                result.append(entry.value)
-        return result
+        return list(self.iter_values())
 
     def items(self) -> List[Tuple[Any, Any]]:
         """Return all key-value pairs in the hash table."""
-        result = []
-        for bucket in self.table:
-            for entry in bucket:
-                result.append((entry.key, entry.value))
-        return result
+        return list(self.iter_items())
 
     def get_load_factor(self) -> float:
         """Calculate the current load factor."""
@@ -175,12 +522,13 @@ class HashTableSeparateChaining:
 
     def get_max_chain_length(self) -> int:
         """Get the length of the longest chain."""
-        return max(len(bucket) for bucket in self.table) if self.table else 0
+        return max(map(len, self.table), default=0)
 
     def get_avg_chain_length(self) -> float:
         """Get the average chain length."""
-        total_chains = sum(len(bucket) for bucket in self.table)
-        return total_chains / self.size if self.size > 0 else 0
+        # Every entry sits in exactly one chain, so the chain lengths sum
+        # to count
+        return self.count / self.size if self.size > 0 else 0
 
     def __len__(self) -> int:
         """Return the number of key-value pairs."""
@@ -192,206 +540,299 @@ class HashTableSeparateChaining:
 
 
 class HashTableOpenAddressing:
-    """Hash table using open addressing for collision resolution."""
-
-    class Entry:
-        """Entry that can be a key-value pair, None (empty), or DELETED."""
-
-        def __init__(self, key: Any = None, value: Any = None):
-            self.key = key
-            self.value = value
-
-        @property
-        def is_empty(self) -> bool:
-            return self.key is None and self.value is None
-
-        @property
-        def is_deleted(self) -> bool:
-            return self.key == "__DELETED__"
-
-        def __repr__(self):
-            if self.is_empty:
-                return "EMPTY"
-            elif self.is_deleted:
-                return "DELETED"
-            else:
-                return f"Entry({self.key}: {self.value})"
-
-    def __init__(self, initial_size: int = 16, load_factor_threshold: float = 0.75):
-        self.size = initial_size
-        self.table: List[HashTableOpenAddressing.Entry] = [
-            HashTableOpenAddressing.Entry() for _ in range(initial_size)
-        ]
+    """Hash table using open addressing for collision resolution.
+
+    Slots are stored as parallel arrays: ``_keys`` and ``_values`` hold the
+    entries and ``_state`` holds one byte per slot (EMPTY, OCCUPIED or
+    DELETED), so probing reads bytes instead of entry objects.
+
+    Collisions are resolved by quadratic probing with triangular numbers,
+    slot = (home + i(i+1)/2) & (size - 1). As in HashTableSeparateChaining
+    the size is always a power of two, for which this sequence visits
+    every slot exactly once before repeating.
+
+    With ``key_type="int"`` or ``"float"`` the key slots are a packed
+    ``array.array`` (8 bytes per slot instead of a boxed object), and only
+    keys of that type are accepted.
+    """
+
+    EMPTY = 0
+    OCCUPIED = 1
+    DELETED = 2
+
+    KEY_TYPECODES = HashTableSeparateChaining.KEY_TYPECODES
+
+    __slots__ = (
+        "size",
+        "_mask",
+        "key_type",
+        "_vacant_key",
+        "_keys",
+        "_values",
+        "_state",
+        "count",
+        "deleted_count",
+        "_total_probes",
+        "load_factor_threshold",
+        "hash_function",
+        "_mask_hash",
+    )
+
+    def __init__(
+        self,
+        initial_size: int = 16,
+        load_factor_threshold: float = 0.75,
+        hash_function: Callable[[Any, int], int] = HashFunction.division_hash,
+        key_type: Optional[str] = None,
+    ):
+        if key_type is not None and key_type not in self.KEY_TYPECODES:
+            raise ValueError(f"Unsupported key_type: {key_type!r}")
+
+        self.size = _next_power_of_two(initial_size)
+        self._mask = self.size - 1
+        self.key_type = key_type
+        # Filler for unused key slots; packed arrays cannot hold None
+        self._vacant_key = None if key_type is None else 0
+        self._keys = self._new_keys(self.size)
+        self._values: List[Any] = [None] * self.size
+        self._state = bytearray(self.size)
         self.count = 0
         self.deleted_count = 0
+        # Sum of probe lengths of all stored keys, for get_avg_probe_length
+        self._total_probes = 0
         self.load_factor_threshold = load_factor_threshold
-        self.hash_function = HashFunction.division_hash
+        self.hash_function = hash_function
+        # hash(key) % size == hash(key) & mask for power-of-two sizes
+        self._mask_hash = hash_function is HashFunction.division_hash
+
+    def _new_keys(self, size: int) -> Union[List[Any], array]:
+        """Key slot array for ``size`` slots, packed when key_type is set."""
+        if self.key_type is None:
+            return [None] * size
+        return array(self.KEY_TYPECODES[self.key_type], [0]) * size
 
     def _hash(self, key: Any) -> int:
-        """Compute primary hash index."""
-        return self.hash_function(key, self.size)
+        """Compute primary hash index.
 
-    def _probe_linear(self, index: int, attempt: int) -> int:
-        """Linear probing: next = (index + attempt) % size."""
-        return (index + attempt) % self.size
+        Hot paths inline this to skip the extra frame.
+        """
+        if self._mask_hash:
+            return hash(key) & self._mask
+        return self.hash_function(key, self.size)
 
     def _probe_quadratic(self, index: int, attempt: int) -> int:
-        """Quadratic probing: next = (index + attempt²) % size."""
-        return (index + attempt * attempt) % self.size
-
-    def _probe_double_hash(self, key: Any, index: int, attempt: int) -> int:
-        """Double hashing: uses a second hash function."""
-        h2 = HashFunction.multiplication_hash(key, self.size - 1) + 1  # Ensure h2 != 0
-        return (index + attempt * h2) % self.size
+        """Quadratic probing: next = (index + attempt(attempt+1)/2) mod size."""
+        return (index + (attempt * (attempt + 1) >> 1)) & self._mask
 
-    def _find_slot(self, key: Any, for_insertion: bool = False) -> Tuple[int, bool]:
+    def _find_slot(
+        self, key: Any, for_insertion: bool = False
+    ) -> Tuple[int, bool, int]:
         """
         Find the appropriate slot for a key.
 
+        Walks the triangular probe sequence incrementally: the i-th step
+        advances by i slots, which adds up to i(i+1)/2 from the home slot.
+
         Returns:
-            (slot_index, found_existing_key)
+            (slot_index, found_existing_key, probe_length) where probe_length
+            is the number of slots a lookup visits to reach slot_index
         """
-        index = self._hash(key)
+        if self._mask_hash:
+            slot = hash(key) & self._mask
+        else:
+            slot = self.hash_function(key, self.size)
+        mask = self._mask
+        keys = self._keys
+        state = self._state
         deleted_slot = -1
-
-        for attempt in range(self.size):
-            slot_idx = self._probe_linear(index, attempt)
-            entry = self.table[slot_idx]
-
-            if entry.is_empty:
-                # Found empty slot
-                return (
-                    deleted_slot if deleted_slot != -1 and for_insertion else slot_idx
-                ), False
-            elif entry.is_deleted:
+        deleted_probes = 0
+
+        for probes in range(1, self.size + 1):
+            slot_state = state[slot]
+            if slot_state == self.EMPTY:
+                # Found empty slot; prefer an earlier tombstone for insertion
+                if for_insertion and deleted_slot != -1:
+                    return deleted_slot, False, deleted_probes
+                return slot, False, probes
+            if slot_state == self.OCCUPIED:
+                stored = keys[slot]
+                if stored is key or stored == key:
+                    # Found existing key
+                    return slot, True, probes
+            elif for_insertion and deleted_slot == -1:
                 # Remember first deleted slot for insertion
-                if deleted_slot == -1 and for_insertion:
-                    deleted_slot = slot_idx
-            elif entry.key == key:
-                # Found existing key
-                return slot_idx, True
+                deleted_slot, deleted_probes = slot, probes
+            slot = (slot + probes) & mask
+
+        if deleted_slot != -1:
+            return deleted_slot, False, deleted_probes
 
         # Table is full (shouldn't happen if we resize properly)
         raise Exception("Hash table probe sequence exhausted")
 
     def _resize(self, new_size: int) -> None:
         """Resize the hash table."""
-        old_table = self.table
+        assert new_size & (new_size - 1) == 0, "table size must be a power of two"
+        old_keys = self._keys
+        old_values = self._values
+        old_state = self._state
         self.size = new_size
-        self.table = [HashTableOpenAddressing.Entry() for _ in range(new_size)]
-        self.count = 0
+        self._mask = mask = new_size - 1
+        self._keys = self._new_keys(new_size)
+        self._values = [None] * new_size
+        self._state = bytearray(new_size)
         self.deleted_count = 0
+        total_probes = 0
 
-        # Reinsert all non-deleted entries
-        for entry in old_table:
-            if not entry.is_empty and not entry.is_deleted:
-                self.put(entry.key, entry.value)
+        # Reinsert all non-deleted entries directly: keys are unique and the
+        # new table has no tombstones, so each one goes into the first empty
+        # slot of its probe sequence and count stays the same
+        keys = self._keys
+        values = self._values
+        state = self._state
+        hash_function = self.hash_function
+        mask_hash = self._mask_hash
+        for slot_idx, slot_state in enumerate(old_state):
+            if slot_state == self.OCCUPIED:
+                key = old_keys[slot_idx]
+                target = hash(key) & mask if mask_hash else hash_function(key, new_size)
+                probes = 1
+                while state[target]:
+                    target = (target + probes) & mask
+                    probes += 1
+                keys[target] = key
+                values[target] = old_values[slot_idx]
+                state[target] = self.OCCUPIED
+                total_probes += probes
+
+        self._total_probes = total_probes
 
     def put(self, key: Any, value: Any) -> None:
         """Insert or update a key-value pair."""
         if (self.count + self.deleted_count) / self.size > self.load_factor_threshold:
             self._resize(self.size * 2)
 
-        slot_idx, found = self._find_slot(key, for_insertion=True)
+        slot_idx, found, probes = self._find_slot(key, for_insertion=True)
 
         if found:
             # Update existing key
-            self.table[slot_idx].value = value
+            self._values[slot_idx] = value
         else:
-            # Insert new key
-            if self.table[slot_idx].is_deleted:
+            # Insert new key (stored first: a packed key array rejects a
+            # key of the wrong type before anything else changes)
+            self._keys[slot_idx] = key
+            if self._state[slot_idx] == self.DELETED:
                 self.deleted_count -= 1
-            self.table[slot_idx] = HashTableOpenAddressing.Entry(key, value)
+            self._values[slot_idx] = value
+            self._state[slot_idx] = self.OCCUPIED
             self.count += 1
+            self._total_probes += probes
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow once so that ``capacity`` used slots fit under the threshold."""
+        new_size = self.size
+        while capacity / new_size > self.load_factor_threshold:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
+
+    def put_many(self, keys: Sequence[Any], values: Sequence[Any]) -> None:
+        """Insert or update many key-value pairs, growing at most once."""
+        self._reserve(self.count + self.deleted_count + len(keys))
+
+        put = self.put
+        for key, value in zip(keys, values):
+            put(key, value)
 
     def get(self, key: Any) -> Any:
         """Retrieve the value for a given key."""
-        slot_idx, found = self._find_slot(key)
+        slot_idx, found, _ = self._find_slot(key)
 
         if found:
-            return self.table[slot_idx].value
+            return self._values[slot_idx]
         else:
             raise KeyError(f"Key '{key}' not found")
 
     def remove(self, key: Any) -> Any:
         """Remove and return the value for a given key."""
-        slot_idx, found = self._find_slot(key)
+        slot_idx, found, probes = self._find_slot(key)
 
         if found:
-            entry = self.table[slot_idx]
-            removed_value = entry.value
-            entry.key = "__DELETED__"  # Mark as deleted
-            entry.value = None
+            removed_value = self._values[slot_idx]
+            self._keys[slot_idx] = self._vacant_key
+            self._values[slot_idx] = None
+            self._state[slot_idx] = self.DELETED  # Mark as deleted
             self.count -= 1
             self.deleted_count += 1
+            self._total_probes -= probes
             return removed_value
         else:
             raise KeyError(f"Key '{key}' not found")
 
+    def get_or(self, key: Any, default: Any = None) -> Any:
+        """Retrieve the value for a key, or ``default`` if it is absent."""
+        slot_idx, found, _ = self._find_slot(key)
+        return self._values[slot_idx] if found else default
+
     def contains(self, key: Any) -> bool:
         """Check if a key exists in the hash table."""
-        try:
-            self.get(key)
-            return True
-        except KeyError:
-            return False
+        # Ask _find_slot directly instead of raising KeyError via get()
+        return self._find_slot(key)[1]
+
+    def _occupied_mask(self) -> bytes:
+        """One byte per slot: 1 if occupied, else 0 (computed in C)."""
+        return self._state.translate(_OCCUPIED_MASK_TABLE)
 
     def keys(self) -> List[Any]:
         """Return all keys in the hash table."""
-        result = []
-        for entry in self.table:
-            if not entry.is_empty and not entry.is_deleted:
-                result.append(entry.key)
-        return result
+        return list(compress(self._keys, self._occupied_mask()))
 
     def values(self) -> List[Any]:
         """Return all values in the hash table."""
-        result = []
-        for entry in self.table:
-            if not entry.is_empty and not entry.is_deleted:
-                result.append(entry.value)
-        return result
+        return list(compress(self._values, self._occupied_mask()))
 
     def items(self) -> List[Tuple[Any, Any]]:
         """Return all key-value pairs."""
-        result = []
-        for entry in self.table:
-            if not entry.is_empty and not entry.is_deleted:
-                result.append((entry.key, entry.value))
-        return result
+        return list(compress(zip(self._keys, self._values), self._occupied_mask()))
 
     def get_load_factor(self) -> float:
         """Calculate the current load factor."""
         return self.count / self.size
 
     def get_probe_sequence_length(self, key: Any) -> int:
-        """Get the length of the probe sequence for a key."""
+        """Get the length of the probe sequence for a key.
+
+        Walks the sequence slot by slot, so it is meant for inspecting a
+        single key; get_avg_probe_length uses a running total instead.
+        """
         index = self._hash(key)
         probes = 0
 
+        state = self._state
+        keys = self._keys
+
         for attempt in range(self.size):
-            slot_idx = self._probe_linear(index, attempt)
-            entry = self.table[slot_idx]
+            slot_idx = self._probe_quadratic(index, attempt)
             probes += 1
 
-            if entry.is_empty:
+            slot_state = state[slot_idx]
+            if slot_state == self.EMPTY:
                 return probes
-            elif entry.key == key:
+            elif slot_state == self.OCCUPIED and keys[slot_idx] == key:
                 return probes
 
         return probes
 
     def get_avg_probe_length(self) -> float:
-        """Calculate average probe sequence length."""
+        """Calculate average probe sequence length in O(1).
+
+        put, remove and _resize keep ``_total_probes`` equal to the sum of
+        get_probe_sequence_length over all stored keys.
+        """
         if self.count == 0:
             return 0
 
-        total_probes = 0
-        for entry in self.table:
-            if not entry.is_empty and not entry.is_deleted:
-                total_probes += self.get_probe_sequence_length(entry.key)
-
-        return total_probes / self.count
+        return self._total_probes / self.count
 
     def __len__(self) -> int:
         """Return the number of key-value pairs."""
@@ -402,9 +843,419 @@ class HashTableOpenAddressing:
         return f"HashTableOpenAddressing(size={self.size}, count={self.count}, load_factor={self.get_load_factor():.2f})"
 
 
+class HashTableRobinHood(HashTableOpenAddressing):
+    """Open addressing with Robin Hood linear probing.
+
+    Each slot also records its entry's distance from its home slot in
+    ``_dist`` (-1 for an empty slot). An insert that meets an entry closer
+    to home than itself takes that slot and carries the displaced entry
+    onwards, which keeps probe lengths close to the mean. A lookup can stop
+    as soon as it passes a slot whose distance is smaller than its own, and
+    removal shifts the following entries back instead of leaving tombstones.
+    """
+
+    __slots__ = ("_dist",)
+
+    def __init__(
+        self,
+        initial_size: int = 16,
+        load_factor_threshold: float = 0.75,
+        hash_function: Callable[[Any, int], int] = HashFunction.division_hash,
+        key_type: Optional[str] = None,
+    ):
+        super().__init__(initial_size, load_factor_threshold, hash_function, key_type)
+        self._dist = array("i", [-1]) * self.size
+
+    def _find_slot(
+        self, key: Any, for_insertion: bool = False
+    ) -> Tuple[int, bool, int]:
+        """
+        Find the slot holding a key.
+
+        Returns:
+            (slot_index, found_existing_key, probe_length); slot_index is
+            only meaningful when the key was found
+        """
+        slot = self._hash(key)
+        mask = self._mask
+        keys = self._keys
+        dists = self._dist
+        dist = 0
+
+        # Stored distances are all below size, so within size steps dist
+        # passes the slot's distance and the loop ends, even on a full table
+        while True:
+            slot_dist = dists[slot]
+            if slot_dist < dist:
+                return slot, False, dist + 1
+            if slot_dist == dist:
+                stored = keys[slot]
+                if stored is key or stored == key:
+                    return slot, True, dist + 1
+            slot = (slot + 1) & mask
+            dist += 1
+
+    def _insert_new(self, key: Any, value: Any) -> None:
+        """Place a key known to be absent, displacing richer entries."""
+        if self.count >= self.size:
+            # No empty slot to end the carry; fail before displacing anything
+            raise Exception("Hash table probe sequence exhausted")
+
+        slot = self._hash(key)
+        mask = self._mask
+        keys = self._keys
+        values = self._values
+        dists = self._dist
+        dist = 0
+
+        while True:
+            slot_dist = dists[slot]
+            if slot_dist == -1:
+                keys[slot] = key
+                values[slot] = value
+                dists[slot] = dist
+                self._state[slot] = self.OCCUPIED
+                self._total_probes += dist + 1
+                return
+            if slot_dist < dist:
+                # Take from the rich: swap in and carry the resident onwards
+                keys[slot], key = key, keys[slot]
+                values[slot], value = value, values[slot]
+                self._total_probes += dist - slot_dist
+                dists[slot], dist = dist, slot_dist
+            slot = (slot + 1) & mask
+            dist += 1
+
+    def _resize(self, new_size: int) -> None:
+        """Resize the hash table."""
+        assert new_size & (new_size - 1) == 0, "table size must be a power of two"
+        old_items = self.items()
+        self.size = new_size
+        self._mask = new_size - 1
+        self._keys = self._new_keys(new_size)
+        self._values = [None] * new_size
+        self._state = bytearray(new_size)
+        self._dist = array("i", [-1]) * new_size
+        self._total_probes = 0
+
+        for key, value in old_items:
+            self._insert_new(key, value)
+
+    def put(self, key: Any, value: Any) -> None:
+        """Insert or update a key-value pair."""
+        if self.count / self.size > self.load_factor_threshold:
+            self._resize(self.size * 2)
+
+        slot_idx, found, _ = self._find_slot(key)
+        if found:
+            self._values[slot_idx] = value
+        else:
+            self._insert_new(key, value)
+            self.count += 1
+
+    def remove(self, key: Any) -> Any:
+        """Remove and return the value for a given key."""
+        slot_idx, found, probes = self._find_slot(key)
+        if not found:
+            raise KeyError(f"Key '{key}' not found")
+
+        removed_value = self._values[slot_idx]
+        self._total_probes -= probes
+        self.count -= 1
+
+        # Backward shift: pull each following displaced entry one slot
+        # closer to home until an empty slot or an entry already at home
+        mask = self._mask
+        keys = self._keys
+        values = self._values
+        dists = self._dist
+        next_slot = (slot_idx + 1) & mask
+        while dists[next_slot] > 0:
+            keys[slot_idx] = keys[next_slot]
+            values[slot_idx] = values[next_slot]
+            dists[slot_idx] = dists[next_slot] - 1
+            self._total_probes -= 1
+            slot_idx, next_slot = next_slot, (next_slot + 1) & mask
+
+        keys[slot_idx] = self._vacant_key
+        values[slot_idx] = None
+        dists[slot_idx] = -1
+        self._state[slot_idx] = self.EMPTY
+        return removed_value
+
+    def get_probe_sequence_length(self, key: Any) -> int:
+        """Get the length of the probe sequence for a key."""
+        return self._find_slot(key)[2]
+
+    def __str__(self) -> str:
+        """String representation of the hash table."""
+        return f"HashTableRobinHood(size={self.size}, count={self.count}, load_factor={self.get_load_factor():.2f})"
+
+
+class HashTableOpenAddressingInt:
+    """Open addressing hash table specialised for 64-bit integer keys.
+
+    Keys live in one flat int64 array in which two reserved values mark
+    empty and deleted slots, so there is no separate state array. The home
+    slot comes from Fibonacci hashing (the high bits of key * A_FIXED),
+    and collisions are resolved by linear probing.
+
+    With numba installed the key slots are a NumPy int64 array and probing,
+    rehashing and put_many run in JIT-compiled loops; otherwise they are an
+    ``array.array("q")`` probed in Python.
+
+    EMPTY_KEY and DELETED_KEY (the two smallest int64 values) cannot be
+    used as keys. Values may be any object.
+    """
+
+    EMPTY_KEY = _INT_EMPTY_KEY
+    DELETED_KEY = _INT_DELETED_KEY
+    MAX_KEY = (1 << 63) - 1
+
+    __slots__ = (
+        "size",
+        "_shift",
+        "_keys",
+        "_values",
+        "count",
+        "deleted_count",
+        "load_factor_threshold",
+    )
+
+    def __init__(self, initial_size: int = 16, load_factor_threshold: float = 0.75):
+        # At least two slots: the home slot shift must stay below 64
+        self.size = _next_power_of_two(max(initial_size, 2))
+        self._shift = 65 - self.size.bit_length()  # keep the top log2(size) bits
+        self._keys = self._new_keys(self.size)
+        self._values: List[Any] = [None] * self.size
+        self.count = 0
+        self.deleted_count = 0
+        self.load_factor_threshold = load_factor_threshold
+
+    def _new_keys(self, size: int) -> Union["np.ndarray", array]:
+        """Key slot array for ``size`` slots, all EMPTY_KEY."""
+        if _int_find_slot_nb is not None:
+            return np.full(size, self.EMPTY_KEY, dtype=np.int64)
+        return array("q", [self.EMPTY_KEY]) * size
+
+    def _hash(self, key: int) -> int:
+        """Home slot of a key (Fibonacci hashing)."""
+        return ((key * _A_FIXED) & _MASK64) >> self._shift
+
+    def _check_key(self, key: int) -> int:
+        """Return key as an int, rejecting markers and non-int64 values."""
+        key = operator.index(key)
+        if not self.DELETED_KEY < key <= self.MAX_KEY:
+            raise ValueError(f"Key {key} is reserved or outside the int64 range")
+        return key
+
+    def _find_slot(self, key: int) -> Tuple[int, bool]:
+        """
+        Find the slot holding a key, or the slot to insert it into.
+
+        Returns:
+            (slot_index, found_existing_key)
+        """
+        key = self._check_key(key)
+
+        if _int_find_slot_nb is not None:
+            code = _int_find_slot_nb(self._keys, key, self._shift)
+            if code >= 0:
+                return code, True
+            slot = ~code
+            if slot == self.size:
+                raise Exception("Hash table probe sequence exhausted")
+            return slot, False
+
+        slot = ((key * _A_FIXED) & _MASK64) >> self._shift
+        mask = self.size - 1
+        keys = self._keys
+        empty_key = self.EMPTY_KEY
+        deleted_key = self.DELETED_KEY
+        deleted_slot = -1
+
+        for _ in range(self.size):
+            stored = keys[slot]
+            if stored == key:
+                # Markers never equal a real key, so a match is always live
+                return slot, True
+            if stored == empty_key:
+                # Prefer an earlier tombstone for insertion
+                return (deleted_slot if deleted_slot != -1 else slot), False
+            if stored == deleted_key and deleted_slot == -1:
+                deleted_slot = slot
+            slot = (slot + 1) & mask
+
+        if deleted_slot != -1:
+            return deleted_slot, False
+
+        # Table is full (shouldn't happen if we resize properly)
+        raise Exception("Hash table probe sequence exhausted")
+
+    def _resize(self, new_size: int) -> None:
+        """Resize the hash table."""
+        assert new_size & (new_size - 1) == 0, "table size must be a power of two"
+        old_keys = self._keys
+        old_values = self._values
+        self.size = new_size
+        self._shift = 65 - new_size.bit_length()
+        self._keys = keys = self._new_keys(new_size)
+        self._values = values = [None] * new_size
+        self.deleted_count = 0
+
+        if _int_rehash_nb is not None:
+            targets = _int_rehash_nb(old_keys, keys, self._shift).tolist()
+            for target, value in zip(targets, old_values):
+                if target >= 0:
+                    values[target] = value
+            return
+
+        # Keys are unique and the new table has no tombstones, so each key
+        # goes into the first empty slot of its probe run
+        mask = new_size - 1
+        empty_key = self.EMPTY_KEY
+        hash_key = self._hash
+        for key, value in zip(old_keys, old_values):
+            if key > self.DELETED_KEY:
+                target = hash_key(key)
+                while keys[target] != empty_key:
+                    target = (target + 1) & mask
+                keys[target] = key
+                values[target] = value
+
+    def put(self, key: int, value: Any) -> None:
+        """Insert or update a key-value pair."""
+        if (self.count + self.deleted_count) / self.size > self.load_factor_threshold:
+            self._resize(self.size * 2)
+
+        if _int_insert_nb is not None:
+            code = _int_insert_nb(self._keys, self._check_key(key), self._shift)
+            if code == -1:
+                raise Exception("Hash table probe sequence exhausted")
+            if code >= self.size:
+                self.count += 1
+                if code >= 2 * self.size:
+                    self.deleted_count -= 1
+                code %= self.size
+            self._values[code] = value
+            return
+
+        slot_idx, found = self._find_slot(key)
+
+        if not found:
+            if self._keys[slot_idx] == self.DELETED_KEY:
+                self.deleted_count -= 1
+            self._keys[slot_idx] = key
+            self.count += 1
+        self._values[slot_idx] = value
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow once so that ``capacity`` used slots fit under the threshold."""
+        new_size = self.size
+        while capacity / new_size > self.load_factor_threshold:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
+
+    def put_many(self, keys: Sequence[int], values: Sequence[Any]) -> None:
+        """Insert or update many key-value pairs, growing at most once."""
+        # Packing checks every key is an int64 before anything is stored
+        batch = array("q", keys[: len(values)])
+        if any(key <= self.DELETED_KEY for key in batch):
+            raise ValueError("Batch contains a reserved key")
+        self._reserve(self.count + self.deleted_count + len(batch))
+
+        if _int_put_many_nb is None:
+            put = self.put
+            for key, value in zip(batch, values):
+                put(key, value)
+            return
+
+        slots, inserted, reused = _int_put_many_nb(
+            self._keys, np.frombuffer(batch, dtype=np.int64), self._shift
+        )
+        self.count += inserted
+        self.deleted_count -= reused
+        stored = self._values
+        for slot, value in zip(slots.tolist(), values):
+            if slot == -1:
+                raise Exception("Hash table probe sequence exhausted")
+            stored[slot] = value
+
+    def get(self, key: int) -> Any:
+        """Retrieve the value for a given key."""
+        if _int_find_slot_nb is not None:
+            slot_idx = _int_find_slot_nb(self._keys, self._check_key(key), self._shift)
+            found = slot_idx >= 0
+        else:
+            slot_idx, found = self._find_slot(key)
+
+        if found:
+            return self._values[slot_idx]
+        raise KeyError(f"Key '{key}' not found")
+
+    def get_or(self, key: int, default: Any = None) -> Any:
+        """Retrieve the value for a key, or ``default`` if it is absent."""
+        if _int_find_slot_nb is not None:
+            slot_idx = _int_find_slot_nb(self._keys, self._check_key(key), self._shift)
+            return self._values[slot_idx] if slot_idx >= 0 else default
+        slot_idx, found = self._find_slot(key)
+        return self._values[slot_idx] if found else default
+
+    def remove(self, key: int) -> Any:
+        """Remove and return the value for a given key."""
+        slot_idx, found = self._find_slot(key)
+
+        if found:
+            removed_value = self._values[slot_idx]
+            self._keys[slot_idx] = self.DELETED_KEY  # Mark as deleted
+            self._values[slot_idx] = None
+            self.count -= 1
+            self.deleted_count += 1
+            return removed_value
+        raise KeyError(f"Key '{key}' not found")
+
+    def contains(self, key: int) -> bool:
+        """Check if a key exists in the hash table."""
+        return self._find_slot(key)[1]
+
+    def _occupied_mask(self, keys: List[int]) -> Iterator[bool]:
+        """True for each slot of ``keys`` holding a live key (computed in C)."""
+        return map(self.DELETED_KEY.__lt__, keys)
+
+    def keys(self) -> List[int]:
+        """Return all keys in the hash table."""
+        keys = self._keys.tolist()
+        return list(compress(keys, self._occupied_mask(keys)))
+
+    def values(self) -> List[Any]:
+        """Return all values in the hash table."""
+        mask = self._occupied_mask(self._keys.tolist())
+        return list(compress(self._values, mask))
+
+    def items(self) -> List[Tuple[int, Any]]:
+        """Return all key-value pairs."""
+        keys = self._keys.tolist()
+        return list(compress(zip(keys, self._values), self._occupied_mask(keys)))
+
+    def get_load_factor(self) -> float:
+        """Calculate the current load factor."""
+        return self.count / self.size
+
+    def __len__(self) -> int:
+        """Return the number of key-value pairs."""
+        return self.count
+
+    def __str__(self) -> str:
+        """String representation of the hash table."""
+        return f"HashTableOpenAddressingInt(size={self.size}, count={self.count}, load_factor={self.get_load_factor():.2f})"
+
+
 class HashTableSet:
     """Hash set implementation using hash table for fast membership testing."""
 
+    __slots__ = ("hash_table",)
+
     def __init__(self, initial_size: int = 16):
         self.hash_table = HashTableSeparateChaining(initial_size)
 
@@ -420,6 +1271,12 @@ class HashTableSet:
         """Check if item is in the set."""
         return self.hash_table.contains(item)
 
+    def contains_many(self, items: Iterable[Any]) -> List[bool]:
+        """Check membership of many items at once (one flag per item)."""
+        # map() drives the bound membership test from C, avoiding a
+        # Python-level call through contains() for every item
+        return list(map(self.hash_table.contains, items))
+
     def size(self) -> int:
         """Return the number of items in the set."""
         return len(self.hash_table)
@@ -428,30 +1285,32 @@ class HashTableSet:
         """Return all items in the set."""
         return self.hash_table.keys()
 
-    def union(self, other: "HashTableSet") -> "HashTableSet":
-        """Return the union of this set with another."""
+    @staticmethod
+    def _from_items(items: List[Any]) -> "HashTableSet":
+        """New set holding ``items``, inserted in one put_many batch."""
         result = HashTableSet()
-        for item in self.items():
-            result.add(item)
-        for item in other.items():
-            result.add(item)
+        result.hash_table.put_many(items, [True] * len(items))
         return result
 
+    def union(self, other: "HashTableSet") -> "HashTableSet":
+        """Return the union of this set with another."""
+        # put_many sizes the table once and skips keys already present
+        return HashTableSet._from_items(self.items() + other.items())
+
     def intersection(self, other: "HashTableSet") -> "HashTableSet":
         """Return the intersection of this set with another."""
-        result = HashTableSet()
-        for item in self.items():
-            if other.contains(item):
-                result.add(item)
-        return result
+        # Filter the smaller set against the larger one; filter() drives the
+        # membership probes from C
+        smaller, larger = (self, other) if self.size() <= other.size() else (other, self)
+        return HashTableSet._from_items(
+            list(filter(larger.hash_table.contains, smaller.hash_table.iter_keys()))
+        )
 
     def difference(self, other: "HashTableSet") -> "HashTableSet":
         """Return the difference of this set with another."""
-        result = HashTableSet()
-        for item in self.items():
-            if not other.contains(item):
-                result.add(item)
-        return result
+        return HashTableSet._from_items(
+            list(filterfalse(other.hash_table.contains, self.hash_table.iter_keys()))
+        )
 
 
 class HashTableAnalysis:
@@ -464,47 +1323,100 @@ class HashTableAnalysis:
         """
         Test how well a hash function distributes keys.
 
+        For benchmarking string keys, build hash_func on the C-backed
+        HashFunction.fast_string_hash or xxh3_hash rather than the
+        Python-level djb2_hash/fnv1a_hash.
+
         Returns:
             Dictionary mapping hash values to count of keys
         """
-        distribution = {}
-        for key in keys:
-            hash_val = hash_func(key, table_size)
-            distribution[hash_val] = distribution.get(hash_val, 0) + 1
-
-        return distribution
+        hashes = map(hash_func, keys, repeat(table_size))
+        if np is not None and keys:
+            # Tally with one bincount over an int64 slot array; hashes
+            # outside [0, table_size) fall through to Counter
+            slots = np.fromiter(hashes, dtype=np.int64, count=len(keys))
+            if slots.min() >= 0 and slots.max() < table_size:
+                counts = np.bincount(slots)
+                occupied = np.flatnonzero(counts)
+                return dict(zip(occupied.tolist(), counts[occupied].tolist()))
+            hashes = slots.tolist()
+
+        # Counter tallies the mapped hashes in C instead of a dict.get loop
+        return dict(Counter(hashes))
 
     @staticmethod
     def calculate_distribution_uniformity(
-        distribution: Dict[int, int], table_size: int
+        distribution: Union[Dict[int, int], Sequence[int]], table_size: int
     ) -> float:
         """
         Calculate how uniform a hash distribution is.
 
+        ``distribution`` is either the dict returned by
+        test_hash_function_distribution or a per-slot count sequence such
+        as the output of ``numpy.bincount``.
+
         Returns:
             Uniformity score (0 = perfectly uniform, higher = less uniform)
         """
-        if not distribution:
-            return 0
+        if isinstance(distribution, dict):
+            counts = distribution.values()
+        elif (
+            np is not None
+            and isinstance(distribution, np.ndarray)
+            and distribution.dtype.kind in "iu"
+        ):
+            # Reduce in C. sum(c²) <= max(c) * N, so int64 is exact unless
+            # that bound overflows; object dtype keeps Python ints otherwise
+            counts = distribution.astype(np.int64)
+            total = int(counts.sum())
+            if total == 0:
+                return 0
+            if int(counts.max()) * total >= 1 << 63:
+                counts = counts.astype(object)
+            sum_squares = int(counts.dot(counts))
+            return (table_size * sum_squares - total * total) / (table_size * table_size)
+        else:
+            counts = distribution
 
-        expected_count = sum(distribution.values()) / table_size
-        variance = sum((count - expected_count) ** 2 for count in distribution.values())
-        variance += expected_count**2 * (table_size - len(distribution))  # Empty slots
+        # Sum of squared deviations from the mean over all table_size slots
+        # (empty slots included) reduces to sum(c²) - N²/m; kept in integers
+        # until the final division so a uniform spread scores exactly 0
+        total = int(sum(counts))
+        if total == 0:
+            return 0
+        sum_squares = int(sum(map(operator.mul, counts, counts)))
 
-        return variance / table_size
+        return (table_size * sum_squares - total * total) / (table_size * table_size)
 
     @staticmethod
     def benchmark_hash_table_operations(
-        hash_table_class, operations: List[Tuple[str, Any, Any]], initial_size: int = 16
+        hash_table_class,
+        operations: List[Tuple[str, Any, Any]],
+        initial_size: int = 16,
+        key_gen: str = "str",
     ) -> Dict[str, float]:
         """
         Benchmark hash table operations.
 
         operations: List of (operation_type, key, value) tuples
                    operation_type: "put", "get", "remove"
+        key_gen: "str" runs the operations with their own keys; "int"
+                 replaces each distinct key with a small integer first, so
+                 the timings exclude string hashing and comparison
         """
         import time
 
+        if key_gen == "int":
+            # Same operation sequence, keys renumbered 0, 1, 2, ... in
+            # order of first appearance (hash(i) == i for small ints)
+            key_ids: Dict[Any, int] = {}
+            operations = [
+                (op, key_ids.setdefault(key, len(key_ids)), val)
+                for op, key, val in operations
+            ]
+        elif key_gen != "str":
+            raise ValueError(f"Unsupported key_gen: {key_gen!r}")
+
         ht = hash_table_class(initial_size)
         results = {}
 
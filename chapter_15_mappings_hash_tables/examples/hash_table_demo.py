@@ -59,7 +59,7 @@ def demonstrate_collision_resolution():
 
     # Open addressing
     addressing_ht = HashTableOpenAddressing(initial_size=4)
-    print("\n2. Open Addressing (Linear Probing):")
+    print("\n2. Open Addressing (Quadratic Probing):")
     print("   Collisions resolved by finding next empty slot")
 
     for key, value in items:
@@ -281,7 +281,9 @@ def visualize_hash_table_structure():
     for i in range(ht.size):
         bucket = ht.table[i]
         if bucket:
-            items_str = ", ".join(f"({entry.key}: {entry.value})" for entry in bucket)
+            items_str = ", ".join(
+                f"({key}: {value})" for key, value in zip(bucket, ht.value_table[i])
+            )
             print("5d")
         else:
             print("5d")
@@ -5,6 +5,7 @@ Tests for Chapter 13: Hash Tables - Efficient Key-Value Storage
 import unittest
 import random
 import string
+from array import array
 from typing import List
 
 # Add the code directory to the path
@@ -14,9 +15,13 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "code"))
 
 from hash_table_implementations import (
+    np,
+    xxhash,
     HashFunction,
     HashTableSeparateChaining,
     HashTableOpenAddressing,
+    HashTableOpenAddressingInt,
+    HashTableRobinHood,
     HashTableSet,
     HashTableAnalysis,
 )
@@ -27,21 +32,30 @@ class TestHashFunctions(unittest.TestCase):
 
     def test_division_hash(self):
         """Test division hash function."""
-        table_size = 10
-
-        # Test basic functionality
-        self.assertEqual(
-            HashFunction.division_hash("test", table_size), hash("test") % table_size
-        )
-        self.assertEqual(
-            HashFunction.division_hash(42, table_size), hash(42) % table_size
-        )
-
-        # Test range
-        for key in ["a", "b", "c", 1, 2, 3]:
-            hash_val = HashFunction.division_hash(key, table_size)
-            self.assertGreaterEqual(hash_val, 0)
-            self.assertLess(hash_val, table_size)
+        # 16 takes the power-of-two mask path, 10 the modulo path
+        for table_size in (16, 10):
+            # Test basic functionality
+            self.assertEqual(
+                HashFunction.division_hash("test", table_size),
+                hash("test") % table_size,
+            )
+            self.assertEqual(
+                HashFunction.division_hash(42, table_size), hash(42) % table_size
+            )
+            self.assertEqual(
+                HashFunction.division_hash(-7, table_size), hash(-7) % table_size
+            )
+
+            # Test range
+            for key in ["a", "b", "c", 1, 2, 3]:
+                hash_val = HashFunction.division_hash(key, table_size)
+                self.assertGreaterEqual(hash_val, 0)
+                self.assertLess(hash_val, table_size)
+
+        # Non-positive sizes skip the mask and behave like plain modulo
+        with self.assertRaises(ZeroDivisionError):
+            HashFunction.division_hash("abc", 0)
+        self.assertEqual(HashFunction.division_hash(5, -4), 5 % -4)
 
     def test_multiplication_hash(self):
         """Test multiplication hash function."""
@@ -94,6 +108,45 @@ class TestHashFunctions(unittest.TestCase):
             HashFunction.fnv1a_hash(test_string), HashFunction.fnv1a_hash(test_string)
         )
 
+    def test_string_hash_reference_values(self):
+        """Test DJB2/FNV-1a against the byte-at-a-time definitions."""
+        mask = (1 << 64) - 1
+        for text in ["", "a", "hello world", "ключ", "x" * 37]:
+            djb2 = 5381
+            fnv = 14695981039346656037
+            for byte in text.encode("utf-8"):
+                djb2 = (djb2 * 33 + byte) & mask
+                fnv = ((fnv ^ byte) * 1099511628211) & mask
+            self.assertEqual(HashFunction.djb2_hash(text), djb2)
+            self.assertEqual(HashFunction.fnv1a_hash(text), fnv)
+
+            # Pre-encoded keys hash the same as their str form
+            encoded = text.encode("utf-8")
+            self.assertEqual(HashFunction.djb2_hash(encoded), djb2)
+            self.assertEqual(HashFunction.fnv1a_hash(encoded), fnv)
+
+    def test_fast_string_hash(self):
+        """Test C-backed string hash functions."""
+        self.assertEqual(HashFunction.fast_string_hash("hello"), hash("hello"))
+
+    @unittest.skipUnless(xxhash, "xxhash not installed")
+    def test_xxh3_hash(self):
+        """Test XXH3 hash when xxhash is available."""
+        self.assertEqual(
+            HashFunction.xxh3_hash("hello"), HashFunction.xxh3_hash("hello")
+        )
+
+    def test_custom_table_hash_function(self):
+        """Test hash tables with a caller-supplied hash function."""
+        def string_hash(key, table_size):
+            return HashFunction.fast_string_hash(key) % table_size
+
+        for cls in (HashTableSeparateChaining, HashTableOpenAddressing):
+            ht = cls(hash_function=string_hash)
+            ht.put("key1", "value1")
+            self.assertIs(ht.hash_function, string_hash)
+            self.assertEqual(ht.get("key1"), "value1")
+
 
 class TestHashTableSeparateChaining(unittest.TestCase):
     """Test cases for separate chaining hash table."""
@@ -166,6 +219,27 @@ class TestHashTableSeparateChaining(unittest.TestCase):
         self.assertTrue(self.ht.contains("key1"))
         self.assertFalse(self.ht.contains("nonexistent"))
 
+    def test_prehashed_lookup(self):
+        """Test lookups with a hash computed once up front."""
+        key_hash = hash("key1")
+        self.ht.put("key1", "value1")
+
+        self.assertEqual(self.ht._get_by_prehash("key1", key_hash), "value1")
+        self.ht.put("key1", "updated")
+        self.assertEqual(self.ht._get_by_prehash("key1", key_hash), "updated")
+
+        self.ht.remove("key1")
+        with self.assertRaises(KeyError):
+            self.ht._get_by_prehash("key1", key_hash)
+
+    def test_get_or(self):
+        """Test get_or returns the default for missing keys."""
+        self.ht.put("key1", "value1")
+
+        self.assertEqual(self.ht.get_or("key1"), "value1")
+        self.assertIsNone(self.ht.get_or("nonexistent"))
+        self.assertEqual(self.ht.get_or("nonexistent", 0), 0)
+
     def test_keys_values_items(self):
         """Test keys, values, and items methods."""
         test_data = [("a", 1), ("b", 2), ("c", 3)]
@@ -176,32 +250,41 @@ class TestHashTableSeparateChaining(unittest.TestCase):
         values = self.ht.values()
         items = self.ht.items()
 
-        # All keys should be present
-        for key, _ in test_data:
-            self.assertIn(key, keys)
+        # Exactly the inserted keys, values and items, each once
+        self.assertEqual(len(items), len(test_data))
+        self.assertEqual(set(keys), {key for key, _ in test_data})
+        self.assertEqual(set(values), {value for _, value in test_data})
+        self.assertEqual(set(items), set(test_data))
 
-        # All values should be present
-        for _, value in test_data:
-            self.assertIn(value, values)
+    def test_iter_items(self):
+        """Test the lazy iterators match the list methods."""
+        for i in range(50):
+            self.ht.put(f"key{i}", i)
 
-        # All items should be present
-        for item in test_data:
-            self.assertIn(item, items)
+        self.assertEqual(list(self.ht.iter_keys()), self.ht.keys())
+        self.assertEqual(list(self.ht.iter_values()), self.ht.values())
+        self.assertEqual(list(self.ht.iter_items()), self.ht.items())
+        for key, value in self.ht.iter_items():
+            self.assertEqual(key, f"key{value}")
 
     def test_resize(self):
-        """Test automatic resizing."""
+        """Test automatic resizing happens exactly past the load threshold."""
         initial_size = self.ht.size
-
-        # Add enough items to trigger resize
-        for i in range(20):  # More than initial_size * load_factor_threshold
-            self.ht.put(f"key{i}", f"value{i}")
-
-        # Size should have increased
-        self.assertGreater(self.ht.size, initial_size)
-
-        # All items should still be accessible
-        for i in range(20):
-            self.assertEqual(self.ht.get(f"key{i}"), f"value{i}")
+        threshold = self.ht.load_factor_threshold
+
+        # Insert until the table grows
+        inserted = 0
+        while self.ht.size == initial_size:
+            self.ht.put(f"key{inserted}", f"value{inserted}")
+            inserted += 1
+
+        # put grows the table before inserting once the existing entries
+        # exceed the threshold, so the triggering put is the first one to
+        # start above it
+        self.assertGreater((inserted - 1) / initial_size, threshold)
+        self.assertLessEqual((inserted - 2) / initial_size, threshold)
+        self.assertEqual(self.ht.size, initial_size * 2)
+        self.assertEqual(len(self.ht), inserted)
 
     def test_collision_handling(self):
         """Test collision handling."""
@@ -236,13 +319,37 @@ class TestHashTableSeparateChaining(unittest.TestCase):
         self.assertEqual(self.ht.get_load_factor(), load_factor)
         self.assertGreaterEqual(self.ht.get_max_chain_length(), 1)
 
+    def test_typed_keys(self):
+        """Test packed array buckets for numeric key types."""
+        int_ht = HashTableSeparateChaining(initial_size=4, key_type="int")
+        for i in range(50):
+            int_ht.put(i * 7, f"value{i}")
+        int_ht.put(14, "updated")
+        self.assertEqual(len(int_ht), 50)
+        self.assertEqual(int_ht.get(14), "updated")
+        self.assertEqual(int_ht.remove(21), "value3")
+        self.assertFalse(int_ht.contains(21))
+
+        float_ht = HashTableSeparateChaining(key_type="float")
+        float_ht.put(1.5, "a")
+        self.assertEqual(float_ht.get(1.5), "a")
+
+        # Keys of the wrong type cannot be stored in a packed bucket
+        with self.assertRaises(TypeError):
+            int_ht.put("key", "value")
+
+        with self.assertRaises(ValueError):
+            HashTableSeparateChaining(key_type="str")
+
 
 class TestHashTableOpenAddressing(unittest.TestCase):
     """Test cases for open addressing hash table."""
 
+    table_class = HashTableOpenAddressing
+
     def setUp(self):
         """Set up test hash table."""
-        self.ht = HashTableOpenAddressing(initial_size=16)
+        self.ht = self.table_class(initial_size=16)
 
     def test_empty_hash_table(self):
         """Test operations on empty hash table."""
@@ -299,24 +406,28 @@ class TestHashTableOpenAddressing(unittest.TestCase):
         self.assertEqual(len(self.ht), 1)
 
     def test_resize(self):
-        """Test automatic resizing."""
+        """Test automatic resizing happens exactly past the load threshold."""
         initial_size = self.ht.size
-
-        # Add enough items to trigger resize
-        for i in range(15):  # More than initial_size * load_factor_threshold
-            self.ht.put(f"key{i}", f"value{i}")
-
-        # Size should have increased
-        self.assertGreater(self.ht.size, initial_size)
-
-        # All items should still be accessible
-        for i in range(15):
-            self.assertEqual(self.ht.get(f"key{i}"), f"value{i}")
+        threshold = self.ht.load_factor_threshold
+
+        # Insert until the table grows
+        inserted = 0
+        while self.ht.size == initial_size:
+            self.ht.put(f"key{inserted}", f"value{inserted}")
+            inserted += 1
+
+        # put grows the table before inserting once the existing entries
+        # exceed the threshold, so the triggering put is the first one to
+        # start above it
+        self.assertGreater((inserted - 1) / initial_size, threshold)
+        self.assertLessEqual((inserted - 2) / initial_size, threshold)
+        self.assertEqual(self.ht.size, initial_size * 2)
+        self.assertEqual(len(self.ht), inserted)
 
     def test_collision_handling(self):
-        """Test collision handling with linear probing."""
+        """Test collision handling with quadratic probing."""
         # Force collisions by using a small table
-        small_ht = HashTableOpenAddressing(initial_size=4)
+        small_ht = self.table_class(initial_size=4)
 
         # Add items that will cause collisions
         small_ht.put("a", 1)
@@ -330,6 +441,26 @@ class TestHashTableOpenAddressing(unittest.TestCase):
         self.assertEqual(small_ht.get("c"), 3)
         self.assertEqual(small_ht.get("d"), 4)
 
+    def test_typed_keys(self):
+        """Test packed key slots for numeric key types."""
+        int_ht = self.table_class(initial_size=4, key_type="int")
+        for i in range(50):
+            int_ht.put(i * 7, f"value{i}")
+        int_ht.put(14, "updated")
+        self.assertEqual(len(int_ht), 50)
+        self.assertEqual(int_ht.get(14), "updated")
+        self.assertEqual(int_ht.remove(21), "value3")
+        self.assertFalse(int_ht.contains(21))
+        self.assertEqual(sorted(int_ht.keys()), [i * 7 for i in range(50) if i != 3])
+
+        # Keys of the wrong type cannot be stored in a packed slot array
+        with self.assertRaises(TypeError):
+            int_ht.put("key", "value")
+        self.assertEqual(len(int_ht), 49)
+
+        with self.assertRaises(ValueError):
+            self.table_class(key_type="str")
+
     def test_probe_sequence_analysis(self):
         """Test probe sequence length calculations."""
         # Add some items
@@ -344,6 +475,189 @@ class TestHashTableOpenAddressing(unittest.TestCase):
         avg_probe = self.ht.get_avg_probe_length()
         self.assertGreaterEqual(avg_probe, 1.0)
 
+    def test_avg_probe_length_tracks_updates(self):
+        """Test the running probe total after inserts, removals and resizes."""
+        random.seed(7)
+        keys = [f"key{i}" for i in range(200)]
+        for key in keys:
+            self.ht.put(key, key)
+        for key in random.sample(keys, 80):
+            self.ht.remove(key)
+        for key in keys[:40]:
+            self.ht.put(key, key)
+
+        expected = sum(
+            self.ht.get_probe_sequence_length(key) for key in self.ht.keys()
+        ) / len(self.ht)
+        self.assertAlmostEqual(self.ht.get_avg_probe_length(), expected)
+
+
+    def test_full_table_raises(self):
+        """Test a threshold of 1.0 fails cleanly once every slot is used."""
+        ht = self.table_class(4, 1.0)
+        for i in range(4):
+            ht.put(i, i)
+
+        with self.assertRaisesRegex(Exception, "probe sequence exhausted"):
+            for i in range(4, 10):
+                ht.put(i, i)
+
+        self.assertEqual(len(ht), 4)
+        self.assertEqual([ht.get(i) for i in range(4)], [0, 1, 2, 3])
+
+
+class TestHashTableRobinHood(TestHashTableOpenAddressing):
+    """Run the open addressing tests against the Robin Hood variant."""
+
+    table_class = HashTableRobinHood
+
+    def test_robin_hood_invariant(self):
+        """Test slot distances stay exact and ordered through removals."""
+        random.seed(11)
+        for i in range(300):
+            self.ht.put(random.randint(0, 150), i)
+            if i % 3 == 0:
+                key = random.randint(0, 150)
+                if self.ht.contains(key):
+                    self.ht.remove(key)
+
+        mask = self.ht.size - 1
+        for slot in range(self.ht.size):
+            dist = self.ht._dist[slot]
+            if dist >= 0:
+                home = self.ht._hash(self.ht._keys[slot])
+                self.assertEqual(dist, (slot - home) & mask)
+                # A run never jumps by more than one step in distance
+                self.assertLessEqual(dist, self.ht._dist[(slot - 1) & mask] + 1)
+
+
+class TestHashTableOpenAddressingInt(unittest.TestCase):
+    """Test cases for the integer-key open addressing hash table."""
+
+    def setUp(self):
+        """Set up test hash table."""
+        self.ht = HashTableOpenAddressingInt(initial_size=16)
+
+    def test_empty_hash_table(self):
+        """Test operations on empty hash table."""
+        self.assertEqual(len(self.ht), 0)
+        self.assertEqual(self.ht.get_load_factor(), 0.0)
+
+        with self.assertRaises(KeyError):
+            self.ht.get(1)
+
+        with self.assertRaises(KeyError):
+            self.ht.remove(1)
+
+    def test_put_and_get(self):
+        """Test basic put and get operations."""
+        self.ht.put(1, "one")
+        self.ht.put(-5, "minus five")
+        self.ht.put(2**63 - 1, "max")
+
+        self.assertEqual(self.ht.get(1), "one")
+        self.assertEqual(self.ht.get(-5), "minus five")
+        self.assertEqual(self.ht.get(2**63 - 1), "max")
+        self.assertEqual(len(self.ht), 3)
+
+        # Updating keeps the count
+        self.ht.put(1, "uno")
+        self.assertEqual(self.ht.get(1), "uno")
+        self.assertEqual(len(self.ht), 3)
+
+    def test_remove(self):
+        """Test remove operation and slot reuse."""
+        self.ht.put(1, "one")
+        self.ht.put(2, "two")
+
+        self.assertEqual(self.ht.remove(1), "one")
+        self.assertFalse(self.ht.contains(1))
+        self.assertTrue(self.ht.contains(2))
+        self.assertEqual(len(self.ht), 1)
+
+        self.ht.put(1, "again")
+        self.assertEqual(self.ht.get(1), "again")
+        self.assertEqual(len(self.ht), 2)
+
+    def test_resize_and_collisions(self):
+        """Test many keys through resizes in a small table."""
+        small_ht = HashTableOpenAddressingInt(initial_size=2)
+        for i in range(500):
+            small_ht.put(i * 1024, i)
+
+        self.assertGreater(small_ht.size, 500)
+        for i in range(500):
+            self.assertEqual(small_ht.get(i * 1024), i)
+
+    def test_keys_values_items(self):
+        """Test keys, values, and items methods."""
+        test_data = {3: "c", 1: "a", 2: "b"}
+        for key, value in test_data.items():
+            self.ht.put(key, value)
+        self.ht.remove(2)
+        del test_data[2]
+
+        self.assertEqual(sorted(self.ht.keys()), sorted(test_data))
+        self.assertEqual(sorted(self.ht.values()), sorted(test_data.values()))
+        self.assertEqual(sorted(self.ht.items()), sorted(test_data.items()))
+
+    def test_reserved_keys(self):
+        """Test that the slot marker values are rejected as keys."""
+        reserved = (
+            HashTableOpenAddressingInt.EMPTY_KEY,
+            HashTableOpenAddressingInt.DELETED_KEY,
+        )
+        for key in reserved:
+            with self.assertRaises(ValueError):
+                self.ht.put(key, "marker")
+        with self.assertRaises(ValueError):
+            self.ht.put(2**63, "too big")
+
+    def test_get_or(self):
+        """Test get_or returns the value or the default."""
+        self.ht.put(4, "four")
+        self.assertEqual(self.ht.get_or(4), "four")
+        self.assertIsNone(self.ht.get_or(5))
+        self.assertEqual(self.ht.get_or(5, "missing"), "missing")
+
+    def test_put_many(self):
+        """Test bulk insert with updates, duplicates and reused tombstones."""
+        for i in range(10):
+            self.ht.put(i, "old")
+        for i in range(5):
+            self.ht.remove(i)
+
+        keys = list(range(-500, 500)) + [3, 3]
+        values = [str(key) for key in keys[:-1]] + ["last"]
+        self.ht.put_many(keys, values)
+
+        self.assertEqual(len(self.ht), 1000)
+        self.assertEqual(self.ht.get(3), "last")
+        for key in range(-500, 500):
+            if key != 3:
+                self.assertEqual(self.ht.get(key), str(key))
+
+    def test_put_many_rejects_reserved_keys(self):
+        """Test that a batch with a marker key stores nothing."""
+        self.ht.put(1, "one")
+        with self.assertRaises(ValueError):
+            self.ht.put_many([2, HashTableOpenAddressingInt.DELETED_KEY], "ab")
+        self.assertEqual(self.ht.items(), [(1, "one")])
+
+    def test_matches_dict(self):
+        """Test a random mix of operations against a dict."""
+        rng = random.Random(7)
+        expected = {}
+        for _ in range(3000):
+            key = rng.randrange(-200, 200) * 2**40
+            if rng.random() < 0.3 and key in expected:
+                self.assertEqual(self.ht.remove(key), expected.pop(key))
+            else:
+                self.ht.put(key, key // 3)
+                expected[key] = key // 3
+        self.assertEqual(len(self.ht), len(expected))
+        self.assertEqual(sorted(self.ht.items()), sorted(expected.items()))
+
 
 class TestHashTableSet(unittest.TestCase):
     """Test cases for hash set implementation."""
@@ -396,8 +710,8 @@ class TestHashTableSet(unittest.TestCase):
             self.set1.add(item)
 
         retrieved_items = self.set1.items()
-        for item in items:
-            self.assertIn(item, retrieved_items)
+        self.assertEqual(len(retrieved_items), len(items))
+        self.assertEqual(set(retrieved_items), set(items))
 
     def test_set_operations(self):
         """Test set operations."""
@@ -413,26 +727,21 @@ class TestHashTableSet(unittest.TestCase):
         # Union
         union_set = self.set1.union(self.set2)
         self.assertEqual(union_set.size(), 4)  # a, b, c, d
-        self.assertTrue(union_set.contains("a"))
-        self.assertTrue(union_set.contains("b"))
-        self.assertTrue(union_set.contains("c"))
-        self.assertTrue(union_set.contains("d"))
+        self.assertTrue(all(union_set.contains_many(["a", "b", "c", "d"])))
 
         # Intersection
         intersect_set = self.set1.intersection(self.set2)
         self.assertEqual(intersect_set.size(), 2)  # b, c
-        self.assertTrue(intersect_set.contains("b"))
-        self.assertTrue(intersect_set.contains("c"))
-        self.assertFalse(intersect_set.contains("a"))
-        self.assertFalse(intersect_set.contains("d"))
+        self.assertEqual(
+            intersect_set.contains_many(["a", "b", "c", "d"]),
+            [False, True, True, False],
+        )
 
         # Difference
         diff_set = self.set1.difference(self.set2)
         self.assertEqual(diff_set.size(), 1)  # a
         self.assertTrue(diff_set.contains("a"))
-        self.assertFalse(diff_set.contains("b"))
-        self.assertFalse(diff_set.contains("c"))
-        self.assertFalse(diff_set.contains("d"))
+        self.assertFalse(any(diff_set.contains_many(["b", "c", "d"])))
 
 
 class TestHashTableAnalysis(unittest.TestCase):
@@ -456,22 +765,67 @@ class TestHashTableAnalysis(unittest.TestCase):
         total_count = sum(distribution.values())
         self.assertEqual(total_count, len(keys))
 
+    def test_hash_distribution_counts(self):
+        """Test slot counts, including hashes outside the table range."""
+        keys = list(range(1000))
+        distribution = HashTableAnalysis.test_hash_function_distribution(
+            HashFunction.division_hash, keys, 7
+        )
+        expected = {slot: len(range(slot, 1000, 7)) for slot in range(7)}
+        self.assertEqual(distribution, expected)
+
+        # Unreduced hashes are tallied as they are
+        distribution = HashTableAnalysis.test_hash_function_distribution(
+            lambda key, size: key - 5, [1, 2, 2, 10], 4
+        )
+        self.assertEqual(distribution, {-4: 1, -3: 2, 5: 1})
+
+        self.assertEqual(
+            HashTableAnalysis.test_hash_function_distribution(
+                HashFunction.division_hash, [], 4
+            ),
+            {},
+        )
+
+    # Per-slot count fixtures, built once; packed arrays stand in for the
+    # numpy.bincount output the calculator also accepts
+    PERFECT_COUNTS = array("q", [1] * 10)
+    SKEWED_COUNTS = array("q", [5, 5] + [0] * 8)  # Only 2 slots used out of 10
+
     def test_distribution_uniformity(self):
         """Test distribution uniformity calculation."""
         # Perfectly uniform distribution
-        perfect_dist = {i: 1 for i in range(10)}
         uniformity = HashTableAnalysis.calculate_distribution_uniformity(
-            perfect_dist, 10
+            self.PERFECT_COUNTS, 10
         )
         self.assertEqual(uniformity, 0.0)
 
         # Non-uniform distribution
-        skewed_dist = {0: 5, 1: 5}  # Only 2 slots used out of 10
         uniformity = HashTableAnalysis.calculate_distribution_uniformity(
-            skewed_dist, 10
+            self.SKEWED_COUNTS, 10
         )
         self.assertGreater(uniformity, 0.0)
 
+        # The dict form from test_hash_function_distribution scores the same
+        self.assertEqual(
+            HashTableAnalysis.calculate_distribution_uniformity({0: 5, 1: 5}, 10),
+            uniformity,
+        )
+
+    @unittest.skipUnless(np is not None, "numpy is not installed")
+    def test_distribution_uniformity_numpy(self):
+        """Test that numpy.bincount counts score like the packed arrays."""
+        score = HashTableAnalysis.calculate_distribution_uniformity
+        self.assertEqual(score(np.bincount(np.arange(10)), 10), 0.0)
+        self.assertEqual(
+            score(np.bincount([0] * 5 + [1] * 5), 10), score(self.SKEWED_COUNTS, 10)
+        )
+        self.assertEqual(score(np.zeros(4, dtype=np.int64), 4), 0)
+
+        # Counts whose squares overflow int64 are still scored exactly
+        huge = [2**40, 0, 3]
+        self.assertEqual(score(np.array(huge), 3), score(huge, 3))
+
     def test_benchmark_operations(self):
         """Test benchmarking functionality."""
         operations = [
@@ -486,6 +840,13 @@ class TestHashTableAnalysis(unittest.TestCase):
             HashTableSeparateChaining, operations
         )
 
+        # Integer keys replay the same sequence and end in the same state
+        int_results = HashTableAnalysis.benchmark_hash_table_operations(
+            HashTableSeparateChaining, operations, key_gen="int"
+        )
+        self.assertEqual(results["final_size"], 1)
+        self.assertEqual(int_results["final_size"], 1)
+
         # Should have timing results
         self.assertIn("put_time", results)
         self.assertIn("get_time", results)
@@ -508,20 +869,27 @@ class TestHashTableAnalysis(unittest.TestCase):
 class TestHashTableStress(unittest.TestCase):
     """Stress tests for hash table implementations."""
 
-    def test_large_dataset_separate_chaining(self):
-        """Test separate chaining with larger dataset."""
-        ht = HashTableSeparateChaining(initial_size=16)
-
-        # Add many items
-        num_items = 1000
-        for i in range(num_items):
-            ht.put(f"key{i}", f"value{i}")
-
-        # Verify all items are accessible
-        for i in range(num_items):
-            self.assertEqual(ht.get(f"key{i}"), f"value{i}")
+    # (implementation, item count) pairs shared by the stress tests
+    IMPLEMENTATIONS = [
+        (HashTableSeparateChaining, 1000),
+        (HashTableOpenAddressing, 500),  # Smaller due to load factor limits
+        (HashTableRobinHood, 500),
+    ]
+
+    def _stress(self, cls, num_items):
+        """Insert, verify and partially remove num_items entries."""
+        ht = cls(initial_size=16)
+        ht.put_many(
+            [f"key{i}" for i in range(num_items)],
+            [f"value{i}" for i in range(num_items)],
+        )
 
-        # Verify size
+        # Verify all items are present, each exactly once
+        items = ht.items()
+        self.assertEqual(len(items), num_items)
+        self.assertEqual(
+            set(items), {(f"key{i}", f"value{i}") for i in range(num_items)}
+        )
         self.assertEqual(len(ht), num_items)
 
         # Test removal
@@ -529,27 +897,61 @@ class TestHashTableStress(unittest.TestCase):
             ht.remove(f"key{i}")
 
         self.assertEqual(len(ht), num_items // 2)
-
-    def test_large_dataset_open_addressing(self):
-        """Test open addressing with larger dataset."""
-        ht = HashTableOpenAddressing(initial_size=16)
-
-        # Add many items
-        num_items = 500  # Smaller due to load factor limits
-        for i in range(num_items):
-            ht.put(f"key{i}", f"value{i}")
-
-        # Verify all items are accessible
-        for i in range(num_items):
-            self.assertEqual(ht.get(f"key{i}"), f"value{i}")
-
-        # Verify size
-        self.assertEqual(len(ht), num_items)
+        self.assertEqual(ht.get("key1"), "value1")
+
+    def test_large_datasets(self):
+        """Test every implementation with a larger dataset."""
+        for cls, num_items in self.IMPLEMENTATIONS:
+            with self.subTest(cls=cls.__name__):
+                self._stress(cls, num_items)
+
+    @staticmethod
+    def _rand_keys(n, length=8, seed=0):
+        """n random lowercase keys; choices() draws each key in one C call."""
+        rng = random.Random(seed)
+        letters = string.ascii_lowercase
+        return ["".join(rng.choices(letters, k=length)) for _ in range(n)]
+
+    def test_random_key_stress(self):
+        """Test random keys, including repeats, against a dict."""
+        # Short keys from a small alphabet make repeats likely
+        keys = self._rand_keys(2000, length=3)
+        for cls, _ in self.IMPLEMENTATIONS:
+            with self.subTest(cls=cls.__name__):
+                ht = cls()
+                expected = {}
+                for i, key in enumerate(keys):
+                    ht.put(key, i)
+                    expected[key] = i
+                for key in keys[::3]:
+                    if key in expected:
+                        self.assertEqual(ht.remove(key), expected.pop(key))
+
+                self.assertEqual(len(ht), len(expected))
+                self.assertEqual(dict(ht.items()), expected)
+
+    def test_put_many_updates_existing_keys(self):
+        """Test put_many overwrites duplicates like repeated put calls."""
+        for cls in (HashTableSeparateChaining, HashTableOpenAddressing):
+            ht = cls(initial_size=4)
+            ht.put("a", 0)
+            ht.put_many(["a", "b", "c", "b"], [1, 2, 3, 4])
+
+            self.assertEqual(len(ht), 3)
+            self.assertEqual([ht.get(k) for k in "abc"], [1, 4, 3])
+            self.assertLessEqual(ht.get_load_factor(), ht.load_factor_threshold)
+
+    def test_put_many_partial_batch_keeps_count(self):
+        """Test a put_many that fails partway still counts what it stored."""
+        ht = HashTableSeparateChaining(key_type="int")
+        with self.assertRaises(TypeError):
+            ht.put_many([1, 2, "x", 3], [1, 2, 3, 4])
+
+        self.assertEqual(sorted(ht.items()), [(1, 1), (2, 2)])
+        self.assertEqual(len(ht), 2)
 
     def test_string_keys(self):
         """Test with string keys of various lengths."""
-        ht = HashTableSeparateChaining()
-
         test_strings = [
             "a",
             "hello",
@@ -559,13 +961,17 @@ class TestHashTableStress(unittest.TestCase):
             "another_string_key",
         ]
 
-        # Add strings
-        for i, s in enumerate(test_strings):
-            ht.put(s, i)
+        for cls, _ in self.IMPLEMENTATIONS:
+            with self.subTest(cls=cls.__name__):
+                ht = cls()
 
-        # Verify retrieval
-        for i, s in enumerate(test_strings):
-            self.assertEqual(ht.get(s), i)
+                # Add strings
+                for i, s in enumerate(test_strings):
+                    ht.put(s, i)
+
+                # Verify retrieval
+                for i, s in enumerate(test_strings):
+                    self.assertEqual(ht.get(s), i)
 
     def test_mixed_key_types(self):
         """Test with mixed key types."""